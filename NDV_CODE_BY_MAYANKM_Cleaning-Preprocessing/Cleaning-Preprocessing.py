@@ -1,16 +1,23 @@
 # Description:- Use Pandas and NumPy libraries in Python to clean and preprocess a real-world dataset such as Netflix .
 
 # Import Required Libraries
+import os
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# preprocessing.py (shared cleaning pipeline) lives at the repository root
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from preprocessing import Pipeline, Impute, DropMissing, Dedupe, ParseDates, Derive, Encode, state_path
+
 print("Libraries imported.")
 
 # Load the Dataset
+data_path = 'netflix_titles.csv'
 try:
-    df = pd.read_csv('netflix_titles.csv')
+    df = pd.read_csv(data_path)
     print("CSV file loaded successfully.")
     print(f"Type of df after loading: {type(df)}") # Check the type
 except FileNotFoundError:
@@ -45,33 +52,29 @@ if df is not None:
     print(df.duplicated().sum())
 else:
     print("\nCannot inspect dataset because df was not loaded successfully.")
-  # Handle Missing Values
-# Drop rows where 'director' or 'cast' is missing
-df.dropna(subset=['director', 'cast'], inplace=True)
-
-# Fill missing 'rating' with 'TV-MA'
-df['rating'].fillna('TV-MA', inplace=True)
-
-# Fill missing 'date_added' with 'Unknown'
-df['date_added'].fillna('Unknown', inplace=True)
-# Remove Duplicate Records
-df.drop_duplicates(inplace=True)
-# Convert Data Types
-# Convert 'release_year' to integer
-df['release_year'] = df['release_year'].astype(int)
-
-# Convert 'date_added' to datetime
-df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
-#  Feature Engineering
-# Extract year and month from 'date_added'
-df['added_year'] = df['date_added'].dt.year
-df['added_month'] = df['date_added'].dt.month
-
-# Extract duration in minutes
-df['duration_minutes'] = df['duration'].apply(lambda x: int(x.split()[0]) if isinstance(x, str) and x.split()[0].isdigit() else np.nan)
-
-# Create a 'Category' column based on 'type'
-df['Category'] = df['type'].map({'Movie': 'Movie', 'TV Show': 'TV Show'})
+# Cleaning and feature engineering as one pipeline. Its fitted state is saved next
+# to the data, in netflix_titles.cleaning_preprocessing.json, and reused by later
+# runs and new batches.
+cleaning = Pipeline([
+    # Handle Missing Values
+    # Drop rows where 'director' or 'cast' is missing
+    DropMissing(['director', 'cast']),
+    # Fill missing 'rating' with 'TV-MA' and missing 'date_added' with 'Unknown'
+    Impute(['rating'], strategy='constant', value='TV-MA'),
+    Impute(['date_added'], strategy='constant', value='Unknown'),
+    # Remove Duplicate Records
+    Dedupe(),
+    # Convert Data Types
+    Derive('release_year', lambda d: d['release_year'].astype(int)),
+    ParseDates(['date_added']),
+    # Feature Engineering: year and month added, duration in minutes, 'Category' from 'type'
+    Derive('added_year', lambda d: d['date_added'].dt.year),
+    Derive('added_month', lambda d: d['date_added'].dt.month),
+    Derive('duration_minutes', lambda d: d['duration'].apply(
+        lambda x: int(x.split()[0]) if isinstance(x, str) and x.split()[0].isdigit() else np.nan)),
+    Derive('Category', lambda d: d['type'].map({'Movie': 'Movie', 'TV Show': 'TV Show'})),
+], state_path=state_path(data_path, 'cleaning_preprocessing'))
+df = cleaning.process(df)
 # Data Filtering and Grouping
 # Filter movies released after 2015
 recent_movies = df[(df['Category'] == 'Movie') & (df['release_year'] > 2015)]
@@ -154,14 +157,10 @@ plt.title('Correlation Matrix')
 plt.show()
 
 # Label Encoding (For Machine Learning)
-from sklearn.preprocessing import LabelEncoder
-
-# Initialize LabelEncoder
-le = LabelEncoder()
-
-# Apply label encoding to 'rating' and 'Category'
-df['rating_encoded'] = le.fit_transform(df['rating'])
-df['Category_encoded'] = le.fit_transform(df['Category'])
+# Adds 'rating_encoded' and 'Category_encoded'; codes are kept in
+# netflix_titles.label_codes.json so the same rating gets the same code in every later batch
+encoding = Pipeline([Encode(['rating', 'Category'])], state_path=state_path(data_path, 'label_codes'))
+df = encoding.process(df)
 
 # Save the Cleaned Dataset
 df.to_csv('cleaned_netflix_titles.csv', index=False)
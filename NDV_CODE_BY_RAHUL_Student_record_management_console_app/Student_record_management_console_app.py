@@ -1,6 +1,6 @@
-import json
-import os
+import sys
 from tabulate import tabulate  # For nicely formatted table display
+from storage import open_storage  # JSON or SQLite backend
 
 class Student:
     def __init__(self, student_id, name, branch, year, marks):
@@ -33,28 +33,16 @@ class Student:
 
 # Class to manage multiple student records
 class StudentManager:
-    def __init__(self, filename="students.json"):
+    # students.json keeps the JSON backend; a .db/.sqlite file uses SQLite.
+    # JSON changes are saved by a background thread at most once per flush_interval seconds.
+    def __init__(self, filename="students.json", flush_interval=1.0):
         self.filename = filename
-        self.students = self.load_data()  # Load existing records from file
-
-    # Load student data from JSON file
-    def load_data(self):
-        if not os.path.exists(self.filename):
-            return {}
-        with open(self.filename, "r") as f:
-            data = json.load(f)
-            return {sid: Student.from_dict(info) for sid, info in data.items()}
-
-    # Save student data to JSON file
-    def save_data(self):
-        with open(self.filename, "w") as f:
-            json.dump({sid: student.to_dict() for sid, student in self.students.items()}, f, indent=4)
-            print(f"Data saved to: {os.path.abspath(self.filename)}")
+        self.storage = open_storage(filename, Student, flush_interval)
 
     # Add a new student record
     def add_student(self):
         student_id = input("Enter Student ID: ")
-        if student_id in self.students:
+        if self.storage.exists(student_id):
             print("Student already exists!")
             return
         name = input("Enter Name: ")
@@ -62,50 +50,62 @@ class StudentManager:
         year = input("Enter Year: ")
         marks = input("Enter Marks: ")
         student = Student(student_id, name, branch, year, marks)
-        self.students[student_id] = student
-        self.save_data()
+        self.storage.put(student)
         print("Student added successfully.")
 
-    # Display all student records in a tabular format
-    def view_all_students(self):
-        if not self.students:
+    # Display student records in a tabular format, one page at a time
+    def view_all_students(self, page_size=20):
+        total = self.storage.count()
+        if not total:
             print("No records found.")
             return
-        table = []
-        for student in self.students.values():
-            table.append([
-                student.student_id,
-                student.name,
-                student.branch,
-                student.year,
-                student.marks
-            ])
+        sort_by = input(f"Sort by ({'/'.join(self.storage.SORT_KEYS)}) [student_id]: ").strip().lower() or "student_id"
+        if sort_by not in self.storage.SORT_KEYS:
+            print("Unknown field, sorting by student_id.")
+            sort_by = "student_id"
+
         headers = ["Student ID", "Name", "Branch", "Year", "Marks"]
-        print("\n--- Student Records ---")
-        print(tabulate(table, headers=headers, tablefmt="grid"))
+        total_pages = -(-total // page_size)
+        cursors = [None]  # cursor that starts each page seen so far, for going back
+        while True:
+            # Only the requested page is read from storage and formatted
+            students, next_cursor = self.storage.page(sort_by, cursors[-1], page_size)
+            table = [[s.student_id, s.name, s.branch, s.year, s.marks] for s in students]
+            print(f"\n--- Student Records (page {len(cursors)} of {total_pages}, sorted by {sort_by}) ---")
+            print(tabulate(table, headers=headers, tablefmt="grid"))
+            if total_pages == 1:
+                return
+            choice = input("Enter = next page, p = previous page, q = back to menu: ").strip().lower()
+            if choice == "q":
+                return
+            if choice == "p":
+                if len(cursors) > 1:
+                    cursors.pop()
+            elif next_cursor is None:
+                return
+            else:
+                cursors.append(next_cursor)
 
     # Update an existing student record
     def update_student(self):
         student_id = input("Enter Student ID to update: ")
-        if student_id not in self.students:
+        if not self.storage.exists(student_id):
             print("Student not found.")
             return
         name = input("Enter New Name: ")
         branch = input("Enter New Branch: ")
         year = input("Enter New Year: ")
         marks = input("Enter New Marks: ")
-        self.students[student_id] = Student(student_id, name, branch, year, marks)
-        self.save_data()
+        self.storage.put(Student(student_id, name, branch, year, marks))
         print("Student record updated.")
 
     # Delete a student record
     def delete_student(self):
         student_id = input("Enter Student ID to delete: ")
-        if student_id not in self.students:
+        if not self.storage.exists(student_id):
             print("Student not found.")
             return
-        del self.students[student_id]
-        self.save_data()
+        self.storage.delete(student_id)
         print("Student deleted successfully.")
 
     # Display the menu and take user input
@@ -128,6 +128,7 @@ class StudentManager:
             elif choice == '4':
                 self.delete_student()
             elif choice == '5':
+                self.storage.close()  # writes any changes not yet saved
                 print("Exiting... Goodbye!")
                 break
             else:
@@ -142,7 +143,8 @@ if __name__ == "__main__":
         import os
         os.system("pip install tabulate")  # Auto-install if missing
 
-    manager = StudentManager()  # Create a manager instance
+    # Optional data file argument, e.g. students.db for the SQLite backend
+    manager = StudentManager(sys.argv[1] if len(sys.argv) > 1 else "students.json")
     manager.menu()  # Launch the menu interface
 
 
@@ -0,0 +1,110 @@
+import argparse
+import csv
+import json
+
+import pandas as pd
+
+from storage import open_storage
+from Student_record_management_console_app import Student
+
+COLUMNS = ["student_id", "name", "branch", "year", "marks"]
+
+
+# Check every column at once with pandas string methods instead of one input() field at a time.
+# Returns a Series with the error text for each row ("" when the row is valid).
+def validate_rows(df, storage):
+    errors = pd.DataFrame(index=df.index)
+    errors["student_id"] = ~df["student_id"].str.isdigit()
+    errors["name"] = ~df["name"].str.replace(" ", "", regex=False).str.isalpha()
+    errors["branch"] = ~df["branch"].str.isalnum()
+    errors["year"] = ~df["year"].str.isdigit()
+    marks = pd.to_numeric(df["marks"], errors="coerce")
+    errors["marks"] = ~marks.between(0, 100)
+
+    messages = {
+        "student_id": "Student ID must contain only numbers",
+        "name": "Name must contain only alphabets",
+        "branch": "Branch must be alphanumeric",
+        "year": "Year must contain only numbers",
+        "marks": "Marks must be a number between 0 and 100",
+    }
+    report = pd.Series("", index=df.index)
+    for column, message in messages.items():
+        report = report.mask(errors[column], report + message + "; ")
+
+    duplicated = df["student_id"].duplicated(keep="first")
+    report = report.mask(duplicated, report + "Duplicate Student ID in file; ")
+    # One query (SQLite) or one set intersection (JSON) for the whole file, not one lookup per row
+    existing = df["student_id"].isin(list(storage.existing_ids(df["student_id"].unique().tolist())))
+    report = report.mask(existing, report + "Student already exists; ")
+    return report.str.rstrip("; ")
+
+
+# Validate a CSV of new students, store the good rows in one go and write the rest to an error report
+def import_csv(csv_path, storage, error_path="import_errors.csv"):
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    df.columns = [column.strip().lower() for column in df.columns]
+    missing = [column for column in COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns in {csv_path}: {', '.join(missing)}")
+    df = df[COLUMNS].apply(lambda column: column.str.strip())
+
+    report = validate_rows(df, storage)
+    valid = df[report == ""]
+    rejected = df[report != ""].assign(error=report[report != ""])
+
+    # A single put_many call = one transaction (SQLite) or one file write (JSON)
+    storage.put_many(Student(*row) for row in valid.itertuples(index=False, name=None))
+
+    if len(rejected):
+        # Line numbers as seen in the CSV file (header is line 1)
+        rejected.insert(0, "line", rejected.index + 2)
+        rejected.to_csv(error_path, index=False)
+        print(f"{len(rejected)} rows rejected. See {error_path}")
+    print(f"{len(valid)} students imported.")
+    return len(valid), len(rejected)
+
+
+# Stream every student to a .csv or .jsonl file, one record at a time
+def export_students(storage, out_path):
+    count = 0
+    with open(out_path, "w", newline="") as f:
+        if out_path.endswith(".jsonl"):
+            for student in storage.iter_students():
+                f.write(json.dumps(student.to_dict()) + "\n")
+                count += 1
+        else:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for student in storage.iter_students():
+                writer.writerow([student.student_id, student.name, student.branch,
+                                 student.year, student.marks])
+                count += 1
+    print(f"{count} students exported to {out_path}")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import/export of student records")
+    parser.add_argument("--data", default="students.json",
+                        help="students.json (JSON backend) or a .db file (SQLite backend)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    importer = commands.add_parser("import", help="Import students from a CSV file")
+    importer.add_argument("csv")
+    importer.add_argument("--errors", default="import_errors.csv")
+    exporter = commands.add_parser("export", help="Export students to .csv or .jsonl")
+    exporter.add_argument("out")
+    args = parser.parse_args(argv)
+
+    storage = open_storage(args.data, Student)
+    try:
+        if args.command == "import":
+            import_csv(args.csv, storage, args.errors)
+        else:
+            export_students(storage, args.out)
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
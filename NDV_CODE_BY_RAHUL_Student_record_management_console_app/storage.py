@@ -0,0 +1,252 @@
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+# atomic_write and BackgroundFlusher are shared with the other student app
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from atomic_files import BackgroundFlusher, atomic_write
+
+
+# Base class every storage backend follows (StudentManager only uses these methods)
+class StudentStorage:
+    def get(self, student_id):
+        raise NotImplementedError
+
+    def exists(self, student_id):
+        return self.get(student_id) is not None
+
+    # The ids among student_ids that are already stored, found in one lookup for a whole batch
+    def existing_ids(self, student_ids):
+        return {student_id for student_id in student_ids if self.exists(student_id)}
+
+    def put(self, student):
+        raise NotImplementedError
+
+    def put_many(self, students):
+        for student in students:
+            self.put(student)
+
+    def delete(self, student_id):
+        raise NotImplementedError
+
+    def iter_students(self):
+        raise NotImplementedError
+
+    def count(self):
+        raise NotImplementedError
+
+    # Fields the paged views can sort on
+    SORT_KEYS = ("student_id", "name", "branch", "year", "marks")
+
+    # Up to limit students after the cursor in sort_by order, plus the next cursor (None on the last page).
+    # A cursor is the (value, student_id) of the last student shown, so adding or deleting
+    # records between pages never skips or repeats anyone.
+    def page(self, sort_by="student_id", after=None, limit=20):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+# Whole file in memory, rewritten after changes (fine for small class lists).
+# flush_interval=None saves on every change; a number of seconds saves in the background instead.
+class JSONStorage(StudentStorage):
+    def __init__(self, filename, student_cls, flush_interval=None):
+        self.filename = filename
+        self.student_cls = student_cls
+        self.students = self.load_data()
+        self.lock = threading.Lock()  # the flusher thread reads self.students while the menu changes it
+        self.flusher = BackgroundFlusher(self.write_file, flush_interval) if flush_interval else None
+
+    def load_data(self):
+        if not os.path.exists(self.filename):
+            return {}
+        with open(self.filename, "r") as f:
+            data = json.load(f)
+            return {sid: self.student_cls.from_dict(info) for sid, info in data.items()}
+
+    def write_file(self):
+        with self.lock:
+            data = {sid: student.to_dict() for sid, student in self.students.items()}
+        atomic_write(self.filename, json.dumps(data, indent=4))  # encoded outside the lock
+
+    def save_data(self):
+        if self.flusher:
+            self.flusher.mark_dirty()
+            return
+        self.write_file()
+        print(f"Data saved to: {os.path.abspath(self.filename)}")
+
+    def get(self, student_id):
+        return self.students.get(student_id)
+
+    def existing_ids(self, student_ids):
+        return self.students.keys() & set(student_ids)
+
+    def put(self, student):
+        with self.lock:
+            self.students[student.student_id] = student
+        self.save_data()
+
+    def put_many(self, students):
+        with self.lock:
+            for student in students:
+                self.students[student.student_id] = student
+        self.save_data()  # one write for the whole batch
+
+    def delete(self, student_id):
+        with self.lock:
+            del self.students[student_id]
+        self.save_data()
+
+    def iter_students(self):
+        return iter(list(self.students.values()))
+
+    def count(self):
+        return len(self.students)
+
+    def close(self):
+        if self.flusher:
+            self.flusher.close()
+
+    # Same ordering as SQLiteStorage.SORT_EXPRESSIONS
+    @staticmethod
+    def sort_value(student, sort_by):
+        value = getattr(student, sort_by)
+        if sort_by == "marks":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+        return str(value).lower() if sort_by == "name" else str(value)
+
+    def page(self, sort_by="student_id", after=None, limit=20):
+        entries = ((self.sort_value(s, sort_by), sid) for sid, s in self.students.items())
+        if after is not None:
+            after = tuple(after)
+            entries = (entry for entry in entries if entry > after)
+        # Keeps only limit + 1 entries in a heap instead of sorting every record
+        smallest = heapq.nsmallest(limit + 1, entries)
+        rows = smallest[:limit]
+        next_cursor = rows[-1] if len(smallest) > limit else None
+        return [self.students[sid] for _, sid in rows], next_cursor
+
+
+# Rows live on disk; only the records being used are loaded into memory
+class SQLiteStorage(StudentStorage):
+    COLUMNS = ("student_id", "name", "branch", "year", "marks")
+
+    # Fixed SQL strings, so sqlite3 reuses its prepared statements
+    SELECT_ONE = "SELECT student_id, name, branch, year, marks FROM students WHERE student_id = ?"
+    SELECT_ALL = "SELECT student_id, name, branch, year, marks FROM students ORDER BY student_id"
+    UPSERT = "INSERT OR REPLACE INTO students (student_id, name, branch, year, marks) VALUES (?, ?, ?, ?, ?)"
+    DELETE = "DELETE FROM students WHERE student_id = ?"
+    # The ids travel as one JSON array parameter, so any batch size is a single query
+    SELECT_EXISTING = "SELECT student_id FROM students WHERE student_id IN (SELECT value FROM json_each(?))"
+
+    # Expression each sort key orders by; every one is backed by an index ending in student_id
+    SORT_EXPRESSIONS = {
+        "student_id": "student_id",
+        "name": "name COLLATE NOCASE",
+        "branch": "branch",
+        "year": "year",
+        "marks": "CAST(marks AS REAL)",
+    }
+
+    def __init__(self, filename, student_cls):
+        self.filename = filename
+        self.student_cls = student_cls
+        # Autocommit mode; transactions are opened explicitly where needed
+        self.conn = sqlite3.connect(filename, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # readers don't block the writer
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    def create_tables(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS students (
+                student_id TEXT PRIMARY KEY,
+                name,
+                branch,
+                year,
+                marks
+            );
+            CREATE INDEX IF NOT EXISTS idx_students_name ON students (name COLLATE NOCASE, student_id);
+            CREATE INDEX IF NOT EXISTS idx_students_branch ON students (branch, student_id);
+            CREATE INDEX IF NOT EXISTS idx_students_year ON students (year, student_id);
+            CREATE INDEX IF NOT EXISTS idx_students_marks ON students (CAST(marks AS REAL), student_id);
+        """)
+
+    def _row_to_student(self, row):
+        return self.student_cls.from_dict(dict(zip(self.COLUMNS, row)))
+
+    @staticmethod
+    def _student_to_row(student):
+        return (student.student_id, student.name, student.branch, student.year, student.marks)
+
+    def get(self, student_id):
+        row = self.conn.execute(self.SELECT_ONE, (student_id,)).fetchone()
+        return self._row_to_student(row) if row else None
+
+    def existing_ids(self, student_ids):
+        rows = self.conn.execute(self.SELECT_EXISTING, (json.dumps(list(student_ids)),))
+        return {student_id for (student_id,) in rows}
+
+    def put(self, student):
+        self.conn.execute(self.UPSERT, self._student_to_row(student))
+
+    def put_many(self, students):
+        """Insert all students in one transaction: either every row is stored or none is"""
+        self.conn.execute("BEGIN")
+        try:
+            # executemany pulls rows from the generator, so the batch is never copied into a list
+            self.conn.executemany(self.UPSERT, (self._student_to_row(s) for s in students))
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def delete(self, student_id):
+        self.conn.execute(self.DELETE, (student_id,))
+
+    def iter_students(self):
+        # Stream rows with a cursor instead of fetching the whole table
+        for row in self.conn.execute(self.SELECT_ALL):
+            yield self._row_to_student(row)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    def page(self, sort_by="student_id", after=None, limit=20):
+        # Keyset pagination: the index seeks straight to the cursor, so page 1000 costs the same as page 1
+        expr = self.SORT_EXPRESSIONS[sort_by]
+        order = "student_id" if sort_by == "student_id" else f"{expr}, student_id"
+        sql = f"SELECT {expr}, student_id, name, branch, year, marks FROM students"
+        params = []
+        if after is not None and expr in self.COLUMNS:
+            # SQLite seeks a (column, student_id) index directly with a row-value comparison
+            sql += f" WHERE ({expr}, student_id) > (?, ?)"
+            params = list(after)
+        elif after is not None:
+            # Row values don't seek collated/expression indexes, so give SQLite a range on expr
+            sql += f" WHERE {expr} >= ? AND ({expr} > ? OR student_id > ?)"
+            params = [after[0], after[0], after[1]]
+        sql += f" ORDER BY {order} LIMIT ?"
+        rows = self.conn.execute(sql, params + [limit + 1]).fetchall()
+        students = [self._row_to_student(row[1:]) for row in rows[:limit]]
+        next_cursor = tuple(rows[limit - 1][:2]) if len(rows) > limit else None
+        return students, next_cursor
+
+    def close(self):
+        self.conn.close()
+
+
+# Pick the backend from the file extension: .db / .sqlite -> SQLite, anything else -> JSON
+# flush_interval only applies to JSON; SQLite commits each change itself
+def open_storage(filename, student_cls, flush_interval=None):
+    if filename.endswith((".db", ".sqlite", ".sqlite3")):
+        return SQLiteStorage(filename, student_cls)
+    return JSONStorage(filename, student_cls, flush_interval)
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import time
+
+from students_records import Student, StudentManager
+
+
+def make_student(i: int) -> Student:
+    return Student(f"S{i:06d}", f"Student {i}", 18 + i % 7, "A", f"s{i}@college.edu",
+                   f"98{i:08d}", "CSE", 1 + i % 4, float(i % 101))
+
+
+def time_inserts(count: int, journal: bool) -> float:
+    """Insert count students into a fresh manager and return the elapsed seconds"""
+    with tempfile.TemporaryDirectory() as folder:
+        manager = StudentManager(os.path.join(folder, 'students.json'), journal=journal)
+        start = time.perf_counter()
+        for i in range(count):
+            manager.add_student(make_student(i))
+        manager.close()
+        elapsed = time.perf_counter() - start
+
+        reloaded = StudentManager(os.path.join(folder, 'students.json'), journal=journal)
+        assert len(reloaded.students) == count
+    return elapsed
+
+
+def run_benchmark(count: int = 100000, snapshot_sample: int = 1000) -> None:
+    """
+    Times count inserts in journal mode and snapshot mode.
+    Snapshot mode is O(N^2) overall, so it is measured on snapshot_sample
+    inserts and scaled quadratically to count (pass a larger sample to measure more).
+    """
+    journal_time = time_inserts(count, journal=True)
+    print(f"Journal mode : {count:,} inserts in {journal_time:.2f}s")
+
+    sample = min(count, snapshot_sample)
+    snapshot_time = time_inserts(sample, journal=False)
+    estimate = snapshot_time * (count / sample) ** 2
+    print(f"Snapshot mode: {sample:,} inserts in {snapshot_time:.2f}s "
+          f"(~{estimate:,.0f}s estimated for {count:,})")
+    print(f"Speedup      : ~{estimate / journal_time:,.0f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,57 @@
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+
+from students_records import Student
+from student_roster import StudentRoster
+
+
+class DictStudent:
+    """The previous Student layout: a plain object with a per-instance __dict__"""
+    def __init__(self, student_id, name, age, grade, email, phone, branch, year, marks):
+        self.student_id = student_id
+        self.name = name
+        self.age = age
+        self.grade = grade
+        self.email = email
+        self.phone = phone
+        self.branch = branch
+        self.year = year
+        self.marks = marks
+        self.enrollment_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.last_updated = self.enrollment_date
+
+
+def make_lines(count: int) -> list[str]:
+    """One JSON array of constructor arguments per student"""
+    return [json.dumps([f"S{i:07d}", f"Student {i}", 18 + i % 7, "ABCDE"[i % 5],
+                        f"s{i}@college.edu", f"98{i:08d}", ["CSE", "ECE", "ME", "CIVIL"][i % 4],
+                        1 + i % 4, float(i % 101)])
+            for i in range(count)]
+
+
+def measure(label: str, build, lines: list[str]) -> int:
+    # Decoding inside the measurement gives every record its own strings, as loading students.json does
+    count = len(lines)
+    tracemalloc.start()
+    kept = build(lines)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {current / 1024 / 1024:8.1f} MB  ({current / count:6.0f} bytes/student)")
+    del kept
+    return current
+
+
+def run_benchmark(count: int = 200000) -> None:
+    print(f"Students: {count:,}")
+    lines = make_lines(count)
+    baseline = measure("dict-based Student", lambda rows: [DictStudent(*json.loads(r)) for r in rows], lines)
+    slots = measure("__slots__ Student", lambda rows: [Student(*json.loads(r)) for r in rows], lines)
+    roster = measure("StudentRoster", lambda rows: StudentRoster.from_students(
+        Student(*json.loads(r)) for r in rows), lines)
+    print(f"__slots__ saves {1 - slots / baseline:.0%}, roster saves {1 - roster / baseline:.0%}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
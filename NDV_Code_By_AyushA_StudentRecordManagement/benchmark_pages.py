@@ -0,0 +1,59 @@
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+from tabulate import tabulate
+
+from students_records import Student, StudentManager
+
+
+def make_manager(count: int) -> StudentManager:
+    """An in-memory manager (no file is read or written) holding count students"""
+    manager = StudentManager.__new__(StudentManager)
+    manager.students = {}
+    manager._orders = {}
+    for i in range(count):
+        student = Student(f"S{i:07d}", f"Student {(i * 7919) % count}", 18 + i % 7, "ABCDE"[i % 5],
+                          f"s{i}@college.edu", f"98{i:08d}", ["CSE", "ECE", "ME", "CIVIL"][i % 4],
+                          1 + i % 4, float(i % 101))
+        manager.students[student.student_id] = student
+    return manager
+
+
+def timed(action) -> float:
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        action()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(count: int = 200000) -> None:
+    manager = make_manager(count)
+    print(f"Students: {count:,}")
+
+    def full_table():
+        # The previous display_students_table: one grid of every record
+        rows = [[s.student_id, s.name, s.branch, s.year, s.grade, s.marks]
+                for s in manager.get_all_students()]
+        print(tabulate(rows, headers=["Student ID", "Name", "Branch", "Year", "Grade", "Marks"],
+                       tablefmt="grid"))
+
+    def first_page(sort_by):
+        students, _ = manager.get_students_page(sort_by, limit=20)
+        print(tabulate([[s.student_id, s.name, s.marks] for s in students], tablefmt="grid"))
+
+    print(f"{'full table':<28} {timed(full_table):10.1f} ms")
+    for sort_by in ('id', 'name', 'marks'):
+        cold = timed(lambda: first_page(sort_by))
+        warm = timed(lambda: first_page(sort_by))
+        print(f"first page by {sort_by:<14} {warm:10.1f} ms  (first ever: {cold:.1f} ms, builds the order)")
+
+    _, cursor = manager.get_students_page('name', limit=20)
+    for _ in range(count // 40):
+        _, cursor = manager.get_students_page('name', cursor, 20)
+    print(f"{'middle page by name':<28} {timed(lambda: manager.get_students_page('name', cursor, 20)):10.3f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,72 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+import student_codec
+from students_records import Student, StudentManager
+
+
+def write_legacy_file(path: str, count: int) -> None:
+    """students.json as the app used to write it: indent=4, one dict per student"""
+    data = {}
+    for i in range(count):
+        student = Student(f"S{i:07d}", f"Student {i}", 18 + i % 7, "ABCDE"[i % 5], f"s{i}@college.edu",
+                          f"98{i:08d}", ["CSE", "ECE", "ME", "CIVIL"][i % 4], 1 + i % 4, float(i % 101))
+        data[student.student_id] = student.to_dict()
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=4)
+
+
+def legacy_load(path: str) -> dict:
+    """The previous load path: json.load into dicts, then Student(...) per record"""
+    with open(path, 'r') as file:
+        data = json.load(file)
+    students = {}
+    for student_id, d in data.items():
+        student = Student(d['student_id'], d['name'], d['age'], d['grade'], d['email'],
+                          d['phone'], d['branch'], d['year'], d['marks'])
+        student.enrollment_date = d.get('enrollment_date', student.enrollment_date)
+        student.last_updated = d.get('last_updated', student.last_updated)
+        students[student_id] = student
+    return students
+
+
+def timed(action) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(count: int = 1000000) -> None:
+    """Startup (load) and save times for count students, per codec"""
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'students.json')
+        write_legacy_file(path, count)
+        print(f"Students: {count:,}  (indented file: {os.path.getsize(path) / 1e6:.0f} MB)")
+
+        seconds, students = timed(lambda: legacy_load(path))
+        print(f"{'legacy load':<24} {seconds:7.2f}s")
+
+        def legacy_save():
+            with open(path + '.out', 'w') as file:
+                json.dump({sid: s.to_dict() for sid, s in students.items()}, file, indent=4)
+
+        seconds, _ = timed(legacy_save)
+        print(f"{'legacy save (indent=4)':<24} {seconds:7.2f}s")
+        del students
+
+        for name in student_codec.AVAILABLE:
+            seconds, manager = timed(lambda: StudentManager(path, codec=name))
+            assert len(manager.students) == count
+            print(f"{name + ' load':<24} {seconds:7.2f}s")
+            manager.file_path = path + '.' + name
+            seconds, _ = timed(manager.save_data)
+            size = os.path.getsize(manager.file_path) / 1e6
+            print(f"{name + ' save (compact)':<24} {seconds:7.2f}s  ({size:.0f} MB)")
+            del manager
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,134 @@
+import json
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """Standard library codec, always available
+
+    Students are built by an object_hook while the text is parsed, so the
+    file is decoded into Student objects in a single pass.
+    """
+    name = 'json'
+
+    def __init__(self, student_cls):
+        self.student_cls = student_cls
+
+    def _hook(self, data: dict):
+        return self.student_cls.from_dict(data) if 'student_id' in data else data
+
+    def loads(self, data: bytes):
+        return json.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def decode_students(self, data: bytes) -> dict:
+        return json.loads(data, object_hook=self._hook)
+
+    def encode_students(self, students: dict, pretty: bool = False) -> bytes:
+        # default= turns each Student into a dict only while it is being written
+        if pretty:
+            return json.dumps(students, default=self.student_cls.to_dict, indent=4).encode()
+        return json.dumps(students, default=self.student_cls.to_dict, separators=(',', ':')).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson parses and writes in C; it has no decode hook, so Students are built after parsing"""
+    name = 'orjson'
+
+    def loads(self, data: bytes):
+        return orjson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def decode_students(self, data: bytes) -> dict:
+        from_dict = self.student_cls.from_dict
+        return {student_id: from_dict(record) for student_id, record in orjson.loads(data).items()}
+
+    def encode_students(self, students: dict, pretty: bool = False) -> bytes:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(students, default=self.student_cls.to_dict, option=option)
+
+
+if msgspec is not None:
+    class StudentRecord(msgspec.Struct, gc=False):
+        """Schema of one student in students.json, checked while decoding
+
+        Strict: nothing is converted, so a file that validates gives the same
+        values the json codec would. marks keeps ints as ints for the same reason.
+        """
+        student_id: str
+        name: str
+        age: int
+        grade: str
+        email: str
+        phone: str
+        branch: str
+        year: int
+        marks: int | float
+        enrollment_date: str | None = None
+        last_updated: str | None = None
+
+
+class MsgspecCodec(JSONCodec):
+    """msgspec decodes straight into typed StudentRecord structs, validating field types on the way
+
+    A file with any record that does not fit the schema (an older file with
+    "age": null or "year": "2") is decoded again untyped and built with
+    Student.from_dict, so it loads exactly as it does with the json codec
+    instead of being rejected.
+    """
+    name = 'msgspec'
+
+    def __init__(self, student_cls):
+        super().__init__(student_cls)
+        self._decoder = msgspec.json.Decoder(dict[str, StudentRecord])
+        self._encoder = msgspec.json.Encoder(enc_hook=student_cls.to_dict)
+
+    def loads(self, data: bytes):
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode_students(self, data: bytes) -> dict:
+        try:
+            records = self._decoder.decode(data)
+        except msgspec.ValidationError:
+            from_dict = self.student_cls.from_dict
+            return {student_id: from_dict(record) for student_id, record in self.loads(data).items()}
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        from_record = self.student_cls.from_record
+        return {student_id: from_record(record) for student_id, record in records.items()}
+
+    def encode_students(self, students: dict, pretty: bool = False) -> bytes:
+        data = self._encoder.encode(students)
+        return msgspec.json.format(data, indent=4) if pretty else data
+
+
+# Fastest first; a codec whose library is not installed is skipped
+CODECS = {'msgspec': MsgspecCodec, 'orjson': OrjsonCodec, 'json': JSONCodec}
+AVAILABLE = [name for name, module in (('msgspec', msgspec), ('orjson', orjson), ('json', json))
+             if module is not None]
+
+
+def get_codec(student_cls, name: str | None = None):
+    """Return the named codec, or the fastest one available when name is None"""
+    name = name or AVAILABLE[0]
+    if name not in AVAILABLE:
+        raise ValueError(f"Codec '{name}' is not available (installed: {', '.join(AVAILABLE)})")
+    return CODECS[name](student_cls)
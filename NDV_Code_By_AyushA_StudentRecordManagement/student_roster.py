@@ -0,0 +1,137 @@
+import sys
+from array import array
+from datetime import datetime
+
+from students_records import Student
+
+
+class StudentRoster:
+    """Columnar store for very large, mostly read-only student rosters
+
+    Numbers live in typed arrays (one machine value per student instead of
+    one Python object), branch and grade are stored as small codes into
+    shared string tables, and timestamps are kept as epoch seconds.
+    Records go in and come out through the same to_dict/from_dict shape
+    as Student.
+    """
+    def __init__(self):
+        self.ids: list[str] = []
+        self.names: list[str] = []
+        self.emails: list[str] = []
+        self.phones: list[str] = []
+        self.ages = array('H')
+        self.years = array('H')
+        self.marks = array('d')
+        self.enrolled = array('q')
+        self.updated = array('q')
+        self.branch_codes = array('H')
+        self.grade_codes = array('H')
+        self.branches: list[str] = []
+        self.grades: list[str] = []
+        self._branch_lookup: dict[str, int] = {}
+        self._grade_lookup: dict[str, int] = {}
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, student_id: str) -> bool:
+        return student_id in self._rows
+
+    @staticmethod
+    def _code(value: str, table: list[str], lookup: dict[str, int]) -> int:
+        """Return the code for a string, adding it to the table the first time it is seen"""
+        code = lookup.get(value)
+        if code is None:
+            code = len(table)
+            table.append(sys.intern(value))
+            lookup[value] = code
+        return code
+
+    @staticmethod
+    def _to_epoch(timestamp: str) -> int:
+        return int(datetime.fromisoformat(timestamp).timestamp())
+
+    @staticmethod
+    def _from_epoch(seconds: int) -> str:
+        return datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+
+    def add_dict(self, data: dict) -> bool:
+        """Append a record in Student.to_dict() form
+
+        Every field is converted first, so a bad value (a missing age, an age
+        that does not fit the unsigned 16-bit column, an unparsable date)
+        rejects the record without touching any column.
+        """
+        student_id = data['student_id']
+        if student_id in self._rows:
+            print(f"Error: Student ID {student_id} already exists.")
+            return False
+
+        now = int(datetime.now().timestamp())
+        try:
+            # Built as typed arrays here, so out-of-range values raise before anything is stored
+            ages_years = array('H', [int(data['age']), int(data['year'])])
+            marks = float(data['marks'])
+            name, email, phone, branch, grade = (data[field] for field in ('name', 'email', 'phone', 'branch', 'grade'))
+            if not isinstance(branch, str) or not isinstance(grade, str):
+                raise TypeError("branch and grade must be strings")
+            enrolled = data.get('enrollment_date')
+            updated = data.get('last_updated')
+            enrolled = self._to_epoch(enrolled) if enrolled else now
+            updated = self._to_epoch(updated) if updated else now
+        except (KeyError, TypeError, ValueError, OverflowError) as error:
+            print(f"Error: Student ID {student_id} has an invalid record ({error!r}).")
+            return False
+
+        self._rows[student_id] = len(self.ids)
+        self.ids.append(student_id)
+        self.names.append(name)
+        self.emails.append(email)
+        self.phones.append(phone)
+        self.ages.append(ages_years[0])
+        self.years.append(ages_years[1])
+        self.marks.append(marks)
+        self.enrolled.append(enrolled)
+        self.updated.append(updated)
+        self.branch_codes.append(self._code(branch, self.branches, self._branch_lookup))
+        self.grade_codes.append(self._code(grade, self.grades, self._grade_lookup))
+        return True
+
+    def add_student(self, student: Student) -> bool:
+        return self.add_dict(student.to_dict())
+
+    def to_dict(self, student_id: str) -> dict | None:
+        """Rebuild the Student.to_dict() form of one record"""
+        row = self._rows.get(student_id)
+        if row is None:
+            return None
+        return {
+            'student_id': self.ids[row],
+            'name': self.names[row],
+            'age': self.ages[row],
+            'grade': self.grades[self.grade_codes[row]],
+            'email': self.emails[row],
+            'phone': self.phones[row],
+            'branch': self.branches[self.branch_codes[row]],
+            'year': self.years[row],
+            'marks': self.marks[row],
+            'enrollment_date': self._from_epoch(self.enrolled[row]),
+            'last_updated': self._from_epoch(self.updated[row])
+        }
+
+    def get_student(self, student_id: str) -> Student | None:
+        """Materialise a single Student object on demand"""
+        data = self.to_dict(student_id)
+        return Student.from_dict(data) if data else None
+
+    def __iter__(self):
+        for student_id in self.ids:
+            yield self.get_student(student_id)
+
+    @classmethod
+    def from_students(cls, students) -> "StudentRoster":
+        roster = cls()
+        for student in students:
+            roster.add_student(student)
+        return roster
@@ -1,19 +1,28 @@
-import json
 import os
+import sys
+from bisect import bisect_left, bisect_right, insort
 from tabulate import tabulate
 from datetime import datetime
+from student_codec import get_codec
 
 class Student:
-    """Class to represent a student record with all required fields"""
+    """Class to represent a student record with all required fields
+
+    Uses __slots__ instead of a per-instance __dict__, and interns the
+    low-cardinality branch and grade strings so every record shares them.
+    """
+    __slots__ = ('student_id', 'name', 'age', 'grade', 'email', 'phone',
+                 'branch', 'year', 'marks', 'enrollment_date', 'last_updated')
+
     def __init__(self, student_id: str, name: str, age: int, grade: str, 
                  email: str, phone: str, branch: str, year: int, marks: float):
         self.student_id = student_id
         self.name = name
         self.age = age
-        self.grade = grade
+        self.grade = sys.intern(grade)
         self.email = email
         self.phone = phone
-        self.branch = branch
+        self.branch = sys.intern(branch)
         self.year = year
         self.marks = marks
         self.enrollment_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -37,47 +46,170 @@ class Student:
 
     @classmethod
     def from_dict(cls, data: dict):
-        """Create student object from dictionary"""
-        return cls(
-            data['student_id'],
-            data['name'],
-            data['age'],
-            data['grade'],
-            data['email'],
-            data['phone'],
-            data['branch'],
-            data['year'],
-            data['marks']
-        )
+        """Create student object from dictionary
+
+        Fills the slots directly rather than calling __init__, so loading a
+        saved record does not format a fresh timestamp only to overwrite it.
+        """
+        student = cls.__new__(cls)
+        student.student_id = data['student_id']
+        student.name = data['name']
+        student.age = data['age']
+        student.grade = sys.intern(data['grade'])
+        student.email = data['email']
+        student.phone = data['phone']
+        student.branch = sys.intern(data['branch'])
+        student.year = data['year']
+        student.marks = data['marks']
+        enrolled = data.get('enrollment_date') or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        student.enrollment_date = enrolled
+        student.last_updated = data.get('last_updated') or enrolled
+        return student
+
+    @classmethod
+    def from_record(cls, record):
+        """Create student object from a decoded record with the same fields as attributes
+
+        Same result as from_dict; used for the typed msgspec structs, which
+        would otherwise have to be turned back into dicts first.
+        """
+        student = cls.__new__(cls)
+        student.student_id = record.student_id
+        student.name = record.name
+        student.age = record.age
+        student.grade = sys.intern(record.grade)
+        student.email = record.email
+        student.phone = record.phone
+        student.branch = sys.intern(record.branch)
+        student.year = record.year
+        student.marks = record.marks
+        enrolled = record.enrollment_date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        student.enrollment_date = enrolled
+        student.last_updated = record.last_updated or enrolled
+        return student
 
 
 class StudentManager:
-    """Class to manage student records with file persistence"""
-    def __init__(self, file_path: str = 'students.json'):
+    """Class to manage student records with file persistence
+
+    Persistence modes:
+    - snapshot (default): every mutation rewrites the whole JSON file
+    - journal: every mutation appends one JSON line to <file_path>.journal;
+      after compact_every entries the journal is folded into the snapshot
+
+    Files are read and written through a codec from student_codec (the
+    fastest installed one unless codec names one). Snapshots are compact
+    JSON; pass pretty=True for indented, human-readable files.
+    """
+    # Fields the table views can sort on, each mapping a student to its sort value
+    SORT_KEYS = {
+        'id': lambda s: s.student_id,
+        'name': lambda s: s.name.casefold(),
+        'branch': lambda s: s.branch.casefold(),
+        'year': lambda s: s.year,
+        'marks': lambda s: s.marks,
+    }
+
+    def __init__(self, file_path: str = 'students.json', journal: bool = False,
+                 compact_every: int = 10000, codec: str | None = None, pretty: bool = False):
         self.file_path = file_path
+        self.codec = get_codec(Student, codec)
+        self.pretty = pretty
+        self.journal_path = file_path + '.journal'
+        self.use_journal = journal
+        self.compact_every = compact_every
+        self.journal_entries = 0
+        self._journal_file = None
         self.students = {}
+        # Sort key -> sorted list of (value, student_id), built on first use
+        self._orders = {}
         self.load_data()
 
     def load_data(self) -> None:
-        """Load student data from JSON file"""
+        """Load student data from JSON file, then replay any journal on top"""
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, 'r') as file:
-                    data = json.load(file)
-                    for student_id, student_data in data.items():
-                        self.students[student_id] = Student.from_dict(student_data)
-            except (json.JSONDecodeError, IOError) as e:
+                with open(self.file_path, 'rb') as file:
+                    self.students = self.codec.decode_students(file.read())
+            except (ValueError, IOError) as e:
                 print(f"Warning: Could not load student data ({str(e)}). Starting with empty database.")
+        self.replay_journal()
+        if not self.use_journal and self.journal_entries:
+            # Snapshot mode never reads the journal again, so fold it in now
+            self.compact()
 
-    def save_data(self) -> None:
-        """Save student data to JSON file"""
-        data = {student_id: student.to_dict() 
-               for student_id, student in self.students.items()}
+    def replay_journal(self) -> None:
+        """Apply journal entries written since the last snapshot"""
+        if not os.path.exists(self.journal_path):
+            return
         try:
-            with open(self.file_path, 'w') as file:
-                json.dump(data, file, indent=4)
+            with open(self.journal_path, 'rb') as file:
+                for line in file:
+                    try:
+                        entry = self.codec.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-append; nothing after it was written
+                        print("Warning: Ignoring incomplete journal entry.")
+                        break
+                    if entry['op'] == 'put':
+                        self.students[entry['id']] = Student.from_dict(entry['data'])
+                    elif entry['op'] == 'delete':
+                        self.students.pop(entry['id'], None)
+                    self.journal_entries += 1
+        except IOError as e:
+            print(f"Warning: Could not replay journal ({str(e)}).")
+
+    def save_data(self) -> bool:
+        """Save student data to JSON file; returns False if the snapshot was not written"""
+        temp_path = self.file_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(self.codec.encode_students(self.students, pretty=self.pretty))
+            os.replace(temp_path, self.file_path)
         except IOError as e:
             print(f"Error: Could not save student data ({str(e)}).")
+            return False
+        return True
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot and start an empty journal"""
+        if self._journal_file:
+            self._journal_file.close()
+            self._journal_file = None
+        if not self.save_data():
+            # The journal still holds edits the old snapshot lacks; keep it for the next try
+            return
+        # Replaying a stale journal over the new snapshot is harmless, so truncate last
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_entries = 0
+
+    def close(self) -> None:
+        """Flush pending journal entries into the snapshot"""
+        if self.use_journal and self.journal_entries:
+            self.compact()
+
+    def _persist(self, op: str, student_id: str, student: Student | None = None) -> None:
+        """Record one mutation according to the persistence mode"""
+        if not self.use_journal:
+            self.save_data()
+            return
+
+        entry = {'op': op, 'id': student_id}
+        if student is not None:
+            entry['data'] = student.to_dict()
+        try:
+            if self._journal_file is None:
+                self._journal_file = open(self.journal_path, 'ab')
+            self._journal_file.write(self.codec.dumps(entry) + b'\n')
+            self._journal_file.flush()
+        except IOError as e:
+            print(f"Error: Could not write journal entry ({str(e)}).")
+            return
+
+        self.journal_entries += 1
+        if self.journal_entries >= self.compact_every:
+            self.compact()
 
     def add_student(self, student: Student) -> bool:
         """Add a new student record"""
@@ -85,7 +217,8 @@ class StudentManager:
             print(f"Error: Student ID {student.student_id} already exists.")
             return False
         self.students[student.student_id] = student
-        self.save_data()
+        self._order_add(student)
+        self._persist('put', student.student_id, student)
         return True
 
     def get_student(self, student_id: str) -> Student | None:
@@ -99,12 +232,14 @@ class StudentManager:
             print(f"Error: Student ID {student_id} not found.")
             return False
         
+        self._order_remove(student)
         for key, value in kwargs.items():
             if hasattr(student, key):
                 setattr(student, key, value)
+        self._order_add(student)
         
         student.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.save_data()
+        self._persist('put', student_id, student)
         return True
 
     def delete_student(self, student_id: str) -> bool:
@@ -113,53 +248,88 @@ class StudentManager:
             print(f"Error: Student ID {student_id} not found.")
             return False
         
-        del self.students[student_id]
-        self.save_data()
+        self._order_remove(self.students.pop(student_id))
+        self._persist('delete', student_id)
         return True
 
     def get_all_students(self) -> list[Student]:
         """Get all student records"""
         return list(self.students.values())
 
-    def display_students_table(self, detailed: bool = False) -> None:
-        """Display all students in a tabular format"""
+    def _order(self, sort_by: str) -> list[tuple]:
+        """Sorted (value, student_id) entries for one sort key
+
+        Built the first time the key is used; after that add/update/delete
+        keep it in order, so paging never has to sort the roster again.
+        """
+        entries = self._orders.get(sort_by)
+        if entries is None:
+            key = self.SORT_KEYS[sort_by]
+            entries = sorted((key(student), student_id) for student_id, student in self.students.items())
+            self._orders[sort_by] = entries
+        return entries
+
+    def _order_add(self, student: Student) -> None:
+        for sort_by, entries in self._orders.items():
+            insort(entries, (self.SORT_KEYS[sort_by](student), student.student_id))
+
+    def _order_remove(self, student: Student) -> None:
+        for sort_by, entries in self._orders.items():
+            entry = (self.SORT_KEYS[sort_by](student), student.student_id)
+            i = bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+
+    def get_students_page(self, sort_by: str = 'id', after: tuple | None = None,
+                          limit: int = 20) -> tuple[list[Student], tuple | None]:
+        """Get up to limit students that come after the cursor in sort_by order
+
+        Returns the page and the cursor for the next one (None on the last
+        page). A cursor is the (value, student_id) of the last student shown,
+        so pages stay correct while records are added or deleted in between.
+        """
+        entries = self._order(sort_by)
+        start = bisect_right(entries, after) if after is not None else 0
+        page = entries[start:start + limit]
+        next_cursor = page[-1] if page and start + limit < len(entries) else None
+        return [self.students[student_id] for _, student_id in page], next_cursor
+
+    def display_students_table(self, detailed: bool = False, sort_by: str = 'id',
+                               page_size: int = 20) -> None:
+        """Display students in a tabular format, one page at a time"""
         if not self.students:
             print("No student records found.")
             return
         
         if detailed:
             headers = ["ID", "Name", "Age", "Grade", "Email", "Phone", "Branch", "Year", "Marks", "Enrolled", "Updated"]
-            table_data = []
-            
-            for student in self.get_all_students():
-                table_data.append([
-                    student.student_id,
-                    student.name,
-                    student.age,
-                    student.grade,
-                    student.email,
-                    student.phone,
-                    student.branch,
-                    student.year,
-                    student.marks,
-                    student.enrollment_date,
-                    student.last_updated
-                ])
+            row = lambda s: [s.student_id, s.name, s.age, s.grade, s.email, s.phone,
+                             s.branch, s.year, s.marks, s.enrollment_date, s.last_updated]
         else:
             headers = ["Student ID", "Name", "Branch", "Year", "Grade", "Marks"]
-            table_data = []
-            
-            for student in self.get_all_students():
-                table_data.append([
-                    student.student_id,
-                    student.name,
-                    student.branch,
-                    student.year,
-                    student.grade,
-                    student.marks
-                ])
+            row = lambda s: [s.student_id, s.name, s.branch, s.year, s.grade, s.marks]
         
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+        # Cursor that starts each page seen so far, so "previous" can step back
+        cursors = [None]
+        while True:
+            students, next_cursor = self.get_students_page(sort_by, cursors[-1], page_size)
+            # Only this page goes through tabulate, however large the roster is
+            print("\n" + tabulate([row(s) for s in students], headers=headers, tablefmt="grid"))
+            total_pages = max(1, -(-len(self.students) // page_size))
+            print(f"Page {len(cursors)} of {total_pages} (sorted by {sort_by})")
+            if total_pages == 1:
+                return
+            
+            choice = input("Enter = next page, p = previous page, q = back to menu: ").strip().lower()
+            if choice == 'q':
+                return
+            if choice == 'p':
+                if len(cursors) > 1:
+                    cursors.pop()
+            elif next_cursor is None:
+                return
+            else:
+                cursors.append(next_cursor)
 
 
 class StudentManagementApp:
@@ -296,6 +466,15 @@ class StudentManagementApp:
         else:
             print("\nNo changes made or update failed.")
 
+    def display_students_ui(self, detailed: bool) -> None:
+        """UI for paging through all students in a chosen order"""
+        fields = '/'.join(StudentManager.SORT_KEYS)
+        sort_by = input(f"Sort by ({fields}) [id]: ").strip().lower() or 'id'
+        if sort_by not in StudentManager.SORT_KEYS:
+            print(f"Unknown sort field '{sort_by}', sorting by id.")
+            sort_by = 'id'
+        self.manager.display_students_table(detailed=detailed, sort_by=sort_by)
+
     def delete_student_ui(self) -> None:
         """UI for deleting a student record"""
         student_id = self.get_valid_input("\nEnter Student ID to delete: ")
@@ -318,10 +497,11 @@ class StudentManagementApp:
                 elif choice == '4':
                     self.delete_student_ui()
                 elif choice == '5':
-                    self.manager.display_students_table(detailed=False)
+                    self.display_students_ui(detailed=False)
                 elif choice == '6':
-                    self.manager.display_students_table(detailed=True)
+                    self.display_students_ui(detailed=True)
                 elif choice == '7':
+                    self.manager.close()
                     print("\nExiting the application. Goodbye!")
                     break
                 else:
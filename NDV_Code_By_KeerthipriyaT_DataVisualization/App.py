@@ -1,9 +1,26 @@
+import os
+import sys
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from columnar_source import ColumnarSource
+from summary_sketch import SketchSummary
+
+DEFAULT_DATA_URL = "https://raw.githubusercontent.com/insaid2018/Data-sets/master/IPL%20Matches/matches.csv"
+
+
+# Per-team sketches of every column, built once per dataset (data_version is the
+# cache key; the frame itself is not hashed): switching teams merges them
+# instead of running describe() on the filtered rows
+@st.cache_resource
+def load_summary(_df, data_version):
+    return SketchSummary(_df, by='team1')
+
+
 # Title and description
 st.title("IPL Data Visualization Dashboard")
 st.markdown("Explore IPL match data using different filters and charts.")
@@ -14,12 +31,16 @@ uploaded_file = st.file_uploader("Upload your IPL dataset CSV", type=["csv"])
 # Load default or uploaded dataset
 if uploaded_file is not None:
     df = pd.read_csv(uploaded_file)
+    data_version = uploaded_file.file_id
 else:
-    df = pd.read_csv("https://raw.githubusercontent.com/insaid2018/Data-sets/master/IPL%20Matches/matches.csv")
+    data_version = DEFAULT_DATA_URL
+    # Downloaded once and kept as a memory-mapped Arrow file next to this script
+    df = ColumnarSource(DEFAULT_DATA_URL, cache_dir=os.path.dirname(os.path.abspath(__file__))).to_pandas()
 
 # Basic cleaning
 df.columns = df.columns.str.strip()
 df.dropna(inplace=True)
+summary = load_summary(df, data_version)
 
 # Sidebar filters
 st.sidebar.header("Filter Options")
@@ -34,7 +55,7 @@ filtered_df = df[df['team1'] == selected_team]
 # Display statistics
 if show_stats:
     st.subheader("Summary Statistics")
-    st.write(filtered_df.describe(include='all'))
+    st.write(summary.describe({'team1': selected_team}))
 
 # Charts
 st.subheader("Visualization")
@@ -1,15 +1,21 @@
 # Sales Dashboard
+#
+# This is a Sales Dashboard built using Streamlit, a popular Python library for building interactive web applications.
+# The dashboard allows you to filter and explore a sales dataset, and visualize key performance metrics, sales by product line over time, and top 10 customers, products, and total sales by product line.
 
-This is a Sales Dashboard built using Streamlit, a popular Python library for building interactive web applications.
-The dashboard allows you to filter and explore a sales dataset, and visualize key performance metrics, sales by product line over time, and top 10 customers, products, and total sales by product line.
-
-  
+import os
+import sys
 from typing import List, Tuple
 
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from chart_lod import DEFAULT_MAX_POINTS, LODCache, downsample_frame
+from columnar_source import ColumnarSource
+from sales_index import SalesIndex
+
 
 def set_page_config():
     st.set_page_config(
@@ -21,18 +27,29 @@ def set_page_config():
     st.markdown("<style> footer {visibility: hidden;} </style>", unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_data() -> pd.DataFrame:
-    data = pd.read_csv('data/sales_data_sample.csv', encoding='latin1')
+SALES_COLUMNS = ['ORDERDATE', 'ORDERNUMBER', 'SALES', 'CUSTOMERNAME', 'PRODUCTCODE', 'PRODUCTLINE',
+                 'COUNTRY', 'STATUS']
+
+
+DATA_PATH = 'data/sales_data_sample.csv'
+
+
+@st.cache_data(max_entries=1)
+def load_data(path: str, modified: float) -> pd.DataFrame:
+    """Columns the dashboard uses, from a memory-mapped Arrow copy of the CSV (converted on first use).
+    modified (the CSV's mtime) is only part of the cache key, so a new upload is loaded again"""
+    source = ColumnarSource(path, encoding='latin1', timestamp_formats=['%m/%d/%Y %H:%M'])
+    data = source.to_pandas(columns=SALES_COLUMNS)
     data['ORDERDATE'] = pd.to_datetime(data['ORDERDATE'])
     return data
 
 
-def filter_data(data: pd.DataFrame, column: str, values: List[str]) -> pd.DataFrame:
-    return data[data[column].isin(values)] if values else data
+@st.cache_resource
+def lod_cache() -> LODCache:
+    """Downsampled chart frames per filter key and data version, shared by all reruns"""
+    return LODCache()
 
 
-@st.cache_data
 def calculate_kpis(data: pd.DataFrame) -> List[float]:
     total_sales = data['SALES'].sum()
     sales_in_m = f"{total_sales / 1000000:.2f}M"
@@ -42,13 +59,44 @@ def calculate_kpis(data: pd.DataFrame) -> List[float]:
     return [sales_in_m, total_orders, average_sales_per_order, unique_customers]
 
 
+def sales_over_time(data: pd.DataFrame, combine_product_lines: bool) -> pd.DataFrame:
+    """Daily sales (per product line unless combined), sorted by date"""
+    keys = ['ORDERDATE'] if combine_product_lines else ['ORDERDATE', 'PRODUCTLINE']
+    return data.groupby(keys)['SALES'].sum().reset_index()
+
+
+def summarize_sales(data: pd.DataFrame) -> dict:
+    """Everything the page shows for one filter combination. Only aggregates are kept,
+    not the filtered rows: the index caches up to 128 of these summaries"""
+    return {
+        'rows': len(data),
+        'first_date': data['ORDERDATE'].min(),
+        'last_date': data['ORDERDATE'].max(),
+        'daily_sales': sales_over_time(data, combine_product_lines=True),
+        'daily_sales_by_product_line': sales_over_time(data, combine_product_lines=False),
+        'kpis': calculate_kpis(data) if not data.empty else ["0.00M", 0, "0.00K", 0],
+        'top_customers': data.groupby('CUSTOMERNAME')['SALES'].sum().reset_index().sort_values(
+            'SALES', ascending=False).head(10),
+        'top_products': data.groupby(['PRODUCTCODE', 'PRODUCTLINE'])['SALES'].sum().reset_index().sort_values(
+            'SALES', ascending=False).head(10),
+        'sales_by_product_line': data.groupby('PRODUCTLINE')['SALES'].sum().reset_index(),
+    }
+
+
+@st.cache_resource(max_entries=1)
+def sales_index(path: str, modified: float) -> SalesIndex:
+    """Bitmap index over the sales rows; summaries are cached per normalized filter tuple.
+    Rebuilt when the CSV changes, so no summary outlives the data it came from"""
+    return SalesIndex(load_data(path, modified), summarize_sales)
+
+
 def display_kpi_metrics(kpis: List[float], kpi_names: List[str]):
     st.header("KPI Metrics")
     for i, (col, (kpi_name, kpi_value)) in enumerate(zip(st.columns(4), zip(kpi_names, kpis))):
         col.metric(label=kpi_name, value=kpi_value)
 
 
-def display_sidebar(data: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+def display_sidebar(data: pd.DataFrame) -> Tuple[pd.Timestamp, pd.Timestamp, List[str], List[str], List[str]]:
     st.sidebar.markdown(
     """
     <a href="https://twitter.com/cameronjoejones" target="_blank" style="text-decoration: none;">
@@ -74,17 +122,40 @@ def display_sidebar(data: pd.DataFrame) -> Tuple[List[str], List[str], List[str]
 
 
 
-    return selected_product_lines, selected_countries, selected_statuses
+    # The end date includes every order placed that day
+    end_date = end_date + pd.Timedelta(days=1) - pd.Timedelta(1)
+    return start_date, end_date, selected_product_lines, selected_countries, selected_statuses
+
 
+def display_charts(summary: dict, filter_key: tuple, modified: float):
+    if not summary['rows']:
+        st.warning("No sales match the selected filters.")
+        return
 
-def display_charts(data: pd.DataFrame):
     combine_product_lines = st.checkbox("Combine Product Lines", value=True)
 
+    # Zooming in re-samples only the visible dates, so detail comes back
+    first_date, last_date = summary['first_date'].date(), summary['last_date'].date()
+    zoom = (first_date, last_date)
+    if first_date < last_date:
+        zoom = st.slider("Zoom", min_value=first_date, max_value=last_date, value=zoom)
+    x_range = (pd.Timestamp(zoom[0]), pd.Timestamp(zoom[1]) + pd.Timedelta(days=1) - pd.Timedelta(1))
+
+    # At most DEFAULT_MAX_POINTS points per line are sent to the browser; the data
+    # version keeps charts of an earlier upload from being reused
+    key = (filter_key, combine_product_lines, zoom, DEFAULT_MAX_POINTS, modified)
+    if combine_product_lines:
+        daily_sales, group = summary['daily_sales'], None
+    else:
+        daily_sales, group = summary['daily_sales_by_product_line'], 'PRODUCTLINE'
+    chart_data = lod_cache().get(key, lambda: downsample_frame(
+        daily_sales, 'ORDERDATE', ['SALES'], x_range=x_range, group=group))
+
     if combine_product_lines:
-        fig = px.area(data, x='ORDERDATE', y='SALES',
+        fig = px.area(chart_data, x='ORDERDATE', y='SALES',
                       title="Sales by Product Line Over Time", width=900, height=500)
     else:
-        fig = px.area(data, x='ORDERDATE', y='SALES', color='PRODUCTLINE',
+        fig = px.area(chart_data, x='ORDERDATE', y='SALES', color='PRODUCTLINE',
                       title="Sales by Product Line Over Time", width=900, height=500)
 
     fig.update_layout(margin=dict(l=20, r=20, t=50, b=20))
@@ -96,42 +167,37 @@ def display_charts(data: pd.DataFrame):
 
     with col1:
         st.subheader("Top 10 Customers")
-        top_customers = data.groupby('CUSTOMERNAME')['SALES'].sum().reset_index().sort_values('SALES',
-                                                                                              ascending=False).head(10)
-        st.write(top_customers)
+        st.write(summary['top_customers'])
 
     with col2:
         st.subheader("Top 10 Products by Sales")
-        top_products = data.groupby(['PRODUCTCODE', 'PRODUCTLINE'])['SALES'].sum().reset_index().sort_values('SALES',
-                                                                                                             ascending=False).head(
-            10)
-        st.write(top_products)
+        st.write(summary['top_products'])
 
     with col3:
         st.subheader("Total Sales by Product Line")
-        total_sales_by_product_line = data.groupby('PRODUCTLINE')['SALES'].sum().reset_index()
-        st.write(total_sales_by_product_line)
+        st.write(summary['sales_by_product_line'])
 
 
 def main():
     set_page_config()
 
-    data = load_data()
+    modified = os.path.getmtime(DATA_PATH)
+    index = sales_index(DATA_PATH, modified)
 
     st.title("📊 Sales Dashboard")
 
-    selected_product_lines, selected_countries, selected_statuses = display_sidebar(data)
+    start_date, end_date, selected_product_lines, selected_countries, selected_statuses = display_sidebar(index.data)
 
-    filtered_data = data.copy()
-    filtered_data = filter_data(filtered_data, 'PRODUCTLINE', selected_product_lines)
-    filtered_data = filter_data(filtered_data, 'COUNTRY', selected_countries)
-    filtered_data = filter_data(filtered_data, 'STATUS', selected_statuses)
+    # Same filters in any order -> same key -> cached summary, no rescan of the frame
+    filter_key = index.make_key(start_date, end_date, {'PRODUCTLINE': selected_product_lines,
+                                                       'COUNTRY': selected_countries,
+                                                       'STATUS': selected_statuses})
+    summary = index.summary(filter_key)
 
-    kpis = calculate_kpis(filtered_data)
     kpi_names = ["Total Sales", "Total Orders", "Average Sales per Order", "Unique Customers"]
-    display_kpi_metrics(kpis, kpi_names)
+    display_kpi_metrics(summary['kpis'], kpi_names)
 
-    display_charts(filtered_data)
+    display_charts(summary, filter_key, modified)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ['PRODUCTLINE', 'COUNTRY', 'STATUS']
+
+FilterKey = Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], Tuple[Tuple[str, Tuple[str, ...]], ...]]
+
+
+class SalesIndex:
+    """Bitmap index over the sales rows plus a bounded cache of per-filter results.
+
+    The rows are sorted by ORDERDATE once, so a date range is a slice found by
+    binary search. For every value of every filter column there is a bitmap
+    (np.packbits, one bit per row). A filter combination is resolved by OR-ing
+    the bitmaps of the values selected in a column and AND-ing the columns,
+    instead of rescanning the frame with isin() on every rerun.
+
+    summary(key) calls summarize(filtered rows) and keeps the last max_entries
+    results (LRU), keyed by the normalized filter tuple from make_key().
+    summarize should return aggregates only: a result that holds on to the
+    filtered frame keeps up to max_entries copies of the rows alive.
+    """
+
+    def __init__(self, data: pd.DataFrame, summarize: Callable[[pd.DataFrame], dict],
+                 columns: Sequence[str] = FILTER_COLUMNS, max_entries: int = 128):
+        self.data = data.sort_values('ORDERDATE', kind='stable').reset_index(drop=True)
+        self.dates = self.data['ORDERDATE'].to_numpy()
+        self.bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        for column in columns:
+            codes, values = pd.factorize(self.data[column])
+            self.bitmaps[column] = {value: np.packbits(codes == code) for code, value in enumerate(values)}
+        self._summarize = summarize
+        self.summary = lru_cache(maxsize=max_entries)(self._summary)
+
+    def make_key(self, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp],
+                 selections: Dict[str, Sequence[str]]) -> FilterKey:
+        """Normalized filter tuple: sorted values per column, and no entry for a column
+        whose selection is empty or names every value (both mean "no filter")"""
+        filters = []
+        for column in sorted(selections):
+            values = tuple(sorted(set(selections[column])))
+            if values and set(values) != set(self.bitmaps[column]):
+                filters.append((column, values))
+        return start, end, tuple(filters)
+
+    def rows(self, key: FilterKey) -> np.ndarray:
+        """Positions (in date order) of the rows matching key"""
+        start, end, filters = key
+        lo = 0 if start is None else np.searchsorted(self.dates, start.to_datetime64(), side='left')
+        hi = len(self.dates) if end is None else np.searchsorted(self.dates, end.to_datetime64(), side='right')
+        if not filters:
+            return np.arange(lo, hi)
+        mask = None
+        for column, values in filters:
+            column_mask = np.zeros_like(next(iter(self.bitmaps[column].values())))
+            for value in values:
+                if value in self.bitmaps[column]:
+                    column_mask |= self.bitmaps[column][value]
+            mask = column_mask if mask is None else mask & column_mask
+        selected = np.unpackbits(mask, count=len(self.dates))[lo:hi]
+        return lo + np.flatnonzero(selected)
+
+    def filter(self, key: FilterKey) -> pd.DataFrame:
+        return self.data.iloc[self.rows(key)]
+
+    def _summary(self, key: FilterKey) -> dict:
+        return self._summarize(self.filter(key))
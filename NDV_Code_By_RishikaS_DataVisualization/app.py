@@ -1,18 +1,33 @@
+import os
+import sys
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from chart_lod import DEFAULT_MAX_POINTS, LODCache, downsample_frame
+from covid_cube import CovidCube
+from dataset_loader import load_dataset
+
 st.set_page_config(page_title="COVID-19 Dashboard", layout="wide")
 
+DATA_PATH = r'C:\RISHIKA_S_ASSIGNMENT\Code_By_RishikaS_DataVisualization_Streamlit\covid_19_clean_complete.csv'
+
 # Load Data
-@st.cache_data
-def load_data():
-    df = pd.read_csv(r'C:\RISHIKA_S_ASSIGNMENT\Code_By_RishikaS_DataVisualization_Streamlit\covid_19_clean_complete.csv', parse_dates=['Date'])
-    df['Country/Region'] = df['Country/Region'].astype(str)
-    return df
+# The per-country cube is built once per data refresh (the file's modification
+# time is part of the cache key); reruns only look a country up in it
+@st.cache_resource
+def load_cube(path, modified):
+    return CovidCube.from_clean_complete(load_dataset('covid', path))
+
+# Downsampled chart series per (country, dates, chart, data version)
+@st.cache_resource
+def lod_cache():
+    return LODCache()
 
-df = load_data()
+modified = os.path.getmtime(DATA_PATH)
+cube = load_cube(DATA_PATH, modified)
 
 # Sidebar Filters with background color and padding
 st.sidebar.markdown(
@@ -34,14 +49,14 @@ st.sidebar.markdown(
 )
 
 st.sidebar.title("Filters")
-country = st.sidebar.selectbox("Select Country", sorted(df['Country/Region'].unique()))
-start_date = st.sidebar.date_input("Start Date", df['Date'].min())
-end_date = st.sidebar.date_input("End Date", df['Date'].max())
+country = st.sidebar.selectbox("Select Country", cube.countries)
+start_date = st.sidebar.date_input("Start Date", cube.first_date)
+end_date = st.sidebar.date_input("End Date", cube.last_date)
 
-# Filtered Data
-filtered_df = df[(df['Country/Region'] == country) & 
-                 (df['Date'] >= pd.to_datetime(start_date)) &
-                 (df['Date'] <= pd.to_datetime(end_date))]
+# Filtered Data: a dict lookup for the country, a binary search for the dates
+# (provinces are already summed into their country for each date)
+series = cube[country]
+filtered_df = series.frame(start_date, end_date)
 
 # Main Layout
 st.title(f"COVID-19 Dashboard - {country}")
@@ -50,19 +65,24 @@ col1, col2, col3 = st.columns(3)
 
 # Colored Metrics
 with col1:
-    st.metric("Total Confirmed", int(filtered_df['Confirmed'].max()))
+    st.metric("Total Confirmed", int(series.peak('Confirmed', start_date, end_date)))
     st.markdown("<div style='color:orange; font-weight:bold;'>Confirmed cases in orange</div>", unsafe_allow_html=True)
 with col2:
-    st.metric("Total Deaths", int(filtered_df['Deaths'].max()))
+    st.metric("Total Deaths", int(series.peak('Deaths', start_date, end_date)))
     st.markdown("<div style='color:red; font-weight:bold;'>Deaths in red</div>", unsafe_allow_html=True)
 with col3:
-    st.metric("Total Recovered", int(filtered_df['Recovered'].max()))
+    st.metric("Total Recovered", int(series.peak('Recovered', start_date, end_date)))
     st.markdown("<div style='color:green; font-weight:bold;'>Recovered in green</div>", unsafe_allow_html=True)
 
 # Line Chart with colors
 st.markdown("### Trend Over Time")
+# Charts get at most DEFAULT_MAX_POINTS points per series: LTTB keeps the shape
+# of the lines, min/max buckets keep every spike of the daily bars
+chart_key = (country, start_date, end_date, DEFAULT_MAX_POINTS, modified)
+line_df = lod_cache().get(chart_key + ('line',), lambda: downsample_frame(
+    filtered_df, 'Date', ['Confirmed', 'Deaths', 'Recovered'], method='lttb'))
 fig = px.line(
-    filtered_df, 
+    line_df, 
     x='Date', 
     y=['Confirmed', 'Deaths', 'Recovered'], 
     labels={"value": "Count", "variable": "Metric"},
@@ -76,10 +96,11 @@ st.plotly_chart(fig, use_container_width=True)
 
 # Bar Chart with color
 st.markdown("### Daily Change (Bar Chart)")
-daily_df = filtered_df.copy()
-daily_df['New Confirmed'] = daily_df['Confirmed'].diff().fillna(0)
+# 'New Confirmed' is precomputed in the cube from the full series
+bar_df = lod_cache().get(chart_key + ('bar',), lambda: downsample_frame(
+    filtered_df, 'Date', ['New Confirmed'], method='minmax'))
 fig2 = px.bar(
-    daily_df, 
+    bar_df, 
     x='Date', 
     y='New Confirmed', 
     labels={"New Confirmed": "New Cases"},
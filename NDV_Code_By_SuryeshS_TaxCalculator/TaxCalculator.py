@@ -1,3 +1,8 @@
+import sys
+
+from slab_tables import DEFAULT_FY, get_regime
+
+
 def calculate_old_regime_tax(income):
     """
     Calculates income tax under the OLD regime for FY 2024–25.
@@ -15,35 +20,11 @@ def calculate_old_regime_tax(income):
       - If your taxable income is ≤ ₹5,00,000, you get a rebate of up to ₹12,500.
       - This rebate is subtracted from the calculated tax.
       - It reduces your final tax to ₹0 (not just reduced — fully waived).
-    """
-
-    # Step 1: Apply deductions
-    standard_deduction = 50000
-    deduction_80c = 150000
-    taxable_income = income - standard_deduction - deduction_80c
-
-    if taxable_income <= 0:
-        return 0  # No tax if taxable income is zero or negative
-
-    # Step 2: Apply old tax slabs
-    tax = 0
-    if taxable_income <= 250000:
-        tax = 0
-    elif taxable_income <= 500000:
-        tax = (taxable_income - 250000) * 0.05
-    elif taxable_income <= 1000000:
-        tax = (250000 * 0.05) + (taxable_income - 500000) * 0.2
-    else:
-        tax = (250000 * 0.05) + (500000 * 0.2) + (taxable_income - 1000000) * 0.3
-
-    # Step 3: Apply 87A rebate if income is ≤ ₹5L
-    if taxable_income <= 500000:
-        tax = max(0, tax - 12500)
 
-    # Step 4: Add 4% Health & Education Cess
-    tax += tax * 0.04
+    ▶ Slabs and limits come from the compiled table in slab_tables.py.
+    """
 
-    return int(tax)
+    return int(get_regime(DEFAULT_FY, "old").total_tax(income))
 
 
 def calculate_new_regime_tax(income):
@@ -60,50 +41,11 @@ def calculate_new_regime_tax(income):
     ▶ Section 87A Rebate:
       - If taxable income ≤ ₹7,00,000, you get full rebate of up to ₹25,000
       - This makes your final tax = ₹0
-    """
-
-    # Step 1: Apply standard deduction (only one allowed in new regime)
-    standard_deduction = 75000
-    taxable_income = income - standard_deduction
-
-    if taxable_income <= 0:
-        return 0
-
-    # Step 2: Apply new tax slabs
-    tax = 0
-    if taxable_income <= 300000:
-        tax = 0
-    elif taxable_income <= 600000:
-        tax = (taxable_income - 300000) * 0.05
-    elif taxable_income <= 900000:
-        tax = (300000 * 0.05) + (taxable_income - 600000) * 0.1
-    elif taxable_income <= 1200000:
-        tax = (300000 * 0.05) + (300000 * 0.1) + (taxable_income - 900000) * 0.15
-    elif taxable_income <= 1500000:
-        tax = (
-            300000 * 0.05 +
-            300000 * 0.1 +
-            300000 * 0.15 +
-            (taxable_income - 1200000) * 0.2
-        )
-    else:
-        tax = (
-            300000 * 0.05 +
-            300000 * 0.1 +
-            300000 * 0.15 +
-            300000 * 0.2 +
-            (taxable_income - 1500000) * 0.3
-        )
 
-    # Step 3: Apply 87A rebate if taxable income ≤ ₹7L
-    # Example: if income is ₹6,50,000 - 75,000 = ₹5,75,000 → eligible
-    if taxable_income <= 700000:
-        tax = max(0, tax - 25000)
-
-    # Step 4: Add 4% Health & Education Cess
-    tax += tax * 0.04
+    ▶ Slabs and limits come from the compiled table in slab_tables.py.
+    """
 
-    return int(tax)
+    return int(get_regime(DEFAULT_FY, "new").total_tax(income))
 
 
 def start_tax_calculator():
@@ -145,4 +87,9 @@ def start_tax_calculator():
 
 
 if __name__ == "__main__":
-    start_tax_calculator()
+    if len(sys.argv) > 1:
+        # Batch mode: python TaxCalculator.py employees.csv results.csv
+        from payroll_processor import main
+        main(sys.argv[1:])
+    else:
+        start_tax_calculator()
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from slab_tables import DEFAULT_FY, get_regime
+
+
+def _regime_tax(incomes, regime):
+    """
+    Vectorized version of CompiledRegime.total_tax from slab_tables.py.
+
+    ▶ Returns (tax, rebate, cess) arrays, where tax is the final amount
+      after the 87A rebate and cess, truncated like the scalar functions.
+    """
+    slabs = np.asarray(regime.lowers, dtype=np.float64)
+    rates = np.asarray(regime.rates)
+    base_tax = np.asarray(regime.base_tax)
+
+    taxable_income = np.maximum(regime.taxable_income(incomes), 0.0)
+
+    # Step 1: Locate each income's slab with a single binary search
+    slab = np.searchsorted(slabs, taxable_income, side="left") - 1
+    slab = np.clip(slab, 0, len(slabs) - 1)
+    tax = base_tax[slab] + (taxable_income - slabs[slab]) * rates[slab]
+
+    # Step 2: Apply 87A rebate for incomes at or below the limit
+    eligible = (taxable_income > 0) & (taxable_income <= regime.rebate_limit)
+    rebate_applied = np.where(eligible, np.minimum(tax, regime.rebate), 0.0)
+    tax = tax - rebate_applied
+
+    # Step 3: Add Health & Education Cess
+    cess = tax * regime.cess_rate
+    tax = np.trunc(tax + cess)
+
+    return tax.astype(np.int64), rebate_applied, cess
+
+
+def _as_incomes(incomes):
+    """
+    Incomes as a float64 array plus the Series index (or None).
+    Raises ValueError for missing or infinite incomes, which have no tax.
+    """
+    index = incomes.index if isinstance(incomes, pd.Series) else None
+    incomes = np.asarray(incomes, dtype=np.float64)
+    bad = np.flatnonzero(~np.isfinite(incomes))
+    if len(bad):
+        raise ValueError(f"{len(bad):,} incomes are missing or not finite "
+                         f"(first at position {bad[0]}); fill or drop them first.")
+    return incomes, index
+
+
+def calculate_batch(incomes, fy=DEFAULT_FY):
+    """
+    Computes old and new regime tax for a whole payroll in one pass.
+
+    ▶ Accepts a NumPy array, pandas Series or any list of total incomes
+      (CTC + Bonus). Results match calculate_old_regime_tax and
+      calculate_new_regime_tax from TaxCalculator.py row for row.
+
+    ▶ fy selects the slab table from slab_tables.REGIMES.
+
+    ▶ Returns a DataFrame with columns:
+      - income, old_tax, new_tax
+      - old_rebate, new_rebate (Section 87A)
+      - old_cess, new_cess (4% Health & Education Cess)
+      - recommended ("Old", "New" or "Same")
+
+    ▶ Raises ValueError if any income is NaN or infinite.
+    """
+    incomes, index = _as_incomes(incomes)
+
+    old = _regime_tax(incomes, get_regime(fy, "old"))
+    new = _regime_tax(incomes, get_regime(fy, "new"))
+    return _result_frame(incomes, old, new, index)
+
+
+def _result_frame(incomes, old, new, index=None):
+    """Assembles the per-regime (tax, rebate, cess) arrays into the result DataFrame."""
+    old_tax, old_rebate, old_cess = old
+    new_tax, new_rebate, new_cess = new
+
+    recommended = np.where(
+        old_tax < new_tax, "Old", np.where(new_tax < old_tax, "New", "Same")
+    )
+
+    return pd.DataFrame(
+        {
+            "income": incomes,
+            "old_tax": old_tax,
+            "new_tax": new_tax,
+            "old_rebate": old_rebate,
+            "new_rebate": new_rebate,
+            "old_cess": old_cess,
+            "new_cess": new_cess,
+            "recommended": recommended,
+        },
+        index=index,
+    )
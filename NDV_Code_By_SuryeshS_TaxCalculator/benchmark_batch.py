@@ -0,0 +1,36 @@
+import time
+
+import numpy as np
+
+from TaxCalculator import calculate_old_regime_tax, calculate_new_regime_tax
+from batch_tax import calculate_batch
+
+
+def run_benchmark(employees=400000, seed=42):
+    """
+    Compares looping the scalar functions against calculate_batch
+    on a synthetic payroll, and checks both give identical results.
+    """
+    rng = np.random.default_rng(seed)
+    incomes = rng.integers(200000, 5000000, size=employees).astype(float)
+
+    start = time.perf_counter()
+    old_loop = [calculate_old_regime_tax(income) for income in incomes]
+    new_loop = [calculate_new_regime_tax(income) for income in incomes]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = calculate_batch(incomes)
+    batch_time = time.perf_counter() - start
+
+    assert (result["old_tax"].to_numpy() == np.array(old_loop)).all()
+    assert (result["new_tax"].to_numpy() == np.array(new_loop)).all()
+
+    print(f"Employees: {employees:,}")
+    print(f"Scalar loop : {loop_time:.3f}s")
+    print(f"Batch engine: {batch_time:.3f}s")
+    print(f"Speedup     : {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from batch_tax import calculate_batch
+from parallel_tax import ParallelTaxExecutor
+
+
+def run_benchmark(employees=5000000, max_workers=None, seed=42):
+    """
+    Times ParallelTaxExecutor for 1..N workers against the single-process
+    batch engine, and checks that every run matches it exactly.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = np.random.default_rng(seed)
+    incomes = rng.integers(200000, 5000000, size=employees).astype(float)
+
+    start = time.perf_counter()
+    expected = calculate_batch(incomes)
+    batch_time = time.perf_counter() - start
+
+    print(f"Employees: {employees:,}")
+    print(f"Single process batch: {batch_time:.3f}s")
+
+    for workers in range(1, max_workers + 1):
+        with ParallelTaxExecutor(workers=workers) as executor:
+            executor.calculate(incomes[:workers])  # warm up the worker processes
+            start = time.perf_counter()
+            result = executor.calculate(incomes)
+            elapsed = time.perf_counter() - start
+
+        assert result.equals(expected)
+        print(f"{workers:>2} worker(s): {elapsed:.3f}s  ({batch_time / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    run_benchmark(max_workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,143 @@
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from batch_tax import _as_incomes, _regime_tax, _result_frame
+from slab_tables import DEFAULT_FY, get_regime
+
+
+# Per-row output columns written by the workers, in this order.
+OUTPUT_COLUMNS = [
+    ("old_tax", np.int64), ("old_rebate", np.float64), ("old_cess", np.float64),
+    ("new_tax", np.int64), ("new_rebate", np.float64), ("new_cess", np.float64),
+]
+
+
+def _fill_shard(incomes, outputs, start, stop, fy):
+    """Computes both regimes for incomes[start:stop] into the same rows of outputs."""
+    shard = incomes[start:stop]
+    results = (
+        _regime_tax(shard, get_regime(fy, "old"))
+        + _regime_tax(shard, get_regime(fy, "new"))
+    )
+    for array, values in zip(outputs, results):
+        array[start:stop] = values
+
+
+def _work_on_shard(input_name, output_names, rows, start, stop, fy):
+    """
+    Runs in a worker process.
+    Reads incomes[start:stop] from shared memory and writes the results
+    into the same row range of the output blocks, so nothing is pickled
+    except the block names and the range.
+    """
+    dtypes = [np.float64] + [dtype for _, dtype in OUTPUT_COLUMNS]
+    blocks, views = [], []
+    try:
+        for name, dtype in zip([input_name] + list(output_names), dtypes):
+            blocks.append(shared_memory.SharedMemory(name=name))
+            views.append(np.ndarray((rows,), dtype=dtype, buffer=blocks[-1].buf))
+        _fill_shard(views[0], views[1:], start, stop, fy)
+    except BaseException as exc:
+        # The traceback's frames still hold slices of the shared buffers;
+        # drop them so close() below cannot fail and hide this exception
+        traceback.clear_frames(exc.__traceback__)
+        raise
+    finally:
+        # A block can only be closed once no array views its buffer
+        views.clear()
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+class ParallelTaxExecutor:
+    """
+    Computes calculate_batch results across several processes.
+
+    ▶ The input is split into contiguous row ranges, one or more per worker.
+    ▶ Incomes and results live in shared memory blocks; workers only
+      receive block names and row ranges.
+    ▶ Every shard writes to its own rows, so results come back in input order.
+
+    Keep one executor open across many calls (for example with a `with`
+    block) so the worker processes are started only once.
+    """
+
+    def __init__(self, workers=None, fy=DEFAULT_FY, shards_per_worker=2):
+        self.workers = workers or os.cpu_count() or 1
+        self.fy = fy
+        self.shards_per_worker = shards_per_worker
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.shutdown()
+
+    def _shards(self, rows):
+        count = min(rows, self.workers * self.shards_per_worker) or 1
+        edges = np.linspace(0, rows, count + 1, dtype=np.int64)
+        return list(zip(edges[:-1], edges[1:]))
+
+    def calculate(self, incomes):
+        """Same input and output as batch_tax.calculate_batch."""
+        incomes, index = _as_incomes(incomes)
+        rows = len(incomes)
+        if rows == 0:
+            empty = np.zeros(0)
+            return _result_frame(incomes, (empty.astype(np.int64), empty, empty),
+                                 (empty.astype(np.int64), empty, empty), index)
+
+        blocks = []
+        try:
+            input_block = shared_memory.SharedMemory(create=True, size=incomes.nbytes)
+            blocks.append(input_block)
+            np.ndarray((rows,), dtype=np.float64, buffer=input_block.buf)[:] = incomes
+
+            output_blocks = []
+            for _, dtype in OUTPUT_COLUMNS:
+                block = shared_memory.SharedMemory(
+                    create=True, size=rows * np.dtype(dtype).itemsize
+                )
+                blocks.append(block)
+                output_blocks.append(block)
+
+            futures = [
+                self.pool.submit(
+                    _work_on_shard, input_block.name,
+                    [block.name for block in output_blocks],
+                    rows, int(start), int(stop), self.fy,
+                )
+                for start, stop in self._shards(rows)
+            ]
+            for future in futures:
+                future.result()
+
+            # Copy out of shared memory before the blocks are released
+            results = [
+                np.ndarray((rows,), dtype=dtype, buffer=block.buf).copy()
+                for block, (_, dtype) in zip(output_blocks, OUTPUT_COLUMNS)
+            ]
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return _result_frame(incomes, tuple(results[:3]), tuple(results[3:]), index)
+
+
+def calculate_parallel(incomes, workers=None, fy=DEFAULT_FY):
+    """
+    One-off parallel version of calculate_batch.
+    Starts and stops its own process pool; use ParallelTaxExecutor for repeated calls.
+    """
+    with ParallelTaxExecutor(workers=workers, fy=fy) as executor:
+        return executor.calculate(incomes)
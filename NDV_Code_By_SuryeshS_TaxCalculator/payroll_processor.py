@@ -0,0 +1,177 @@
+import argparse
+import io
+import itertools
+import json
+import os
+import time
+
+import pandas as pd
+
+from batch_tax import calculate_batch
+from parallel_tax import ParallelTaxExecutor
+from slab_tables import DEFAULT_FY
+
+
+def _load_checkpoint(path):
+    if not os.path.exists(path):
+        return {"rows_done": 0, "chunks_done": 0, "input_bytes": 0, "output_bytes": 0}
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def _save_checkpoint(path, checkpoint):
+    # Write beside the real file and rename, so a crash never leaves half a checkpoint
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_path, path)
+
+
+def _read_chunks(input_csv, checkpoint, chunk_size, usecols):
+    """
+    Yields (chunk, input byte offset just past it).
+    The file is read chunk_size lines at a time in binary mode, so a resumed
+    run seeks straight to checkpoint["input_bytes"] instead of skipping rows.
+    Fields must not contain line breaks (true of id / CTC / bonus files).
+    """
+    with open(input_csv, "rb") as file:
+        header = file.readline()
+        names = pd.read_csv(io.BytesIO(header), nrows=0).columns
+        if checkpoint["input_bytes"]:
+            file.seek(checkpoint["input_bytes"])
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if not lines:
+                return
+            chunk = pd.read_csv(io.BytesIO(b"".join(lines)), header=None, names=names, usecols=usecols)
+            yield chunk, file.tell()
+
+
+def _write_csv_chunk(result, output, checkpoint):
+    """
+    Appends one chunk to the output CSV.
+    Anything past the last checkpointed byte is from an unfinished chunk and is cut off first.
+    """
+    mode = "r+b" if os.path.exists(output) else "wb"
+    with open(output, mode) as file:
+        file.truncate(checkpoint["output_bytes"])
+        file.seek(checkpoint["output_bytes"])
+        result.to_csv(file, index=False, header=checkpoint["chunks_done"] == 0)
+        return file.tell()
+
+
+def _write_parquet_chunk(result, output, checkpoint):
+    """
+    Writes one chunk as its own part file inside the output directory.
+    Part names follow the chunk number, so a resumed run simply overwrites an unfinished part.
+    """
+    os.makedirs(output, exist_ok=True)
+    part = os.path.join(output, f"part-{checkpoint['chunks_done']:05d}.parquet")
+    result.to_parquet(part, index=False)
+    return 0
+
+
+def process_payroll(input_csv, output, chunk_size=100000, fy=DEFAULT_FY,
+                    output_format="csv", checkpoint_path=None,
+                    id_col="id", ctc_col="ctc", bonus_col="bonus", workers=1):
+    """
+    Streams an employee CSV (id, CTC, bonus) through the batch tax engine.
+
+    ▶ Reads chunk_size rows at a time, so peak memory depends on the chunk
+      size and not on the number of rows in the file.
+    ▶ After each chunk is written, progress is stored in a checkpoint file.
+      Running again with the same arguments resumes after the last
+      completed chunk.
+    ▶ workers > 1 spreads each chunk over a ParallelTaxExecutor process pool.
+    ▶ A blank CTC or bonus cell counts as 0 (no bonus, no CTC); the count
+      of such rows is printed, and the output shows the 0 that was used.
+    ▶ Returns the number of rows processed in this run.
+    """
+    if checkpoint_path is None:
+        checkpoint_path = output.rstrip("/\\") + ".checkpoint.json"
+    write_chunk = _write_parquet_chunk if output_format == "parquet" else _write_csv_chunk
+
+    checkpoint = _load_checkpoint(checkpoint_path)
+    if checkpoint["rows_done"]:
+        print(f"Resuming after {checkpoint['rows_done']:,} rows.")
+
+    reader = _read_chunks(input_csv, checkpoint, chunk_size, [id_col, ctc_col, bonus_col])
+
+    executor = ParallelTaxExecutor(workers=workers, fy=fy) if workers > 1 else None
+    rows_this_run = 0
+    blank_rows = 0
+    start = time.perf_counter()
+
+    try:
+        for chunk, input_bytes in reader:
+            pay = chunk[[ctc_col, bonus_col]]
+            blank = pay.isna().any(axis=1)
+            if blank.any():
+                blank_rows += int(blank.sum())
+                for col in (ctc_col, bonus_col):
+                    filled = chunk[col].fillna(0)
+                    # Whole numbers stay integers, as read_csv gives them in a chunk without blanks
+                    chunk[col] = filled.astype("int64") if (filled % 1 == 0).all() else filled
+            incomes = chunk[ctc_col] + chunk[bonus_col]
+            if executor is not None:
+                taxes = executor.calculate(incomes)
+            else:
+                taxes = calculate_batch(incomes, fy=fy)
+            result = pd.concat(
+                [chunk[[id_col, ctc_col, bonus_col]], taxes.drop(columns="income")], axis=1
+            )
+
+            checkpoint["output_bytes"] = write_chunk(result, output, checkpoint)
+            checkpoint["rows_done"] += len(chunk)
+            checkpoint["input_bytes"] = input_bytes
+            checkpoint["chunks_done"] += 1
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+            rows_this_run += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"Processed {checkpoint['rows_done']:,} rows "
+                  f"({rows_this_run / elapsed:,.0f} rows/sec)")
+    finally:
+        if executor is not None:
+            executor.close()
+
+    elapsed = time.perf_counter() - start
+    if blank_rows:
+        print(f"⚠️ {blank_rows:,} rows had a blank CTC or bonus, counted as 0.")
+    if rows_this_run:
+        print(f"Done: {rows_this_run:,} rows in {elapsed:.2f}s "
+              f"({rows_this_run / elapsed:,.0f} rows/sec)")
+    else:
+        print("Nothing to process. Input already fully processed.")
+
+    return rows_this_run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compute old and new regime tax for every employee in a CSV."
+    )
+    parser.add_argument("input", help="Employee CSV with id, CTC and bonus columns")
+    parser.add_argument("output", help="Output CSV file, or directory for Parquet parts")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--fy", default=DEFAULT_FY)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes per chunk (default: 1, no pool)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--id-col", default="id")
+    parser.add_argument("--ctc-col", default="ctc")
+    parser.add_argument("--bonus-col", default="bonus")
+    args = parser.parse_args(argv)
+
+    process_payroll(
+        args.input, args.output,
+        chunk_size=args.chunk_size, fy=args.fy, output_format=args.format,
+        checkpoint_path=args.checkpoint,
+        id_col=args.id_col, ctc_col=args.ctc_col, bonus_col=args.bonus_col,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+from bisect import bisect_left
+from functools import lru_cache
+
+from slab_tables import DEFAULT_FY, get_regime
+
+
+class PiecewiseTax:
+    """
+    The total tax of one regime as a piecewise-linear function of total income.
+
+    ▶ edges[i] .. edges[i + 1] is segment i (left-open, right-closed, like
+      the "≤" checks in the calculators); the last segment is open-ended.
+    ▶ On segment i: tax = values[i] + slopes[i] * (income - edges[i]),
+      before rounding. Below edges[0] the tax is zero.
+    ▶ slab_rates[i] is the nominal slab rate without cess.
+
+    Jumps (such as losing the 87A rebate just above its limit) fall on edges.
+    """
+
+    def __init__(self, regime, section_80c=None, hra_exemption=0):
+        self.regime = regime
+        self.section_80c = section_80c
+        self.hra_exemption = hra_exemption
+
+        # Total income at which taxable income is zero
+        offset = -regime.taxable_income(0, section_80c, hra_exemption)
+
+        taxable_edges = set(lower for lower in regime.lowers if lower > 0)
+        taxable_edges.add(regime.rebate_limit)
+        # Inside the rebate band the tax stays at zero until slab tax exceeds the rebate
+        for i, lower in enumerate(regime.lowers):
+            if regime.rates[i] and regime.base_tax[i] < regime.rebate:
+                crossing = lower + (regime.rebate - regime.base_tax[i]) / regime.rates[i]
+                if crossing < regime.rebate_limit:
+                    taxable_edges.add(crossing)
+        taxable_edges = [0] + sorted(edge for edge in taxable_edges if edge > 0)
+
+        self.edges = [offset + edge for edge in taxable_edges]
+        self.values = []
+        self.slopes = []
+        self.slab_rates = []
+        for i, edge in enumerate(self.edges):
+            # Sample strictly inside the segment so the "≤" boundaries don't matter
+            if i + 1 < len(self.edges):
+                width = self.edges[i + 1] - edge
+            else:
+                width = 2.0
+            sample = edge + width / 2
+            sample_tax = self._direct_tax(sample)
+            taxable = regime.taxable_income(sample, section_80c, hra_exemption)
+            slab_rate = regime.rates[bisect_left(regime.lowers, taxable) - 1]
+            # Fully rebated segments stay flat at zero
+            slope = slab_rate * (1 + regime.cess_rate) if sample_tax else 0.0
+            self.slopes.append(slope)
+            self.values.append(sample_tax - slope * (sample - edge))
+            self.slab_rates.append(slab_rate)
+
+    def _direct_tax(self, income):
+        return self.regime.total_tax(income, self.section_80c, self.hra_exemption)
+
+    def _segment(self, income):
+        return bisect_left(self.edges, income) - 1
+
+    def tax(self, income):
+        """Total tax (after rebate and cess, before rounding) in O(log n)."""
+        i = self._segment(income)
+        if i < 0:
+            return 0.0
+        return self.values[i] + self.slopes[i] * (income - self.edges[i])
+
+    def marginal_rate(self, income):
+        """
+        Returns (effective, slab) marginal rates at this income.
+        effective includes cess and rebate effects; slab is the nominal rate.
+        """
+        i = self._segment(income)
+        if i < 0:
+            return 0.0, 0.0
+        return self.slopes[i], self.slab_rates[i]
+
+
+class RegimeComparison:
+    """
+    Old vs new regime for one financial year and deduction profile.
+
+    ▶ break_even: list of (income, winner) where the cheaper regime changes;
+      winner is "Old", "New" or "Same" for incomes just above that point.
+    """
+
+    def __init__(self, fy, section_80c, hra_exemption):
+        self.fy = fy
+        self.old = PiecewiseTax(get_regime(fy, "old"), section_80c, hra_exemption)
+        self.new = PiecewiseTax(get_regime(fy, "new"), section_80c, hra_exemption)
+        self.break_even = self._find_break_even()
+        self._break_even_incomes = [income for income, _ in self.break_even]
+
+    def _difference(self, income):
+        return self.old.tax(income) - self.new.tax(income)
+
+    def _winner(self, income):
+        difference = self._difference(income)
+        if abs(difference) < 1e-6:
+            return "Same"
+        return "New" if difference > 0 else "Old"
+
+    def _find_break_even(self):
+        edges = sorted(set(self.old.edges + self.new.edges))
+        points = list(edges)
+
+        # Within a segment both taxes are linear, so their difference crosses zero at most once
+        for i, start in enumerate(edges):
+            end = edges[i + 1] if i + 1 < len(edges) else start + 1e12
+            left = start + (end - start) / 4
+            right = start + (end - start) / 2
+            d_left = self._difference(left)
+            slope = (self._difference(right) - d_left) / (right - left)
+            if slope:
+                root = left - d_left / slope
+                if start < root < end:
+                    points.append(root)
+        points.sort()
+
+        break_even = []
+        previous = "Same"
+        for i, point in enumerate(points):
+            after = points[i + 1] if i + 1 < len(points) else point + 2.0
+            winner = self._winner((point + after) / 2)
+            if winner != previous:
+                break_even.append((point, winner))
+                previous = winner
+        return break_even
+
+    def better_regime(self, income):
+        """Returns "Old", "New" or "Same" at this income via binary search over break_even."""
+        i = bisect_left(self._break_even_incomes, income) - 1
+        return self.break_even[i][1] if i >= 0 else "Same"
+
+    def new_regime_wins_from(self):
+        """Lowest income above which the new regime is strictly cheaper, or None."""
+        for income, winner in self.break_even:
+            if winner == "New":
+                return income
+        return None
+
+
+@lru_cache(maxsize=256)
+def _comparison(fy, section_80c, hra_exemption):
+    return RegimeComparison(fy, section_80c, hra_exemption)
+
+
+def get_comparison(fy=DEFAULT_FY, section_80c=None, hra_exemption=0):
+    """
+    Returns the precomputed RegimeComparison for a deduction profile.
+
+    ▶ section_80c: 80C investment (None claims the full limit)
+    ▶ hra_exemption: amount from calculate_hra_exemption in the old regime
+
+    Profiles are cached with LRU eviction, so repeat queries from the
+    portal reuse the same tables instead of rebuilding them.
+    """
+    return _comparison(fy, section_80c, hra_exemption)
+
+
+def tax_at(income, regime="new", fy=DEFAULT_FY, section_80c=None, hra_exemption=0):
+    comparison = get_comparison(fy, section_80c, hra_exemption)
+    return (comparison.old if regime == "old" else comparison.new).tax(income)
+
+
+def marginal_rate(income, regime="new", fy=DEFAULT_FY, section_80c=None, hra_exemption=0):
+    comparison = get_comparison(fy, section_80c, hra_exemption)
+    return (comparison.old if regime == "old" else comparison.new).marginal_rate(income)
+
+
+def break_even_points(fy=DEFAULT_FY, section_80c=None, hra_exemption=0):
+    return get_comparison(fy, section_80c, hra_exemption).break_even
@@ -0,0 +1,130 @@
+from bisect import bisect_left
+from functools import lru_cache
+
+
+# Regime definitions keyed by financial year.
+#
+# ▶ slabs: (lower edge, rate) pairs in ascending order; the last slab is open-ended
+# ▶ standard_deduction / max_80c: deductions taken off total income
+# ▶ allows_hra: whether an HRA exemption can be claimed
+# ▶ rebate_limit / rebate: Section 87A, applied when taxable income ≤ limit
+# ▶ cess_rate: Health & Education Cess on the tax after rebate
+REGIMES = {
+    "FY2024-25": {
+        "old": {
+            "slabs": [(0, 0.0), (250000, 0.05), (500000, 0.2), (1000000, 0.3)],
+            "standard_deduction": 50000,
+            "max_80c": 150000,
+            "allows_hra": True,
+            "rebate_limit": 500000,
+            "rebate": 12500,
+            "cess_rate": 0.04,
+        },
+        "new": {
+            "slabs": [
+                (0, 0.0), (300000, 0.05), (600000, 0.1),
+                (900000, 0.15), (1200000, 0.2), (1500000, 0.3),
+            ],
+            "standard_deduction": 75000,
+            "max_80c": 0,
+            "allows_hra": False,
+            "rebate_limit": 700000,
+            "rebate": 25000,
+            "cess_rate": 0.04,
+        },
+    },
+    "FY2022-23": {
+        "old": {
+            "slabs": [(0, 0.0), (250000, 0.05), (500000, 0.2), (1000000, 0.3)],
+            "standard_deduction": 50000,
+            "max_80c": 150000,
+            "allows_hra": True,
+            "rebate_limit": 500000,
+            "rebate": 12500,
+            "cess_rate": 0.04,
+        },
+        "new": {
+            "slabs": [
+                (0, 0.0), (250000, 0.05), (500000, 0.1), (750000, 0.15),
+                (1000000, 0.2), (1250000, 0.25), (1500000, 0.3),
+            ],
+            "standard_deduction": 0,
+            "max_80c": 0,
+            "allows_hra": False,
+            "rebate_limit": 500000,
+            "rebate": 12500,
+            "cess_rate": 0.04,
+        },
+    },
+}
+
+DEFAULT_FY = "FY2024-25"
+
+
+class CompiledRegime:
+    """
+    A regime definition compiled into prefix arrays.
+
+    ▶ lowers[i] / rates[i]: lower edge and rate of slab i
+    ▶ base_tax[i]: tax already due at lowers[i]
+
+    So slab tax = base_tax[i] + (taxable_income - lowers[i]) * rates[i],
+    found with one binary search instead of an if/elif chain.
+    """
+
+    def __init__(self, fy, regime, definition):
+        self.fy = fy
+        self.regime = regime
+        self.lowers = [lower for lower, _ in definition["slabs"]]
+        self.rates = [rate for _, rate in definition["slabs"]]
+        self.standard_deduction = definition["standard_deduction"]
+        self.max_80c = definition["max_80c"]
+        self.allows_hra = definition["allows_hra"]
+        self.rebate_limit = definition["rebate_limit"]
+        self.rebate = definition["rebate"]
+        self.cess_rate = definition["cess_rate"]
+
+        self.base_tax = [0.0]
+        for i in range(1, len(self.lowers)):
+            width = self.lowers[i] - self.lowers[i - 1]
+            self.base_tax.append(self.base_tax[-1] + width * self.rates[i - 1])
+
+    def taxable_income(self, income, section_80c=None, hra_exemption=0):
+        """Income after standard deduction, 80C (full limit if not given) and HRA."""
+        if section_80c is None:
+            section_80c = self.max_80c
+        deductions = self.standard_deduction + min(section_80c, self.max_80c)
+        if self.allows_hra:
+            deductions += hra_exemption
+        return income - deductions
+
+    def slab_tax(self, taxable_income):
+        """Tax from the slabs alone, before rebate and cess."""
+        if taxable_income <= 0:
+            return 0.0
+        i = bisect_left(self.lowers, taxable_income) - 1
+        return self.base_tax[i] + (taxable_income - self.lowers[i]) * self.rates[i]
+
+    def total_tax(self, income, section_80c=None, hra_exemption=0):
+        """Final tax after deductions, 87A rebate and cess (not rounded)."""
+        taxable_income = self.taxable_income(income, section_80c, hra_exemption)
+        if taxable_income <= 0:
+            return 0.0
+
+        tax = self.slab_tax(taxable_income)
+        if taxable_income <= self.rebate_limit:
+            tax = max(0, tax - self.rebate)
+        return tax + tax * self.cess_rate
+
+
+@lru_cache(maxsize=None)
+def get_regime(fy=DEFAULT_FY, regime="new"):
+    """
+    Returns the compiled table for a financial year and regime ("old"/"new").
+    Each table is compiled once and reused on every later call.
+    """
+    try:
+        definition = REGIMES[fy][regime]
+    except KeyError:
+        raise ValueError(f"No slab table for {fy} / {regime} regime.")
+    return CompiledRegime(fy, regime, definition)
@@ -1,22 +1,30 @@
 # Loan Dataset Analysis
+import os
+import sys
 import pandas as pd
 import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
 from scipy.stats import ttest_ind
 
+# preprocessing.py (shared cleaning pipeline) lives at the repository root
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from preprocessing import Pipeline, Impute, state_path
+
 # Load dataset
 loan_path = 'loan_data.csv'
 loan_df = pd.read_csv(loan_path)
 
 # Handle missing values
-loan_df['Gender'].fillna(loan_df['Gender'].mode()[0], inplace=True)
-loan_df['Married'].fillna(loan_df['Married'].mode()[0], inplace=True)
-loan_df['Dependents'].fillna('0', inplace=True)
-loan_df['Self_Employed'].fillna(loan_df['Self_Employed'].mode()[0], inplace=True)
-loan_df['Credit_History'].fillna(loan_df['Credit_History'].mode()[0], inplace=True)
-loan_df['LoanAmount'].fillna(loan_df['LoanAmount'].median(), inplace=True)
-loan_df['Loan_Amount_Term'].fillna(loan_df['Loan_Amount_Term'].mode()[0], inplace=True)
+# Modes and the median are fitted once and saved next to the data, in
+# loan_data.loan_imputer.json; new applications are filled with the same values
+# instead of refitting
+imputer = Pipeline([
+    Impute(['Gender', 'Married', 'Self_Employed', 'Credit_History', 'Loan_Amount_Term'], strategy='mode'),
+    Impute(['Dependents'], strategy='constant', value='0'),
+    Impute(['LoanAmount'], strategy='median'),
+], state_path=state_path(loan_path, 'loan_imputer'))
+loan_df = imputer.process(loan_df)
 
 # Display dataset summary
 print("Loan Data Summary:\n")
@@ -1,8 +1,16 @@
 # app.py
 
+import os
+import sys
 import streamlit as st
 import pandas as pd
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from chart_lod import DEFAULT_MAX_POINTS, LODCache, downsample_frame
+from columnar_source import ColumnarSource
+from covid_cube import CovidCube
+from summary_sketch import SketchSummary
+
 # -----------------------------------
 # Page Configuration and Title
 # -----------------------------------
@@ -13,41 +21,59 @@ st.markdown("Explore global COVID-19 statistics with interactive filters and vis
 # -----------------------------------
 # Load Dataset
 # -----------------------------------
-@st.cache_data
-def load_data():
-    df = pd.read_csv("data/covid_data.csv")
+DATA_PATH = "data/covid_data.csv"
+CUBE_COLUMNS = ['location', 'date', 'total_cases', 'new_cases', 'total_deaths', 'new_deaths']
+
+# Built once per data refresh (the file's modification time is part of the
+# cache key): per-country sorted dates, totals and daily counts, so a rerun
+# never scans the whole dataset
+@st.cache_resource
+def load_cube(path, modified):
+    # The CSV is converted once to a memory-mapped Arrow file; only the
+    # columns the dashboard shows are read from it
+    df = ColumnarSource(path).to_pandas(columns=CUBE_COLUMNS)
     df['date'] = pd.to_datetime(df['date'])  # Ensure date column is parsed
-    return df
+    return CovidCube.from_owid(df)
+
+# Per-country and whole-dataset sketches of every column, also built once per
+# data refresh; each summary table is computed once from them and then reused
+# on every rerun instead of running describe()
+@st.cache_resource
+def load_summary(path, modified):
+    return SketchSummary(ColumnarSource(path).to_pandas(), by='location')
+
+# Downsampled chart series per (country, dates, data version)
+@st.cache_resource
+def lod_cache():
+    return LODCache()
 
-df = load_data()
+modified = os.path.getmtime(DATA_PATH)
+cube = load_cube(DATA_PATH, modified)
+summary = load_summary(DATA_PATH, modified)
 
 # -----------------------------------
 # Sidebar Filters
 # -----------------------------------
 st.sidebar.header("Filter the Data")
 
-# Unique country list
-country_list = df['location'].dropna().unique().tolist()
-country_list.sort()
+# Unique country list (sorted)
+country_list = cube.countries
 
 # Country selection
 selected_country = st.sidebar.selectbox("Select a Country", country_list, index=country_list.index("India") if "India" in country_list else 0)
 
-# Filter for selected country
-country_df = df[df['location'] == selected_country]
+# Look up the selected country
+series = cube[selected_country]
 
 # Date range slider based on selected country's data
-min_date = country_df['date'].min()
-max_date = country_df['date'].max()
+min_date = series.first_date
+max_date = series.last_date
 
 selected_dates = st.sidebar.date_input("Select Date Range", [min_date, max_date], min_value=min_date, max_value=max_date)
 
-if len(selected_dates) == 2:
-    start_date, end_date = selected_dates
-    country_df = country_df[
-        (country_df['date'] >= pd.to_datetime(start_date)) &
-        (country_df['date'] <= pd.to_datetime(end_date))
-    ]
+start_date, end_date = selected_dates if len(selected_dates) == 2 else (None, None)
+# Binary search on the country's sorted dates
+country_df = series.frame(start_date, end_date)
 
 # -----------------------------------
 # Show Filtered Data and Metrics
@@ -56,8 +82,8 @@ st.subheader(f"Filtered Data for {selected_country}")
 st.dataframe(country_df[['date', 'total_cases', 'new_cases', 'total_deaths', 'new_deaths']].tail(10))
 
 st.subheader("Key Metrics")
-st.metric("Total Cases", f"{country_df['total_cases'].max():,.0f}")
-st.metric("Total Deaths", f"{country_df['total_deaths'].max():,.0f}")
+st.metric("Total Cases", f"{series.peak('total_cases', start_date, end_date):,.0f}")
+st.metric("Total Deaths", f"{series.peak('total_deaths', start_date, end_date):,.0f}")
 st.metric("New Cases (Latest)", f"{country_df['new_cases'].iloc[-1]:,.0f}")
 st.metric("New Deaths (Latest)", f"{country_df['new_deaths'].iloc[-1]:,.0f}")
 
@@ -65,13 +91,16 @@ st.metric("New Deaths (Latest)", f"{country_df['new_deaths'].iloc[-1]:,.0f}")
 # Raw Dataset (Optional)
 # -----------------------------------
 if st.checkbox("Show Raw Dataset"):
-    st.write(df.head())
+    st.write(cube.head)
 
 # -----------------------------------
-# Full Dataset Summary Stats
+# Summary Stats (merged from the cached sketches)
 # -----------------------------------
 st.subheader("Summary Statistics")
-st.write(df.describe(include='all'))
+st.write(summary.describe())
+
+st.subheader(f"Summary Statistics for {selected_country}")
+st.write(summary.describe({'location': selected_country}))
 
 
 import matplotlib.pyplot as plt
@@ -81,9 +110,14 @@ import matplotlib.pyplot as plt
 # -----------------------------------
 st.subheader(f"Trend Over Time for {selected_country}")
 
+# At most DEFAULT_MAX_POINTS points per line (LTTB keeps the shape of the curve)
+chart_df = lod_cache().get(
+    (selected_country, start_date, end_date, DEFAULT_MAX_POINTS, modified),
+    lambda: downsample_frame(country_df, 'date', ['total_cases', 'total_deaths']))
+
 fig, ax = plt.subplots(figsize=(10, 5))
-ax.plot(country_df['date'], country_df['total_cases'], label='Total Cases', color='blue')
-ax.plot(country_df['date'], country_df['total_deaths'], label='Total Deaths', color='red')
+ax.plot(chart_df['date'], chart_df['total_cases'], label='Total Cases', color='blue')
+ax.plot(chart_df['date'], chart_df['total_deaths'], label='Total Deaths', color='red')
 ax.set_xlabel("Date")
 ax.set_ylabel("Count")
 ax.set_title("Total Cases vs Total Deaths Over Time")
@@ -98,8 +132,8 @@ st.subheader(f"Total Comparison for {selected_country}")
 bar_data = {
     "Metric": ["Total Cases", "Total Deaths", "New Cases", "New Deaths"],
     "Value": [
-        country_df['total_cases'].max(),
-        country_df['total_deaths'].max(),
+        series.peak('total_cases', start_date, end_date),
+        series.peak('total_deaths', start_date, end_date),
         country_df['new_cases'].iloc[-1],
         country_df['new_deaths'].iloc[-1]
     ]
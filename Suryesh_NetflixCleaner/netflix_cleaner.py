@@ -5,6 +5,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.preprocessing import LabelEncoder
+from netflix_pipeline import CleaningPipeline, standard_steps
+from netflix_features import top_n_or_other
 import warnings
 warnings.filterwarnings("ignore")
 
@@ -38,23 +40,13 @@ print(df.dtypes, end="\n\n")
 
 # Phase 2: Data Cleaning and Preprocessing
 
-# Convert 'date_added' to datetime, handle leading spaces and errors
-df['date_added'] = pd.to_datetime(df['date_added'].str.strip(), errors='coerce')
-
-# Identify most common values to use for filling missing values
-most_common_country = df['country'].mode()[0]
-most_common_rating = df['rating'].mode()[0]
-
-# Fill missing 'director' and 'cast' with 'Unknown'
-df['director'] = df['director'].fillna('Unknown')
-df['cast'] = df['cast'].fillna('Unknown')
-
-# Fill missing 'country' and 'rating' with their most frequent values
-df['country'] = df['country'].fillna(most_common_country)
-df['rating'] = df['rating'].fillna(most_common_rating)
-
-# Drop rows where 'duration' is missing (only a few rows)
-df = df.dropna(subset=['duration'])
+# The cleaning rules live in netflix_pipeline.py, so this script and the chunked
+# pipeline for full catalog exports (python netflix_pipeline.py ...) stay identical:
+# - 'date_added' stripped and converted to datetime (errors become NaT)
+# - missing 'director' and 'cast' filled with 'Unknown'
+# - missing 'country' and 'rating' filled with their most frequent values
+# - rows without 'duration' dropped (only a few rows)
+df = CleaningPipeline(standard_steps()).clean_frame(df)
 
 # Confirm that all missing values are handled
 print("After Cleaning - Remaining Missing Values:")
@@ -150,8 +142,7 @@ df_ml['type_encoded'] = le.fit_transform(df_ml['type'])
 df_ml['rating_encoded'] = le.fit_transform(df_ml['rating'])
 
 # Limit country encoding to top 10 countries, group others as 'Other'
-top_10_countries = df_ml['country'].value_counts().index[:10]
-df_ml['country_cleaned'] = df_ml['country'].apply(lambda x: x if x in top_10_countries else 'Other')
+df_ml['country_cleaned'] = top_n_or_other(df_ml['country'], n=10, other='Other')
 df_ml['country_encoded'] = le.fit_transform(df_ml['country_cleaned'])
 
 # Show sample of encoded values
@@ -0,0 +1,79 @@
+# netflix_features.py
+
+import numpy as np
+import pandas as pd
+
+
+# Vectorized feature engineering
+#
+# Replacements for the row-wise apply()/lambda code in the cleaning scripts.
+# None of them call Python code once per row:
+#   ▶ every feature is computed once per distinct value (pd.factorize) and
+#     spread back over the rows with the integer codes, so "90 min" or a
+#     title's description is parsed once however many rows repeat it
+#   ▶ the per-value work is done with the .str accessor on the distinct values
+#   ▶ a categorical column (read_csv(dtype="category")) skips the hashing as
+#     well; on plain text columns hashing every row is most of the cost
+#   ▶ top-N bucketing picks the most frequent codes with np.bincount
+
+
+def _codes(values):
+    """Integer code per row (-1 when missing) and the distinct values; a categorical column already has both."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values)
+
+
+def _map_distinct(values, func, missing=np.nan):
+    """func(distinct values) -> array, spread back over every row with the codes."""
+    codes, uniques = _codes(values)
+    result = np.asarray(func(pd.Series(uniques, dtype=object)))
+    return np.append(result, missing)[codes]  # code -1 picks missing
+
+
+def word_counts(text):
+    """
+    Number of whitespace-separated words in each value, as len(str(x).split())
+    counts them: a missing value is the one word "nan", so it counts 1.
+    """
+    counts = _map_distinct(text, lambda u: u.astype(str).str.split().str.len(), missing=1)
+    return pd.Series(counts.astype(np.int64), index=text.index, name=text.name)
+
+
+def top_n_or_other(values, n=10, other="Other"):
+    """
+    Keeps the n most frequent values and replaces the rest (and missing
+    values) with other. Same result as
+        top = values.value_counts().index[:n]
+        values.apply(lambda x: x if x in top else other)
+    """
+    codes, uniques = _codes(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    # Stable sort: ties keep first-seen order, as value_counts() does
+    top = np.argsort(-counts, kind="stable")[:n]
+    keep = np.zeros(len(uniques) + 1, dtype=bool)  # last slot is for code -1 (missing)
+    keep[top] = True
+    labels = np.append(np.asarray(uniques, dtype=object), other)
+    labels[~keep] = other
+    return pd.Series(labels[codes], index=values.index, name=values.name, dtype=object)
+
+
+def duration_number(duration):
+    """The number in each duration ("90 min" -> 90.0, "2 Seasons" -> 2.0) as float; NaN if there is none."""
+    numbers = _map_distinct(duration, lambda u: u.str.extract(r"(\d+)", expand=False).astype(float))
+    return pd.Series(numbers, index=duration.index, name=duration.name)
+
+
+def parse_duration(duration):
+    """
+    Splits durations into two float columns: duration_minutes for movies
+    ("90 min") and duration_seasons for shows ("2 Seasons"); the other one is NaN.
+    """
+    codes, uniques = _codes(duration)
+    distinct = pd.Series(uniques, dtype=object)
+    number = np.append(distinct.str.extract(r"(\d+)", expand=False).astype(float), np.nan)[codes]
+    is_minutes = np.append(distinct.str.contains("min", regex=False).to_numpy(dtype=bool), False)[codes]
+    return pd.DataFrame({
+        "duration_minutes": np.where(is_minutes, number, np.nan),
+        "duration_seasons": np.where(is_minutes, np.nan, number),
+    }, index=duration.index)
@@ -0,0 +1,191 @@
+# netflix_pipeline.py
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from netflix_features import duration_number, word_counts
+
+# preprocessing.py (shared cleaning steps) lives at the repository root
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from preprocessing import Step, Impute, DropMissing, Dedupe, ParseDates, Derive
+
+
+# Cleaning steps come from preprocessing.py and transform one chunk at a time.
+# Steps that need statistics over the whole file (modes, medians) collect them
+# with streaming counters in pass one (observe), turn them into fill values in
+# finish(), and apply them in pass two.
+
+# Presets matching the cleaning rules of the existing scripts
+
+# Read every column as text except the year, so a chunk whose column happens
+# to be all blank or all numeric gets the same types as every other chunk
+NETFLIX_DTYPES = {
+    "show_id": str, "type": str, "title": str, "director": str, "cast": str,
+    "country": str, "date_added": str, "release_year": "Int64", "rating": str,
+    "duration": str, "listed_in": str, "description": str,
+}
+
+NETFLIX_DATE_FORMAT = "%B %d, %Y"  # "September 25, 2021"
+
+
+def standard_steps():
+    """netflix_cleaner.py: 'Unknown' for people, modes for country/rating, drop rows without duration."""
+    return [
+        ParseDates(["date_added"], NETFLIX_DATE_FORMAT),
+        Impute(["director", "cast"], strategy="constant", value="Unknown"),
+        Impute(["country", "rating"], strategy="mode"),
+        DropMissing(["duration"]),
+    ]
+
+
+def fill_modes_steps():
+    """ass_02.py: modes for every sparse column, then dedupe and add derived columns."""
+    return [
+        Impute(["director", "cast", "country", "date_added", "rating", "duration"], strategy="mode"),
+        DropMissing(["title"]),
+        Dedupe(),
+        ParseDates(["date_added"], NETFLIX_DATE_FORMAT),
+        Derive("year_added", lambda df: df["date_added"].dt.year),
+        Derive("description_word_count", lambda df: word_counts(df["description"])),
+    ]
+
+
+def complete_rows_steps():
+    """NDV_Code_By_Jenila_CleanNetflixDataset/netflix.py: keep only complete, distinct rows."""
+    return [
+        DropMissing(),
+        Dedupe(),
+        ParseDates(["date_added"], NETFLIX_DATE_FORMAT),
+        Derive("duration_minutes", lambda df: duration_number(df["duration"])),
+        Derive("duration_category",
+               lambda df: np.where(df["duration_minutes"] >= 60, "Long", "Short")),
+    ]
+
+
+PRESETS = {
+    "standard": standard_steps,
+    "fill-modes": fill_modes_steps,
+    "complete-rows": complete_rows_steps,
+}
+
+
+class CleaningPipeline:
+    """
+    Two-pass, chunked cleaning of a CSV too large to load at once.
+
+    ▶ Pass one streams the file and lets each step collect its statistics.
+    ▶ Pass two streams it again, applies every step and writes the result.
+    ▶ Only chunk_size rows are in memory at a time, plus each step's counters.
+    ▶ Seconds and rows/sec are recorded per stage (read, each step, write).
+    """
+
+    def __init__(self, steps, chunk_size=100000, dtype=None):
+        self.steps = steps
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.timings = {}  # stage -> [seconds, rows]
+
+    def _timed(self, stage, rows, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timing = self.timings.setdefault(stage, [0.0, 0])
+        timing[0] += time.perf_counter() - start
+        timing[1] += rows
+        return result
+
+    def _chunks(self, input_csv, stage):
+        reader = pd.read_csv(input_csv, chunksize=self.chunk_size, dtype=self.dtype)
+        while True:
+            start = time.perf_counter()
+            chunk = next(reader, None)
+            if chunk is None:
+                return
+            timing = self.timings.setdefault(stage, [0.0, 0])
+            timing[0] += time.perf_counter() - start
+            timing[1] += len(chunk)
+            yield chunk
+
+    def fit(self, input_csv):
+        """Pass one: collect modes, medians and other whole-file statistics."""
+        # Steps after the last one that collects statistics don't affect any fill value
+        fitted = [i for i, step in enumerate(self.steps) if type(step).observe is not Step.observe]
+        if not fitted:
+            return self
+        for chunk in self._chunks(input_csv, "pass 1: read"):
+            for step in self.steps[:fitted[-1] + 1]:
+                rows = len(chunk)
+                if step.in_first_pass:
+                    chunk = self._timed(f"pass 1: {step!r}", rows, step.transform, chunk)
+                elif type(step).observe is not Step.observe:
+                    self._timed(f"pass 1: {step!r}", rows, step.observe, chunk)
+        for step in self.steps:
+            step.finish()
+        return self
+
+    def transform(self, input_csv, output, output_format="parquet"):
+        """Pass two: apply every step chunk by chunk and write the cleaned rows."""
+        if output_format == "parquet":
+            os.makedirs(output, exist_ok=True)
+        rows_out = 0
+        for part, chunk in enumerate(self._chunks(input_csv, "pass 2: read")):
+            for step in self.steps:
+                chunk = self._timed(f"pass 2: {step!r}", len(chunk), step.transform, chunk)
+            if output_format == "parquet":
+                path = os.path.join(output, f"part-{part:05d}.parquet")
+                self._timed("pass 2: write", len(chunk), chunk.to_parquet, path, index=False)
+            else:
+                self._timed("pass 2: write", len(chunk), chunk.to_csv, output,
+                            mode="w" if part == 0 else "a", header=part == 0, index=False)
+            rows_out += len(chunk)
+        return rows_out
+
+    def run(self, input_csv, output, output_format="parquet"):
+        self.fit(input_csv)
+        return self.transform(input_csv, output, output_format)
+
+    def clean_frame(self, df):
+        """Applies the same steps to a DataFrame already in memory (one chunk, both passes)."""
+        first = df.copy()
+        for step in self.steps:
+            if step.in_first_pass:
+                first = step.transform(first)
+            else:
+                step.observe(first)
+        for step in self.steps:
+            step.finish()
+        df = df.copy()
+        for step in self.steps:
+            df = step.transform(df)
+        return df
+
+    def report(self):
+        print(f"{'Stage':<40}{'Seconds':>9}{'Rows/sec':>16}")
+        for stage, (seconds, rows) in self.timings.items():
+            rate = f"{rows / seconds:,.0f}" if seconds else "-"
+            print(f"{stage:<40}{seconds:>9.2f}{rate:>16}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean a Netflix titles CSV in chunks (two passes).")
+    parser.add_argument("input", help="Titles CSV, e.g. data/netflix_titles.csv")
+    parser.add_argument("output", help="Directory for Parquet parts, or a CSV file with --format csv")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="standard")
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    pipeline = CleaningPipeline(PRESETS[args.preset](), chunk_size=args.chunk_size, dtype=NETFLIX_DTYPES)
+    start = time.perf_counter()
+    rows = pipeline.run(args.input, args.output, args.format)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {rows:,} cleaned rows to {args.output} in {elapsed:.2f}s\n")
+    pipeline.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmark_saves.py
+
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from student import Student
+from student_manager import StudentManager
+
+
+def filled_manager(count):
+    manager = StudentManager()
+    for i in range(count):
+        manager.insert(Student(str(i), f"Student{i}", "CSE", "2024", float(i % 101)))
+    return manager
+
+
+def run_benchmark(count=100000, changes=50):
+    """Time per change: saving synchronously after each one vs. the background flusher."""
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "students.json")
+
+        manager = filled_manager(count)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            for i in range(changes):
+                manager.modify(str(i), marks=50.0)
+                manager.save_to_file(filename)
+        sync_ms = (time.perf_counter() - start) / changes * 1000
+
+        manager = filled_manager(count)
+        manager.start_autosave(filename, interval=0.2)
+        latencies = []
+        for i in range(changes):
+            start = time.perf_counter()
+            manager.modify(str(i), marks=50.0)
+            latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.02)  # a user or client pausing between changes
+        latencies.sort()
+        flusher = manager.flusher
+        manager.stop_autosave()
+        summary = flusher.summary()
+
+    print(f"Students: {count:,}, changes: {changes}")
+    print(f"Save after every change:  {sync_ms:8.2f} ms per change")
+    print(f"Background flusher:       {latencies[len(latencies) // 2]:8.3f} ms per change "
+          f"(p99 {latencies[int(len(latencies) * 0.99)]:.1f} ms, max {latencies[-1]:.1f} ms)")
+    print(f"  {summary['saves']} saves for {changes} changes, "
+          f"average {summary['average_ms']:.1f} ms, max {summary['max_ms']:.1f} ms (off the caller's thread)")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,62 @@
+# benchmark_search.py
+
+import random
+import sys
+import time
+
+from name_search import similarity
+from student import Student
+from student_manager import StudentManager
+
+SYLLABLES = ["ra", "vi", "an", "ka", "sh", "ya", "me", "na", "ri", "ta", "su", "de", "pa", "lo", "mi",
+             "jo", "ku", "ne", "ha", "ro", "bi", "ga", "ti", "mo", "le", "dh", "pu", "sa", "ve", "ni",
+             "ar", "em", "ul", "ze", "fa", "go", "in", "bh", "ch", "wa", "or", "ee", "ki", "du", "th"]
+
+
+def make_name(rng):
+    first = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    last = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return f"{first.title()} {last.title()}"
+
+
+def typo(name, rng):
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i + 1:]
+
+
+def timed(function, queries):
+    start = time.perf_counter()
+    for query in queries:
+        function(query)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def run_benchmark(count=200000, queries=50, seed=7):
+    """Times prefix and fuzzy name search against a full linear scan, per query in ms."""
+    rng = random.Random(seed)
+    manager = StudentManager()
+    for i in range(count):
+        manager.insert(Student(str(i), make_name(rng), "CSE", "2024", float(i % 101)))
+    names = [s.name for s in manager.students.values()]
+
+    prefixes = [rng.choice(names)[:3].lower() for _ in range(queries)]
+    misspelled = [typo(rng.choice(names), rng).lower() for _ in range(queries)]
+
+    def scan_prefix(prefix):
+        return [s for s in manager.students.values() if s.name.lower().startswith(prefix)][:10]
+
+    def scan_fuzzy(query):
+        # The linear alternative: score every record's name
+        return sorted(manager.students.values(),
+                      key=lambda s: -similarity(query, s.name.lower()))[:5]
+
+    print(f"Students: {count:,} ({len(manager.search.counts):,} distinct names)")
+    print(f"Prefix  - linear scan: {timed(scan_prefix, prefixes):9.2f} ms   "
+          f"sorted index: {timed(manager.complete_name, prefixes):7.3f} ms")
+    scan_queries = misspelled[:max(1, queries // 10)]
+    print(f"Fuzzy   - linear scan: {timed(scan_fuzzy, scan_queries):9.2f} ms   "
+          f"trigram index: {timed(manager.similar_names, misspelled):6.3f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
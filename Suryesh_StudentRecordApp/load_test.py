@@ -0,0 +1,97 @@
+# load_test.py
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+async def client(host, port, deadline, rate, latencies, student_ids, write_ratio):
+    """One keep-alive connection sending requests at a fixed rate until the deadline."""
+    reader, writer = await asyncio.open_connection(host, port)
+    interval = 1 / rate
+    next_send = time.perf_counter()
+    try:
+        while time.perf_counter() < deadline:
+            student_id = random.choice(student_ids)
+            if random.random() < write_ratio:
+                body = json.dumps({"marks": round(random.uniform(0, 100), 1)}).encode()
+                head = f"PUT /students/{student_id} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+            else:
+                body = b""
+                head = f"GET /students/{student_id} HTTP/1.1\r\n\r\n"
+
+            start = time.perf_counter()
+            writer.write(head.encode() + body)
+            await writer.drain()
+
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+
+            next_send += interval
+            await asyncio.sleep(max(0, next_send - time.perf_counter()))
+    finally:
+        writer.close()
+
+
+async def seed(host, port, count):
+    """Adds count students through the API so the test has records to read."""
+    reader, writer = await asyncio.open_connection(host, port)
+    for i in range(count):
+        body = json.dumps({"student_id": str(900000 + i), "name": "Load", "branch": "CSE",
+                           "year": "2024", "marks": 50}).encode()
+        writer.write(f"POST /students HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+    writer.close()
+    return [str(900000 + i) for i in range(count)]
+
+
+async def run(host, port, rate, clients, duration, students, write_ratio):
+    student_ids = await seed(host, port, students)
+    latencies = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        client(host, port, deadline, rate / clients, latencies, student_ids, write_ratio)
+        for _ in range(clients)
+    ))
+
+    latencies.sort()
+    count = len(latencies)
+    print(f"Requests: {count:,} in {duration}s ({count / duration:,.0f} req/s)")
+    for label, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("max", 1.0)):
+        value = latencies[min(count - 1, int(fraction * count))]
+        print(f"{label}: {value * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for server.py (start the server first)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--rate", type=float, default=2000, help="Total requests per second")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(run(args.host, args.port, args.rate, args.clients, args.duration,
+                    args.students, args.write_ratio))
+
+
+if __name__ == "__main__":
+    main()
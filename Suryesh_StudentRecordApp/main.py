@@ -1,5 +1,7 @@
 # main.py
 
+import argparse
+
 from student import Student
 from student_manager import StudentManager
 
@@ -33,7 +35,15 @@ def get_student_input():
     return Student(student_id, name, branch, year, marks)
 
 def main():
+    parser = argparse.ArgumentParser(description="Student Management System")
+    parser.add_argument("--autosave", type=float, metavar="SECONDS",
+                        help="load students.json at start and save changes to it in the background every SECONDS")
+    args = parser.parse_args()
+
     manager = StudentManager()
+    if args.autosave:
+        manager.load_from_file()
+        manager.start_autosave(interval=args.autosave)
 
     while True:
         print("\n====== STUDENT MANAGEMENT SYSTEM ======")
@@ -47,9 +57,12 @@ def main():
         print("8. Average Marks")
         print("9. Save to File")
         print("10. Load from File")
-        print("11. Exit")
+        print("11. Search by Branch")
+        print("12. Search by Year")
+        print("13. Search by Marks Range")
+        print("14. Exit")
 
-        choice = input("Enter your choice (1-11): ")
+        choice = input("Enter your choice (1-14): ")
 
         if choice == '1':
             student = get_student_input()
@@ -78,10 +91,24 @@ def main():
         elif choice == '10':
             manager.load_from_file()
         elif choice == '11':
+            branch = input("Enter Branch to search: ")
+            manager.search_by_branch(branch)
+        elif choice == '12':
+            year = input("Enter Year to search: ")
+            manager.search_by_year(year)
+        elif choice == '13':
+            low = input("Enter lowest marks: ")
+            high = input("Enter highest marks: ")
+            if low.replace('.', '', 1).isdigit() and high.replace('.', '', 1).isdigit():
+                manager.search_by_marks(float(low), float(high))
+            else:
+                print("❌ Marks must be a number.")
+        elif choice == '14':
+            manager.stop_autosave()
             print("👋 Exiting Student Management System. Goodbye!")
             break
         else:
-            print("❌ Invalid choice. Please enter a number between 1 and 11.")
+            print("❌ Invalid choice. Please enter a number between 1 and 14.")
 
 if __name__ == "__main__":
     main()
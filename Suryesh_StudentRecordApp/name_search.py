@@ -0,0 +1,102 @@
+# name_search.py
+
+import math
+from collections import Counter
+
+from student_index import SortedEntries
+
+
+def trigrams(key):
+    """Three-letter pieces of a name, padded so the start and end count too."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a, b):
+    """Jaccard similarity of the trigram sets of two names (0.0 to 1.0)."""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+class NameSearch:
+    """
+    Autocomplete and typo-tolerant search over distinct case-folded names.
+
+    - prefixes: names in sorted order, so every name starting with a prefix
+      sits in one contiguous run found by binary search
+    - grams:    trigram -> set of names containing it
+
+    Only distinct names are indexed (many students share a name); StudentIndex
+    maps each name back to its student ids. StudentManager calls add() and
+    remove() alongside the other indexes, so the search stays in sync with
+    every add/update/delete.
+    """
+
+    def __init__(self):
+        self.counts = {}  # name -> number of students with it
+        self.gram_counts = {}  # name -> size of its trigram set
+        self.prefixes = SortedEntries()
+        self.grams = {}
+
+    def add(self, key):
+        if key in self.counts:
+            self.counts[key] += 1
+            return
+        self.counts[key] = 1
+        self.prefixes.add((key,))
+        grams = trigrams(key)
+        self.gram_counts[key] = len(grams)
+        for gram in grams:
+            self.grams.setdefault(gram, set()).add(key)
+
+    def remove(self, key):
+        count = self.counts.get(key)
+        if count is None:
+            return
+        if count > 1:
+            self.counts[key] = count - 1
+            return
+        del self.counts[key]
+        del self.gram_counts[key]
+        self.prefixes.discard((key,))
+        for gram in trigrams(key):
+            names = self.grams.get(gram)
+            if names is not None:
+                names.discard(key)
+                if not names:
+                    del self.grams[gram]
+
+    def complete(self, prefix, limit=10):
+        """Up to limit names starting with prefix, alphabetically."""
+        results = []
+        for (key,) in self.prefixes.between((prefix,), (prefix + "\U0010ffff",)):
+            results.append(key)
+            if len(results) == limit:
+                break
+        return results
+
+    def fuzzy(self, query, limit=10, min_score=0.25):
+        """
+        Names ranked by trigram similarity to query (see similarity()).
+        Returns a list of (name, score), best first.
+        """
+        query_grams = trigrams(query)
+        postings = sorted((self.grams.get(g, ()) for g in query_grams), key=len)
+
+        # A score >= min_score needs at least `needed` shared trigrams, so every
+        # match must appear in one of the smallest len - needed + 1 postings.
+        needed = max(1, math.ceil(min_score * len(query_grams)))
+        candidates = Counter()
+        for names in postings[:len(postings) - needed + 1]:
+            candidates.update(names)
+        large = postings[len(postings) - needed + 1:]
+
+        scored = []
+        for key, hits in candidates.items():
+            hits += sum(1 for names in large if key in names)
+            # Jaccard similarity: |A & B| / (|A| + |B| - |A & B|)
+            score = hits / (len(query_grams) + self.gram_counts[key] - hits)
+            if score >= min_score:
+                scored.append((score, key))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(key, round(score, 3)) for score, key in scored[:limit]]
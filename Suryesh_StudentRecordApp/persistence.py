@@ -0,0 +1,23 @@
+# persistence.py
+
+import json
+import os
+import sys
+
+# atomic_write and BackgroundFlusher are shared with the other student app
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from atomic_files import BackgroundFlusher, atomic_write
+
+
+def json_pieces(data, batch=1000):
+    """
+    json.dumps(data) for a dict, produced batch entries at a time. The C
+    encoder holds the GIL for a whole call, so encoding in pieces lets
+    other threads run between them during a background save.
+    """
+    items = list(data.items())
+    yield "{"
+    for start in range(0, len(items), batch):
+        piece = json.dumps(dict(items[start:start + batch]))[1:-1]
+        yield ", " + piece if start else piece
+    yield "}"
@@ -0,0 +1,267 @@
+# server.py
+
+import argparse
+import asyncio
+import json
+import traceback
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qs, urlsplit
+
+from student import Student
+from student_manager import StudentManager
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 500: "Internal Server Error"}
+
+# Field -> (check, error message), the same rules main.py applies to typed input
+FIELD_RULES = {
+    "name": (str.isalpha, "Name must contain only alphabets."),
+    "branch": (str.isalnum, "Branch must be alphanumeric without special characters."),
+    "year": (str.isdigit, "Year must contain only numbers."),
+    # Digits with at most one dot, so "nan", "inf" and negative marks are refused
+    "marks": (lambda value: value.replace(".", "", 1).isdigit(), "Marks must be a number."),
+}
+
+
+class ReadWriteLock:
+    """Many readers at once, or one writer on its own."""
+
+    def __init__(self):
+        self._readers = 0
+        self._writer = False
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reading(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._writer)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def writing(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._writer and not self._readers)
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+def validated_fields(data, fields):
+    """The named fields of a request body, checked with FIELD_RULES (marks converted to float)."""
+    values = {}
+    for field in fields:
+        value = str(data.get(field, ""))
+        check, message = FIELD_RULES[field]
+        if not check(value):
+            raise ValueError(message)
+        values[field] = float(value) if field == "marks" else value
+    return values
+
+
+def student_from_json(data, student_id=None):
+    """Builds a Student from a request body, applying the same rules as main.py."""
+    student_id = str(student_id or data.get("student_id", ""))
+    if not student_id.isdigit():
+        raise ValueError("Student ID must contain only numbers.")
+    fields = validated_fields(data, ("name", "branch", "year", "marks"))
+    return Student(student_id, fields["name"], fields["branch"], fields["year"], fields["marks"])
+
+
+class StudentServer:
+    """
+    Serves one in-memory StudentManager over a small HTTP/JSON API.
+
+    GET    /students                  all students (filters: ?name= ?branch= ?year=
+                                      ?prefix= for autocomplete, ?like= for fuzzy match)
+    GET    /students/<id>             one student
+    POST   /students                  add (JSON body)
+    PUT    /students/<id>             update given fields (JSON body)
+    DELETE /students/<id>             delete
+    GET    /stats                     aggregates and breakdowns (?top=k for top-k)
+
+    Saving is left to the manager's autosave (a BackgroundFlusher started
+    by serve()): writes only mark the data dirty, and it saves to disk at
+    most once per flush_interval, however many writes came in.
+    """
+
+    def __init__(self, manager, filename="students.json", flush_interval=1.0):
+        self.manager = manager
+        self.filename = filename
+        self.flush_interval = flush_interval
+        self.lock = ReadWriteLock()
+
+    # --- Request handlers ---
+
+    def list_students(self, query):
+        if "name" in query:
+            ids = self.manager.index.by_name(query["name"][0])
+        elif "branch" in query:
+            ids = self.manager.index.by_branch(query["branch"][0])
+        elif "year" in query:
+            ids = self.manager.index.by_year(query["year"][0])
+        elif "prefix" in query:
+            names = self.manager.complete_name(query["prefix"][0])
+            return 200, [s.to_dict() for s in self.manager.students_named(names)]
+        elif "like" in query:
+            names = self.manager.similar_names(query["like"][0])
+            return 200, [s.to_dict() for s in self.manager.students_named(names)]
+        else:
+            return 200, [s.to_dict() for s in self.manager.students.values()]
+        return 200, [self.manager.students[sid].to_dict() for sid in ids]
+
+    def get_student(self, student_id):
+        student = self.manager.students.get(student_id)
+        if student is None:
+            return 404, {"error": "Student not found."}
+        return 200, student.to_dict()
+
+    def add_student(self, body):
+        student = student_from_json(body)
+        if not self.manager.insert(student):
+            return 409, {"error": "Student ID already exists!"}
+        return 201, student.to_dict()
+
+    def update_student(self, student_id, body):
+        # Only the fields sent are changed, but each is checked as POST checks it
+        changes = validated_fields(body, [field for field in ("name", "branch", "year", "marks") if field in body])
+        student = self.manager.modify(student_id, **changes)
+        if student is None:
+            return 404, {"error": "Student not found."}
+        return 200, student.to_dict()
+
+    def delete_student(self, student_id):
+        if self.manager.remove(student_id) is None:
+            return 404, {"error": "Student ID not found."}
+        return 200, {"deleted": student_id}
+
+    def stats(self, query):
+        """Answered from the manager's running aggregates, without scanning students."""
+        top_k = int(query.get("top", ["1"])[0])
+        overall = self.manager.stats.overall
+        return 200, {
+            "count": overall.count,
+            "average_marks": overall.average(),
+            "std_dev": overall.std_dev(),
+            "median": self.manager.percentile(50),
+            "p90": self.manager.percentile(90),
+            "top": [s.to_dict() for s in self.manager.top_students(top_k)],
+            "by_branch": self.manager.stats.by_branch(),
+            "by_year": self.manager.stats.by_year(),
+        }
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        try:
+            data = json.loads(body) if body else {}
+            if parts == ["stats"] and method == "GET":
+                async with self.lock.reading():
+                    return self.stats(parse_qs(url.query))
+            if parts[:1] != ["students"] or len(parts) > 2:
+                return 404, {"error": "Unknown path."}
+
+            if len(parts) == 1:
+                if method == "GET":
+                    async with self.lock.reading():
+                        return self.list_students(parse_qs(url.query))
+                if method == "POST":
+                    async with self.lock.writing():
+                        return self.add_student(data)
+            else:
+                student_id = parts[1]
+                if method == "GET":
+                    async with self.lock.reading():
+                        return self.get_student(student_id)
+                if method == "PUT":
+                    async with self.lock.writing():
+                        return self.update_student(student_id, data)
+                if method == "DELETE":
+                    async with self.lock.writing():
+                        return self.delete_student(student_id)
+            return 405, {"error": "Method not allowed."}
+        except (ValueError, TypeError, AttributeError) as error:
+            return 400, {"error": str(error)}
+        except Exception:
+            # A bug in a handler still gets an answer instead of a dropped connection
+            traceback.print_exc()
+            return 500, {"error": "Internal server error."}
+
+    # --- HTTP plumbing ---
+
+    async def handle_connection(self, reader, writer):
+        """Serves requests on one keep-alive connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.dispatch(method.upper(), target, body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        # The file write runs on the flusher's thread, so requests keep being served meanwhile
+        self.manager.start_autosave(self.filename, self.flush_interval)
+        print(f"🌐 Serving {len(self.manager.students)} students on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Writes whatever changed since the last tick
+            self.manager.stop_autosave()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Student records HTTP/JSON server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--file", default="students.json")
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    manager = StudentManager()
+    manager.load_from_file(args.file)
+    server = StudentServer(manager, args.file, args.flush_interval)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("👋 Server stopped.")
+
+
+if __name__ == "__main__":
+    main()
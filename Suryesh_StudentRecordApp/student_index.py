@@ -0,0 +1,177 @@
+# student_index.py
+
+from bisect import bisect_left, bisect_right, insort
+from functools import total_ordering
+from itertools import accumulate, chain, islice
+
+
+@total_ordering
+class _Highest:
+    """Compares greater than any other value; closes a range whatever type the ids are."""
+
+    def __lt__(self, other):
+        return False
+
+    def __eq__(self, other):
+        return isinstance(other, _Highest)
+
+    def __hash__(self):
+        return 0
+
+
+HIGHEST = _Highest()
+
+
+class SortedEntries:
+    """
+    Tuples such as (marks, student_id) kept in ascending order, split into small
+    sorted buckets. add() and discard() binary-search the bucket maxima and
+    then touch a single bucket, so a change never shifts the whole list.
+    Positional lookups bisect the running bucket sizes, which are rebuilt
+    only on the first lookup after a change.
+    """
+
+    BUCKET = 1000
+
+    def __init__(self):
+        self.buckets = []
+        self.maxes = []
+        self.size = 0
+        self._ends = None  # running total of bucket sizes, None after a change
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return chain.from_iterable(self.buckets)
+
+    def add(self, entry):
+        self.size += 1
+        self._ends = None
+        if not self.buckets:
+            self.buckets.append([entry])
+            self.maxes.append(entry)
+            return
+        i = min(bisect_left(self.maxes, entry), len(self.maxes) - 1)
+        bucket = self.buckets[i]
+        insort(bucket, entry)
+        self.maxes[i] = bucket[-1]
+        if len(bucket) > 2 * self.BUCKET:
+            self.buckets[i:i + 1] = [bucket[:self.BUCKET], bucket[self.BUCKET:]]
+            self.maxes[i:i + 1] = [bucket[self.BUCKET - 1], bucket[-1]]
+
+    def discard(self, entry):
+        i = bisect_left(self.maxes, entry)
+        if i == len(self.maxes):
+            return
+        bucket = self.buckets[i]
+        position = bisect_left(bucket, entry)
+        if position < len(bucket) and bucket[position] == entry:
+            del bucket[position]
+            self.size -= 1
+            self._ends = None
+            if bucket:
+                self.maxes[i] = bucket[-1]
+            else:
+                del self.buckets[i]
+                del self.maxes[i]
+
+    def __getitem__(self, position):
+        """Entry at a position in sorted order (negative positions count from the end)."""
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("position out of range")
+        if self._ends is None:
+            self._ends = list(accumulate(map(len, self.buckets)))
+        i = bisect_right(self._ends, position)
+        return self.buckets[i][position - (self._ends[i - 1] if i else 0)]
+
+    def largest(self, k):
+        """The k largest entries, largest first."""
+        return list(islice(chain.from_iterable(reversed(b) for b in reversed(self.buckets)), k))
+
+    def between(self, low, high):
+        """Entries with low <= entry <= high, in ascending order."""
+        i = bisect_left(self.maxes, low)
+        for bucket in self.buckets[i:]:
+            for entry in bucket[bisect_left(bucket, low):]:
+                if entry > high:
+                    return
+                yield entry
+
+
+class StudentIndex:
+    """
+    Secondary indexes over the students held by StudentManager.
+
+    - names:   case-folded name -> set of student ids
+    - branches: case-folded branch -> set of student ids
+    - years:   year -> set of student ids
+    - marks:   SortedEntries of (marks, student_id)
+
+    add() and remove() keep every index in step with the manager, so
+    lookups never have to scan all records.
+    """
+
+    def __init__(self):
+        self.names = {}
+        self.branches = {}
+        self.years = {}
+        self.marks = SortedEntries()
+
+    @staticmethod
+    def key(value):
+        return str(value).strip().casefold()
+
+    @staticmethod
+    def _put(index, key, student_id):
+        index.setdefault(key, set()).add(student_id)
+
+    @staticmethod
+    def _drop(index, key, student_id):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(student_id)
+            if not ids:
+                del index[key]
+
+    def add(self, student):
+        self._put(self.names, self.key(student.name), student.student_id)
+        self._put(self.branches, self.key(student.branch), student.student_id)
+        self._put(self.years, self.key(student.year), student.student_id)
+        self.marks.add((float(student.marks), student.student_id))
+
+    def remove(self, student):
+        self._drop(self.names, self.key(student.name), student.student_id)
+        self._drop(self.branches, self.key(student.branch), student.student_id)
+        self._drop(self.years, self.key(student.year), student.student_id)
+        self.marks.discard((float(student.marks), student.student_id))
+
+    def clear(self):
+        self.__init__()
+
+    def by_name(self, name):
+        return self.names.get(self.key(name), set())
+
+    def by_branch(self, branch):
+        return self.branches.get(self.key(branch), set())
+
+    def by_year(self, year):
+        return self.years.get(self.key(year), set())
+
+    def top(self, k):
+        """Ids of the k highest scorers, best first."""
+        return [student_id for _, student_id in self.marks.largest(k)] if k > 0 else []
+
+    def percentile(self, p):
+        """Marks at percentile p (0-100), nearest-rank method."""
+        if not self.marks:
+            return None
+        rank = max(1, -(-p * len(self.marks) // 100))  # ceil(p/100 * n)
+        return self.marks[min(int(rank), len(self.marks)) - 1][0]
+
+    def by_marks(self, low, high):
+        """Ids of students with low <= marks <= high, in ascending order of marks."""
+        entries = self.marks.between((float(low),), (float(high), HIGHEST))
+        return [student_id for _, student_id in entries]
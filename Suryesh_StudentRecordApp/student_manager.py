@@ -1,17 +1,110 @@
 # student_manager.py
 
 import json
+import threading
 from student import Student
+from student_index import StudentIndex
+from student_stats import StudentStats
+from name_search import NameSearch
+from persistence import BackgroundFlusher, atomic_write, json_pieces
 
 class StudentManager:
     def __init__(self):
         self.students = {}  # key: student_id, value: Student object
+        self.index = StudentIndex()  # name/branch/year/marks lookups
+        self.stats = StudentStats()  # running count/sum/sum of squares
+        self.search = NameSearch()  # autocomplete and typo-tolerant name search
+        # Held by every change and while copying data for a save, so a
+        # background save never sees a half-applied update
+        self.lock = threading.RLock()
+        self.flusher = None  # set by start_autosave()
+
+    # --- Core operations (no printing or input; used by the menu and by server.py) ---
+
+    def insert(self, student):
+        with self.lock:
+            if student.student_id in self.students:
+                return False
+            self.students[student.student_id] = student
+            self.index.add(student)
+            self.stats.add(student)
+            self.search.add(self.index.key(student.name))
+        self._changed()
+        return True
+
+    def modify(self, student_id, **changes):
+        with self.lock:
+            student = self.students.get(student_id)
+            if student is None:
+                return None
+            self.index.remove(student)
+            self.stats.remove(student)
+            self.search.remove(self.index.key(student.name))
+            for field, value in changes.items():
+                setattr(student, field, value)
+            self.index.add(student)
+            self.stats.add(student)
+            self.search.add(self.index.key(student.name))
+        self._changed()
+        return student
+
+    def remove(self, student_id):
+        with self.lock:
+            student = self.students.pop(student_id, None)
+            if student is None:
+                return None
+            self.index.remove(student)
+            self.stats.remove(student)
+            self.search.remove(self.index.key(student.name))
+        self._changed()
+        return student
+
+    def to_data(self):
+        with self.lock:
+            return {sid: s.to_dict() for sid, s in self.students.items()}
+
+    def _changed(self):
+        if self.flusher is not None:
+            self.flusher.mark_dirty()
+
+    # --- Autosave ---
+
+    def start_autosave(self, filename="students.json", interval=1.0):
+        """Saves to filename in a background thread at most once per interval seconds after a change."""
+        self.stop_autosave()
+        self.flusher = BackgroundFlusher(
+            lambda: atomic_write(filename, json_pieces(self.to_data())), interval)
+
+    def stop_autosave(self):
+        """Writes any unsaved changes and stops the background thread."""
+        if self.flusher is not None:
+            self.flusher.close()
+            self.flusher = None
+
+    def top_students(self, k=1):
+        return [self.students[sid] for sid in self.index.top(k)]
+
+    def average(self):
+        return self.stats.overall.average()
+
+    def percentile(self, p):
+        return self.index.percentile(p)
+
+    def students_named(self, names):
+        return [self.students[sid] for name in names for sid in self.index.by_name(name)]
+
+    def complete_name(self, prefix, limit=10):
+        return self.search.complete(self.index.key(prefix), limit)
+
+    def similar_names(self, name, limit=5):
+        return [key for key, _ in self.search.fuzzy(self.index.key(name), limit)]
+
+    # --- Console operations ---
 
     def add_student(self, student):
-        if student.student_id in self.students:
+        if not self.insert(student):
             print("❌ Student ID already exists!")
             return
-        self.students[student.student_id] = student
         print("✅ Student added successfully!")
 
     def view_students(self):
@@ -28,21 +121,24 @@ class StudentManager:
 
         student = self.students[student_id]
         print(f"🔁 Updating record for: {student.name}")
-        student.name = input("Enter new name: ") or student.name
-        student.branch = input("Enter new branch: ") or student.branch
-        student.year = input("Enter new year: ") or student.year
-        try:
-            marks = input("Enter new marks: ")
-            if marks:
-                student.marks = float(marks)
-        except ValueError:
-            print("⚠️ Invalid marks input. Skipping update.")
+        changes = {}
+        for field in ("name", "branch", "year"):
+            value = input(f"Enter new {field}: ")
+            if value:
+                changes[field] = value
+        marks = input("Enter new marks: ")
+        if marks:
+            # The same rule as get_student_input() in main.py
+            if marks.replace('.', '', 1).isdigit():
+                changes["marks"] = float(marks)
+            else:
+                print("⚠️ Invalid marks input. Skipping update.")
 
+        self.modify(student_id, **changes)
         print("✅ Student updated successfully!")
 
     def delete_student(self, student_id):
-        if student_id in self.students:
-            del self.students[student_id]
+        if self.remove(student_id):
             print("🗑️ Student deleted successfully!")
         else:
             print("❌ Student ID not found.")
@@ -54,20 +150,39 @@ class StudentManager:
         else:
             print("❌ Student not found.")
 
+    def _print_matches(self, student_ids, message):
+        if not student_ids:
+            print(message)
+            return
+        for student_id in student_ids:
+            print(self.students[student_id])
+
     def search_by_name(self, name):
-        found = False
-        for student in self.students.values():
-            if student.name.lower() == name.lower():
+        matches = self.index.by_name(name)
+        if matches:
+            self._print_matches(matches, "")
+            return
+        print("❌ No student with that name found.")
+        suggestions = self.complete_name(name, 5) or self.similar_names(name)
+        if suggestions:
+            print("🔎 Did you mean:")
+            for student in self.students_named(suggestions):
                 print(student)
-                found = True
-        if not found:
-            print("❌ No student with that name found.")
+
+    def search_by_branch(self, branch):
+        self._print_matches(self.index.by_branch(branch), "❌ No student in that branch found.")
+
+    def search_by_year(self, year):
+        self._print_matches(self.index.by_year(year), "❌ No student in that year found.")
+
+    def search_by_marks(self, low, high):
+        self._print_matches(self.index.by_marks(low, high), "❌ No student in that marks range found.")
 
     def top_scorer(self):
         if not self.students:
             print("⚠️ No student data available.")
             return
-        top_student = max(self.students.values(), key=lambda s: s.marks)
+        top_student = self.top_students(1)[0]
         print("🏆 Top Scorer:")
         print(top_student)
 
@@ -75,14 +190,11 @@ class StudentManager:
         if not self.students:
             print("⚠️ No student data available.")
             return
-        total = sum(s.marks for s in self.students.values())
-        average = total / len(self.students)
-        print(f"📊 Average Marks: {average:.2f}")
+        print(f"📊 Average Marks: {self.average():.2f}")
 
     def save_to_file(self, filename="students.json"):
-        data = {sid: s.to_dict() for sid, s in self.students.items()}
-        with open(filename, "w") as file:
-            json.dump(data, file)
+        # Written to a temp file and renamed, so a crash can't leave a truncated students.json
+        atomic_write(filename, json.dumps(self.to_data()))
         print(f"💾 Data saved to {filename}")
 
     def load_from_file(self, filename="students.json"):
@@ -90,8 +202,8 @@ class StudentManager:
             with open(filename, "r") as file:
                 data = json.load(file)
                 for student_id, record in data.items():
-                    student = Student(**record)
-                    self.students[student_id] = student
+                    self.remove(student_id)
+                    self.insert(Student(**record))
             print(f"📂 Data loaded from {filename}")
         except FileNotFoundError:
             print(f"❌ File {filename} not found. Starting with empty records.")
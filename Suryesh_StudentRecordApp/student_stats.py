@@ -0,0 +1,79 @@
+# student_stats.py
+
+import math
+
+
+class RunningStats:
+    """Count, sum and sum of squares of marks, updated one student at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, marks):
+        self.count += 1
+        self.total += marks
+        self.total_sq += marks * marks
+
+    def remove(self, marks):
+        self.count -= 1
+        self.total -= marks
+        self.total_sq -= marks * marks
+        if self.count == 0:
+            # Reset so rounding errors from many add/remove pairs don't linger
+            self.total = self.total_sq = 0.0
+
+    def average(self):
+        return self.total / self.count if self.count else None
+
+    def std_dev(self):
+        if not self.count:
+            return None
+        variance = self.total_sq / self.count - self.average() ** 2
+        return math.sqrt(max(variance, 0.0))
+
+    def summary(self):
+        return {"count": self.count, "average": self.average(), "std_dev": self.std_dev()}
+
+
+class StudentStats:
+    """
+    Running aggregates over all students, plus per-branch and per-year breakdowns.
+
+    Like StudentIndex, StudentManager calls add() and remove() on every change,
+    so each mutation costs O(1) here and every query answers in O(1).
+    """
+
+    def __init__(self):
+        self.overall = RunningStats()
+        self.branches = {}
+        self.years = {}
+
+    @staticmethod
+    def _group(groups, key):
+        return groups.setdefault(str(key).strip().casefold(), RunningStats())
+
+    def add(self, student):
+        marks = float(student.marks)
+        self.overall.add(marks)
+        self._group(self.branches, student.branch).add(marks)
+        self._group(self.years, student.year).add(marks)
+
+    def remove(self, student):
+        marks = float(student.marks)
+        self.overall.remove(marks)
+        for groups, key in ((self.branches, student.branch), (self.years, student.year)):
+            key = str(key).strip().casefold()
+            groups[key].remove(marks)
+            if not groups[key].count:
+                del groups[key]
+
+    def clear(self):
+        self.__init__()
+
+    def by_branch(self):
+        return {branch: stats.summary() for branch, stats in self.branches.items()}
+
+    def by_year(self):
+        return {year: stats.summary() for year, stats in self.years.items()}
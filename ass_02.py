@@ -7,14 +7,20 @@ Original file is located at
     https://colab.research.google.com/drive/1cDbe_YaETJzCc8yze-QQpoSuetdrnspZ
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
-from sklearn.preprocessing import LabelEncoder
+from preprocessing import Pipeline, Impute, DropMissing, Dedupe, ParseDates, Derive, Encode, state_path
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Suryesh_NetflixCleaner'))
+from netflix_features import word_counts
 
 # Load the dataset
-df = pd.read_csv('netflix_titles.csv')
+data_path = 'netflix_titles.csv'
+df = pd.read_csv(data_path)
 
 # 1. Initial Data Overview
 print("Initial Data Overview:\n", df.head())
@@ -33,30 +39,29 @@ print("\nDuplicate Records:", df.duplicated().sum())
 # --- Data Cleaning Steps ---
 # ===========================
 
-# A. Handle missing values
-# Fill missing categorical columns with mode
-cat_cols = ['director', 'cast', 'country', 'date_added', 'rating', 'duration']
-for col in cat_cols:
-    df[col] = df[col].fillna(df[col].mode()[0])
-
-# B. Drop rows with missing values in critical columns like 'title'
-df.dropna(subset=['title'], inplace=True)
-
-# C. Remove duplicate rows
-df.drop_duplicates(inplace=True)
-
-# D. Convert 'date_added' to datetime
-df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
-
-# E. Create new column: Year Added
-df['year_added'] = df['date_added'].dt.year
+# The modes are fitted on the first run and saved next to the data, in
+# netflix_titles.ass_02_cleaning.json; later runs (and new batches of titles)
+# reuse them instead of recomputing. Delete the file to refit.
+cleaning = Pipeline([
+    # A. Fill missing categorical columns with mode
+    Impute(['director', 'cast', 'country', 'date_added', 'rating', 'duration'], strategy='mode'),
+    # B. Drop rows with missing values in critical columns like 'title'
+    DropMissing(['title']),
+    # C. Remove duplicate rows
+    Dedupe(),
+    # D. Convert 'date_added' to datetime
+    ParseDates(['date_added']),
+    # E. Create new column: Year Added
+    Derive('year_added', lambda d: d['date_added'].dt.year),
+], state_path=state_path(data_path, 'ass_02_cleaning'))
+df = cleaning.process(df)
 
 # ===============================
 # --- Numerical Transformations ---
 # ===============================
 
-# Example: Count words in description using NumPy
-df['description_word_count'] = df['description'].apply(lambda x: len(str(x).split()))
+# Example: Count words in description (vectorized, once per distinct description)
+df['description_word_count'] = word_counts(df['description'])
 
 # =============================
 # --- Filtering, Sorting, Grouping ---
@@ -94,10 +99,10 @@ plt.show()
 
 # 3. Apply Label Encoding for ML readiness
 
-label_encoders = {}
-for col in ['type', 'rating']:
-    le = LabelEncoder()
-    df[col] = le.fit_transform(df[col])
-    label_encoders[col] = le
+# Codes are saved to netflix_titles.ass_02_encoding.json, so a category keeps its code across runs
+encoding = Pipeline([Encode(['type', 'rating'], suffix='')],
+                    state_path=state_path(data_path, 'ass_02_encoding'))
+df = encoding.process(df)
+label_encoders = encoding.steps[0].classes  # column -> categories in code order
 
 print("\nCleaned & Encoded Data Sample:\n", df.head())
\ No newline at end of file
@@ -2,9 +2,11 @@ import streamlit as st
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
+from dataset_loader import load_dataset
 
 try:
-    df = pd.read_csv("covid_19_clean_complete.csv")
+    # Countries/regions as category, counts downcast, Date parsed (schemas/covid.json)
+    df = load_dataset("covid")
 except FileNotFoundError:
     st.error("Dataset 'covid_19_clean_complete.csv' not found. Please upload the file.")
     st.stop()
@@ -1,8 +1,9 @@
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
+from dataset_loader import load_dataset
 
-df = pd.read_csv('Titanic-Dataset.csv')
+df = load_dataset('titanic')  # schemas/titanic.json: small ints, float32, Sex/Cabin/Embarked as category
 
 df['Age'].fillna(df['Age'].median(), inplace=True)
 df['Embarked'].fillna(df['Embarked'].mode()[0], inplace=True)
@@ -34,7 +35,7 @@ sns.countplot(x='Survived', data=df)
 plt.title('Survival Count')
 
 plt.subplot(2, 2, 4)
-numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
+numeric_cols = df.select_dtypes(include='number').columns
 sns.heatmap(df[numeric_cols].corr(), annot=True, cmap='coolwarm')
 plt.title('Correlation Heatmap')
 
@@ -3,9 +3,10 @@ import numpy as np
 from scipy import stats
 import matplotlib.pyplot as plt
 import seaborn as sns
+from dataset_loader import load_dataset
 
 
-df = pd.read_csv('Shopping Trends And Customer Behaviour Dataset.csv')
+df = load_dataset('shopping')  # schemas/shopping.json: text columns as category, numbers downcast
 
 
 print("Descriptive Statistics for Purchase Amount:")
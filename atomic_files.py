@@ -0,0 +1,127 @@
+# atomic_files.py
+#
+# Crash-safe saving for the student record apps
+# (Suryesh_StudentRecordApp, NDV_CODE_BY_RAHUL_Student_record_management_console_app):
+#   ▶ atomic_write()      replaces a file through a temp file + rename, so a crash
+#                         leaves the old file or the new one, never a truncated mix
+#   ▶ BackgroundFlusher   saves from a worker thread at most once per interval, and
+#                         once more when the interpreter exits normally (also after
+#                         Ctrl-C or an uncaught exception; not after SIGKILL or a
+#                         segfault, where atexit handlers never run)
+
+import atexit
+import os
+import tempfile
+import threading
+import time
+import traceback
+
+# Read once at import: os.umask() can only be read by setting it, which is not
+# safe once other threads (the flusher) may be creating files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(filename, text):
+    """
+    Replaces filename with text (a string, or an iterable of string pieces).
+    The text goes to a temp file in the same folder, is fsynced, and is then
+    renamed over the original. The new file keeps the old one's permissions,
+    or gets the usual open() permissions (0666 minus the umask) if it is new.
+    """
+    folder = os.path.dirname(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as file:
+            # mkstemp creates the file owner-only (0600)
+            if os.path.exists(filename):
+                os.chmod(temp_path, os.stat(filename).st_mode)
+            else:
+                os.chmod(temp_path, 0o666 & ~_UMASK)
+            if isinstance(text, str):
+                file.write(text)
+            else:
+                file.writelines(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, filename)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself (POSIX); Windows has no directory fsync
+        dir_fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class BackgroundFlusher:
+    """
+    Runs save() on a worker thread at most once per interval, and only after
+    mark_dirty() has been called. Any number of changes between two saves
+    cost one write, and the caller never waits for the disk.
+
+    close() is also registered with atexit, so changes still waiting for the
+    next tick are written when the interpreter exits, including after Ctrl-C or
+    an uncaught exception (but not when the process is killed outright).
+
+    A save that raises is reported and retried on the next tick; the thread
+    keeps running.
+
+    Save timings are kept in saves/last_seconds/max_seconds/total_seconds.
+    """
+
+    def __init__(self, save, interval=1.0):
+        self.save = save
+        self.interval = interval
+        self.dirty = False
+        self.saves = 0
+        self.last_seconds = self.max_seconds = self.total_seconds = 0.0
+        self._lock = threading.Lock()  # one save at a time
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="student-flusher", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def flush(self):
+        """Saves now if anything changed since the last save."""
+        with self._lock:
+            if not self.dirty:
+                return
+            # Cleared before saving, so a change made during the save triggers another one
+            self.dirty = False
+            start = time.perf_counter()
+            try:
+                self.save()
+            except Exception:
+                # Any error (disk, a bug in save()): keep the data dirty so the next tick retries
+                self.dirty = True
+                print("⚠️ Background save failed:")
+                traceback.print_exc()
+                return
+            elapsed = time.perf_counter() - start
+            self.saves += 1
+            self.last_seconds = elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+            self.total_seconds += elapsed
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def close(self):
+        """Stops the thread after one last flush. Safe to call more than once."""
+        atexit.unregister(self.close)
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+
+    def summary(self):
+        average = self.total_seconds / self.saves if self.saves else 0.0
+        return {"saves": self.saves, "last_ms": self.last_seconds * 1000,
+                "max_ms": self.max_seconds * 1000, "average_ms": average * 1000}
@@ -0,0 +1,59 @@
+# benchmark_columnar_source.py
+#
+# Cold start of a dashboard process: pd.read_csv of the whole file versus
+# ColumnarSource (memory-mapped Arrow IPC) reading the columns and rows of one
+# view. Each measurement runs in a fresh Python process, as a new Streamlit
+# worker would; the OS page cache is warm, as it is for a second process.
+#
+#   python benchmark_columnar_source.py [scale]     # covid_19_clean_complete.csv x scale (default 30)
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from columnar_source import ColumnarSource
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+READ_CSV = "import pandas as pd; df = pd.read_csv({path!r}, parse_dates=['Date'])"
+COLUMNAR = ("import sys; sys.path.insert(0, {root!r}); from columnar_source import ColumnarSource; "
+            "df = ColumnarSource({path!r}).to_pandas(columns=['Date', 'Confirmed', 'Deaths', 'Recovered'], "
+            "filters=[('Country/Region', '==', 'India')])")
+
+
+def cold_start(code, repeat=3):
+    """Best wall time of a fresh interpreter running code, minus the time to start one that imports pandas."""
+    def run(source):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", source], check=True)
+        return time.perf_counter() - start
+    baseline = min(run("import pandas") for _ in range(repeat))
+    return min(run(code) for _ in range(repeat)) - baseline
+
+
+def run_benchmark(scale=30):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "covid.csv")
+        df = pd.read_csv(os.path.join(ROOT, "covid_19_clean_complete.csv"))
+        pd.concat([df] * scale, ignore_index=True).to_csv(path, index=False)
+        print(f"📊 {len(df) * scale:,} rows, CSV {os.path.getsize(path) / 1e6:.0f} MB ({scale}x)")
+
+        source = ColumnarSource(path)
+        start = time.perf_counter()
+        source.convert()
+        print(f"One-time conversion to Arrow IPC: {time.perf_counter() - start:.2f}s "
+              f"({os.path.getsize(source.path) / 1e6:.0f} MB)\n")
+
+        csv_seconds = cold_start(READ_CSV.format(path=path))
+        mapped_seconds = cold_start(COLUMNAR.format(root=ROOT, path=path))
+        print(f"{'pd.read_csv (whole file)':<38}{csv_seconds * 1000:>9.0f} ms")
+        print(f"{'memory-mapped, 4 columns, one country':<38}{mapped_seconds * 1000:>9.0f} ms")
+        print(f"\n✅ {csv_seconds / mapped_seconds:.0f}x faster cold start")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
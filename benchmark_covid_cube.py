@@ -0,0 +1,85 @@
+# benchmark_covid_cube.py
+#
+# Time of one dashboard interaction (pick a country and a date range, read the
+# metrics, build the chart frame) with boolean masks over the whole frame
+# versus a CovidCube lookup, on covid_19_clean_complete.csv scaled up.
+#
+#   python benchmark_covid_cube.py [scale]     # default 100x
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from covid_cube import CovidCube
+from dataset_loader import load_dataset
+
+METRICS = ["Confirmed", "Deaths", "Recovered"]
+
+
+def load_scaled(scale):
+    """The file repeated scale times, each copy under new country names ("India #2", ...)."""
+    df = load_dataset("covid")
+    copies = []
+    for copy in range(scale):
+        part = df.copy()
+        if copy:
+            part["Country/Region"] = part["Country/Region"].cat.rename_categories(lambda name: f"{name} #{copy + 1}")
+        copies.append(part)
+    scaled = pd.concat(copies, ignore_index=True)
+    scaled["Country/Region"] = scaled["Country/Region"].astype("category")
+    return scaled
+
+
+def masked_interaction(df, country, start, end):
+    """What app.py did on every rerun."""
+    filtered = df[(df["Country/Region"] == country) & (df["Date"] >= start) & (df["Date"] <= end)]
+    peaks = [filtered[metric].max() for metric in METRICS]
+    daily = filtered["Confirmed"].diff().fillna(0)
+    summary = filtered[METRICS].describe()
+    return peaks, daily, summary
+
+
+def cube_interaction(cube, country, start, end):
+    series = cube[country]
+    peaks = [series.peak(metric, start, end) for metric in METRICS]
+    frame = series.frame(start, end, METRICS + ["New Confirmed"])
+    summary = frame[METRICS].describe()
+    return peaks, frame, summary
+
+
+def percentiles(seconds):
+    ms = np.array(seconds) * 1000
+    return f"median {np.median(ms):7.2f} ms   p95 {np.percentile(ms, 95):7.2f} ms   max {ms.max():7.2f} ms"
+
+
+def run_benchmark(scale=100, interactions=50):
+    df = load_scaled(scale)
+    print(f"📊 {len(df):,} rows, {df['Country/Region'].nunique():,} countries ({scale}x)")
+
+    start_time = time.perf_counter()
+    cube = CovidCube.from_clean_complete(df)
+    print(f"Cube built once in {time.perf_counter() - start_time:.2f}s\n")
+
+    rng = np.random.default_rng(0)
+    dates = np.sort(df["Date"].unique())
+    timings = {"masks": [], "cube": []}
+    for _ in range(interactions):
+        country = cube.countries[rng.integers(len(cube))]
+        lo, hi = np.sort(rng.integers(len(dates), size=2))
+        start, end = pd.Timestamp(dates[lo]), pd.Timestamp(dates[hi])
+        for name, action in (("masks", lambda: masked_interaction(df, country, start, end)),
+                             ("cube", lambda: cube_interaction(cube, country, start, end))):
+            began = time.perf_counter()
+            action()
+            timings[name].append(time.perf_counter() - began)
+
+    for name, seconds in timings.items():
+        print(f"{name:<6} {percentiles(seconds)}")
+    worst = max(timings["cube"]) * 1000
+    print(f"\n{'✅' if worst < 50 else '❌'} Slowest cube interaction: {worst:.2f} ms (target < 50 ms)")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,91 @@
+# benchmark_summary_sketch.py
+#
+# Time of the dashboards' "Summary Statistics" panel: describe(include='all')
+# of the filtered frame on every rerun versus merging SketchSummary partitions,
+# on covid_19_clean_complete.csv (read as plain read_csv, text columns as
+# strings) scaled up. Also prints the largest error of the sketched values:
+# percentiles by rank, everything else relative to describe().
+#
+#   python benchmark_summary_sketch.py [scale]     # default 100x
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from summary_sketch import PERCENTILES, SketchSummary
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "covid_19_clean_complete.csv")
+FILTER = "WHO Region"
+
+
+def load_scaled(scale):
+    df = pd.read_csv(DATA_PATH, parse_dates=["Date"])
+    return pd.concat([df] * scale, ignore_index=True)
+
+
+def sketch_errors(filtered, expected, sketched):
+    """
+    Largest error per describe() row. Percentiles are judged by rank (how far
+    the sketched value's rank is from 25% / 50% / 75%), the other numbers
+    relative to describe()'s value.
+    """
+    errors = {}
+    for row in expected.index:
+        if row == "top":
+            continue
+        worst = 0.0
+        for col in expected.columns:
+            want, got = expected.at[row, col], sketched.at[row, col]
+            if pd.isna(want):
+                continue
+            if row in PERCENTILES:
+                values = filtered[col].dropna()
+                below, at_most = (values < got).mean(), (values <= got).mean()
+                worst = max(worst, max(below - PERCENTILES[row], PERCENTILES[row] - at_most, 0.0))
+            elif isinstance(want, pd.Timestamp):
+                worst = max(worst, abs((got - want).value) / abs(want.value))
+            else:
+                worst = max(worst, abs(float(got) - float(want)) / (abs(float(want)) or 1.0))
+        errors[row] = worst
+    return errors
+
+
+def run_benchmark(scale=100):
+    df = load_scaled(scale)
+    print(f"📊 {len(df):,} rows ({scale}x)")
+
+    start_time = time.perf_counter()
+    sketches = SketchSummary(df, by=FILTER)
+    print(f"Sketches built once in {time.perf_counter() - start_time:.2f}s "
+          f"({len(sketches.partitions)} partitions by {FILTER})\n")
+
+    regions = sorted(df[FILTER].unique())
+    queries = {"whole dataset": None, "one region": {FILTER: regions[0]}, "two regions": {FILTER: regions[:2]}}
+    worst = {}
+    for name, where in queries.items():
+        began = time.perf_counter()
+        filtered = df if where is None else df[df[FILTER].isin(list(np.atleast_1d(where[FILTER])))]
+        expected = filtered.describe(include="all")
+        describe_ms = (time.perf_counter() - began) * 1000
+
+        began = time.perf_counter()
+        sketched = sketches.describe(where)
+        sketch_ms = (time.perf_counter() - began) * 1000
+
+        errors = sketch_errors(filtered, expected, sketched)
+        worst[name] = max(errors.values())
+        print(f"{name:<14} describe {describe_ms:9.1f} ms   sketches {sketch_ms:7.1f} ms   "
+              f"({describe_ms / sketch_ms:5.0f}x)   worst error {worst[name]:.2%}")
+        print(" " * 15 + "  ".join(f"{row} {error:.2%}" for row, error in errors.items()))
+
+    if max(worst.values()) < 0.02:
+        print("\n✅ Every sketched value within 2% of describe()")
+    else:
+        print("\n❌ Some sketched values are more than 2% off")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
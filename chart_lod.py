@@ -0,0 +1,141 @@
+# chart_lod.py
+#
+# Level-of-detail downsampling for the dashboard charts
+# (Suryesh_CleanDashboard, NDV_Code_By_RishikaS_DataVisualization,
+# NDV_Code_By_MayankM_SalesDashboard).
+#
+# A chart a few hundred pixels wide cannot show more than a couple of points
+# per pixel column, so the apps send at most max_points points per series:
+#   ▶ lttb()           Largest-Triangle-Three-Buckets, keeps the visual shape of lines
+#   ▶ minmax_buckets() the lowest and highest point of every pixel column, so bars
+#                      and spikes (daily counts) are never dropped
+# downsample_frame() applies them to a DataFrame, optionally only inside a zoom
+# range: zooming in re-runs it on the visible rows, so detail comes back.
+# LODCache keeps the result per filter key, so a rerun with the same filters
+# and zoom reuses it instead of downsampling again.
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 1000  # roughly one point per pixel of a full-width chart
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return values.astype(float)
+
+
+def lttb(x, y, max_points):
+    """
+    Positions of the max_points points that Largest-Triangle-Three-Buckets keeps.
+    x must be sorted. The first and last points are always kept; every bucket in
+    between keeps the point forming the largest triangle with the point kept
+    for the previous bucket and the average of the next bucket.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    x, y = _as_float(x), _as_float(y)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)  # max_points - 2 buckets
+    kept = np.empty(max_points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(max_points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_hi = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x, next_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[previous] - next_x) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (next_y - y[previous]))
+        previous = lo + int(np.argmax(area))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def minmax_buckets(x, y, max_points):
+    """
+    Positions of the lowest and highest point in each of (max_points - 2) // 2
+    equal-width x buckets plus the first and last point, in x order, so never more
+    than max_points of them. x must be sorted.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+    buckets = (max_points - 2) // 2
+    x, y = _as_float(x), _as_float(y)
+    span = x[-1] - x[0] or 1.0
+    bucket = np.minimum(((x - x[0]) / span * buckets).astype(np.int64), buckets - 1)
+    order = np.lexsort((y, bucket))  # by bucket, then by value
+    starts = np.flatnonzero(np.r_[True, bucket[order][1:] != bucket[order][:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.concatenate(([0, n - 1], order[starts], order[ends])))
+
+
+METHODS = {"lttb": lttb, "minmax": minmax_buckets}
+
+
+def _downsample_rows(df, x, ys, max_points, method):
+    """Union of the rows each y column keeps; missing values are skipped."""
+    pick = METHODS[method]
+    xs = df[x].to_numpy()
+    kept = []
+    for y in ys:
+        values = df[y].to_numpy(dtype=float)
+        present = np.flatnonzero(~np.isnan(values))
+        kept.append(present[pick(xs[present], values[present], max_points)])
+    rows = np.unique(np.concatenate(kept)) if kept else np.arange(len(df))
+    return df.iloc[rows]
+
+
+def downsample_frame(df, x, ys, max_points=DEFAULT_MAX_POINTS, method="lttb", x_range=None, group=None):
+    """
+    Rows of df (sorted by x) needed to draw ys against x with about max_points
+    points per series. x_range=(start, end) keeps only that part first, so a
+    zoomed-in view gets the full point budget for the visible range.
+    With group, each group (one line per product line, ...) is downsampled on its own.
+    """
+    if x_range is not None:
+        start, end = x_range
+        values = df[x]
+        df = df[(values >= start) & (values <= end)]
+    if group is not None:
+        parts = [_downsample_rows(part, x, ys, max_points, method)
+                 for _, part in df.groupby(group, observed=True, sort=False)]
+        return pd.concat(parts) if parts else df
+    return _downsample_rows(df, x, ys, max_points, method)
+
+
+class LODCache:
+    """
+    Downsampled frames by key, least recently used dropped first.
+    The key should hold everything the frame depends on: the filters, the zoom
+    range, the point budget and the method. get() builds on a miss.
+    One cache serves every Streamlit session thread, so the dict is only touched
+    under a lock; build() runs outside it and two sessions missing the same key
+    at once both build, the second result simply replacing the first.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, build):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        frame = build()
+        with self.lock:
+            self.entries[key] = frame
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return frame
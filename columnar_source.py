@@ -0,0 +1,149 @@
+# columnar_source.py
+#
+# Lazy columnar data source for the Streamlit dashboards
+# (Suryesh_CleanDashboard, NDV_Code_By_MayankM_SalesDashboard,
+# NDV_Code_By_KeerthipriyaT_DataVisualization).
+#
+# A CSV is parsed once and written next to it as an uncompressed Arrow IPC
+# (Feather v2) file, or Parquet with format="parquet". Later loads memory-map
+# that file instead of parsing the CSV again:
+#   ▶ only the columns a view asks for are touched
+#   ▶ filters (("location", "==", "India"), ...) are applied while scanning
+#   ▶ the mapped pages live in the OS page cache, so every dashboard process
+#     on the machine shares one copy and a cold start skips CSV parsing
+# The file is rebuilt when the CSV is newer. Without pyarrow installed the
+# source falls back to pd.read_csv, with the same columns= and filters=.
+
+import os
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.fs as pa_fs
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+FORMATS = {"ipc": ".arrow", "parquet": ".parquet"}
+
+# Stored in the columnar file's schema metadata. Bump it when the CSV parsing
+# changes, so files written by an older version are rebuilt on the next load.
+# 2: blank text cells are missing (null), as in pd.read_csv
+_LAYOUT_KEY, _LAYOUT = b"columnar_source", b"2"
+
+_OPERATORS = {
+    "==": lambda s, v: s == v, "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v, "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v, ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v), "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def _is_url(path):
+    return "://" in str(path)
+
+
+class ColumnarSource:
+    """
+    csv_path: local CSV or URL. A URL is downloaded once; delete the cached
+    file (or call convert()) to fetch it again.
+    cache_dir: where the columnar file goes (default: next to the CSV).
+    timestamp_formats: strptime formats for date columns, e.g. ["%m/%d/%Y %H:%M"].
+    encoding: text encoding of the CSV.
+    """
+
+    def __init__(self, csv_path, cache_dir=None, fmt="ipc", timestamp_formats=None, encoding="utf8"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}' (choose from {', '.join(FORMATS)})")
+        self.csv_path = csv_path
+        self.fmt = fmt
+        self.timestamp_formats = timestamp_formats
+        self.encoding = encoding
+        name = os.path.basename(str(csv_path).rstrip("/")).split("?")[0] or "data.csv"
+        folder = cache_dir or (os.getcwd() if _is_url(csv_path) else os.path.dirname(os.path.abspath(csv_path)))
+        self.path = os.path.join(folder, os.path.splitext(name)[0] + FORMATS[fmt])
+
+    def _layout(self):
+        if self.fmt == "ipc":
+            with pa.memory_map(self.path) as source:
+                schema = pa.ipc.open_file(source).schema
+        else:
+            schema = pq.read_schema(self.path)
+        return (schema.metadata or {}).get(_LAYOUT_KEY)
+
+    def is_stale(self):
+        if not os.path.exists(self.path):
+            return True
+        if not _is_url(self.csv_path) and os.path.getmtime(self.csv_path) > os.path.getmtime(self.path):
+            return True
+        return self._layout() != _LAYOUT
+
+    def _read_csv_arrow(self):
+        if _is_url(self.csv_path):
+            # pyarrow.csv cannot open URLs; pandas downloads, Arrow stores
+            return pa.Table.from_pandas(pd.read_csv(self.csv_path, encoding=self.encoding), preserve_index=False)
+        # Blank text cells become null, like the NaN pd.read_csv gives them
+        convert = pa_csv.ConvertOptions(timestamp_parsers=self.timestamp_formats or [],
+                                        strings_can_be_null=True)
+        read = pa_csv.ReadOptions(encoding=self.encoding)
+        return pa_csv.read_csv(self.csv_path, read_options=read, convert_options=convert)
+
+    def convert(self):
+        """Parses the CSV and (re)writes the columnar file; returns its path."""
+        table = self._read_csv_arrow()
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _LAYOUT_KEY: _LAYOUT})
+        folder = os.path.dirname(self.path)
+        os.makedirs(folder, exist_ok=True)
+        # Written to a temp file and renamed, so another process never maps a half-written file
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=FORMATS[self.fmt])
+        os.close(fd)
+        try:
+            if self.fmt == "ipc":
+                feather.write_feather(table, temp_path, compression="uncompressed")
+            else:
+                pq.write_table(table, temp_path, row_group_size=128 * 1024)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return self.path
+
+    def dataset(self):
+        if self.is_stale():
+            self.convert()
+        return ds.dataset(self.path, format="ipc" if self.fmt == "ipc" else "parquet",
+                          filesystem=pa_fs.LocalFileSystem(use_mmap=True))
+
+    def table(self, columns=None, filters=None):
+        """
+        Arrow table of the requested columns and rows. filters is a list of
+        (column, op, value) tuples that must all hold; op is one of
+        ==, !=, <, <=, >, >=, in, not in.
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for table(); to_pandas() works without it")
+        expression = pq.filters_to_expression(filters) if filters else None
+        return self.dataset().to_table(columns=columns, filter=expression)
+
+    def to_pandas(self, columns=None, filters=None):
+        if pa is None:
+            return self._read_csv_pandas(columns, filters)
+        # Dates come back as datetime64 columns, like pd.to_datetime gives
+        return self.table(columns, filters).to_pandas(date_as_object=False)
+
+    def column_names(self):
+        if pa is None:
+            return list(pd.read_csv(self.csv_path, nrows=0, encoding=self.encoding).columns)
+        return self.dataset().schema.names
+
+    def _read_csv_pandas(self, columns, filters):
+        needed = None if columns is None else list(dict.fromkeys(list(columns) + [f[0] for f in filters or []]))
+        df = pd.read_csv(self.csv_path, usecols=needed, encoding=self.encoding)
+        for column, op, value in filters or []:
+            df = df[_OPERATORS[op](df[column], value)]
+        return df.reset_index(drop=True)[columns] if columns is not None else df.reset_index(drop=True)
@@ -0,0 +1,126 @@
+# covid_cube.py
+#
+# Per-country time-series cube for the COVID-19 dashboards
+# (Suryesh_CleanDashboard, NDV_Code_By_RishikaS_DataVisualization).
+#
+# The dashboards used to mask the whole frame on every Streamlit rerun
+# (df[df['location'] == country], then date masks, then .max()/.diff()).
+# The cube does that work once per data refresh:
+#   ▶ rows are summed per (country, date), so provinces roll up to their country
+#   ▶ each country keeps its own sorted date array and metric arrays
+#   ▶ daily metrics are computed once from the running totals
+# After that, selecting a country is a dict lookup and a date range is two
+# binary searches (np.searchsorted) on that country's dates.
+
+import numpy as np
+import pandas as pd
+
+
+class CountrySeries:
+    """One country's dates (sorted, datetime64) and metric arrays of the same length."""
+
+    def __init__(self, name, dates, values, date_col="date"):
+        self.name = name
+        self.dates = dates
+        self.values = values  # metric -> np.ndarray
+        self.date_col = date_col
+
+    @property
+    def first_date(self):
+        return pd.Timestamp(self.dates[0])
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(self.dates[-1])
+
+    def window(self, start=None, end=None):
+        """Slice of the rows with start <= date <= end (either bound may be None)."""
+        lo, hi = 0, len(self.dates)
+        if start is not None:
+            lo = np.searchsorted(self.dates, pd.Timestamp(start).to_datetime64(), side="left")
+        if end is not None:
+            hi = np.searchsorted(self.dates, pd.Timestamp(end).to_datetime64(), side="right")
+        return slice(lo, hi)
+
+    def frame(self, start=None, end=None, metrics=None):
+        """The date range as a small DataFrame (for charts and tables)."""
+        rows = self.window(start, end)
+        data = {self.date_col: self.dates[rows]}
+        for metric in metrics or self.values:
+            data[metric] = self.values[metric][rows]
+        return pd.DataFrame(data)
+
+    def peak(self, metric, start=None, end=None):
+        values = self.values[metric][self.window(start, end)]
+        return np.nanmax(values) if len(values) and not np.isnan(values).all() else np.nan
+
+    def latest(self, metric, start=None, end=None, skip_missing=False):
+        """Last value in the date range; with skip_missing, the last one that is not NaN."""
+        values = self.values[metric][self.window(start, end)]
+        if skip_missing:
+            values = values[~np.isnan(values)]
+        return values[-1] if len(values) else np.nan
+
+
+class CovidCube:
+    """
+    country -> CountrySeries, built once from a long-format frame.
+
+    totals are running totals (summed over provinces for each date). daily maps
+    a daily column to the total it belongs to: a daily column present in the
+    data is summed like the totals, otherwise it is computed as the day-to-day
+    change of its total (0 on a country's first date).
+    """
+
+    def __init__(self, df, country_col, date_col, totals, daily=None):
+        daily = daily or {}
+        self.country_col = country_col
+        self.date_col = date_col
+        self.metrics = list(totals) + list(daily)
+        self.head = df.head()
+
+        given = [col for col in daily if col in df.columns]
+        grouped = (df.groupby([country_col, date_col], observed=True, sort=True)[list(totals) + given]
+                     .sum(min_count=1))
+        names = grouped.index.get_level_values(0)
+        dates = grouped.index.get_level_values(1).to_numpy(dtype="datetime64[ns]")
+        codes, countries = pd.factorize(names)  # sorted already, so each country is one run
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ends = np.r_[starts[1:], len(codes)]
+
+        columns = {col: grouped[col].to_numpy(dtype=float) for col in grouped.columns}
+        for col, total in daily.items():
+            if col not in columns:
+                change = np.diff(columns[total], prepend=np.nan)
+                change[starts] = 0
+                columns[col] = change
+
+        # Each country's arrays are views into the shared column arrays
+        self.series = {
+            str(name): CountrySeries(str(name), dates[lo:hi],
+                                     {col: columns[col][lo:hi] for col in self.metrics}, date_col)
+            for name, lo, hi in zip(countries, starts, ends)
+        }
+        self.countries = sorted(self.series)
+        self.first_date, self.last_date = pd.Timestamp(dates.min()), pd.Timestamp(dates.max())
+
+    def __getitem__(self, country):
+        return self.series[country]
+
+    def __contains__(self, country):
+        return country in self.series
+
+    def __len__(self):
+        return len(self.series)
+
+    @classmethod
+    def from_clean_complete(cls, df):
+        """covid_19_clean_complete.csv: Country/Region, Date, Confirmed, Deaths, Recovered, Active."""
+        return cls(df, "Country/Region", "Date", ["Confirmed", "Deaths", "Recovered", "Active"],
+                   daily={"New Confirmed": "Confirmed", "New Deaths": "Deaths", "New Recovered": "Recovered"})
+
+    @classmethod
+    def from_owid(cls, df):
+        """Our World in Data export: location, date, total_cases/deaths, new_cases/deaths."""
+        return cls(df, "location", "date", ["total_cases", "total_deaths"],
+                   daily={"new_cases": "total_cases", "new_deaths": "total_deaths"})
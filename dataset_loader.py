@@ -0,0 +1,105 @@
+# dataset_loader.py
+#
+# Typed loading for the CSV datasets at the repo root (Netflix titles, COVID-19,
+# Titanic, shopping trends). Each dataset has a schema file in schemas/ that says:
+#
+#   "file"       the CSV, relative to the repo root
+#   "index_col"  optional, passed to read_csv
+#   "category"   low-cardinality text columns, read straight into category dtype
+#   "dates"      column -> strptime format, parsed once here (bad values become NaT)
+#   "downcast"   column -> "integer" | "unsigned" | "float", the smallest type that
+#                holds every value (pd.to_numeric(downcast=...)); "float" is float32
+#
+# Counts are downcast as "integer" (signed), so that differences such as daily new
+# cases can go negative without wrapping around.
+#
+# Measured savings (plain read_csv -> load_dataset) depend on how the plain read
+# stores text. pandas 2 keeps it as Python objects; pandas 3 already stores it as
+# compact Arrow strings, so much of the gain is built in:
+#
+#                pandas 2 (object text)       pandas 3 (Arrow str)
+#   covid        14.21 MB -> 1.79 MB  7.9x    5.46 MB -> 1.78 MB  3.1x
+#   shopping      3.14 MB -> 0.10 MB   33x    0.85 MB -> 0.09 MB  9.6x
+#   titanic       0.32 MB -> 0.16 MB  2.0x    0.12 MB -> 0.07 MB  1.8x
+#   netflix       8.94 MB -> 5.53 MB  1.6x    4.05 MB -> 3.13 MB  1.3x
+#
+# On pandas 3 the covid file stays at ~3x: its counts need int32 (Confirmed
+# passes 4 million), and Date stays datetime64 because CovidCube and the charts
+# sort and search it by date. Titanic and Netflix are mostly free text (names,
+# tickets, cast, descriptions) that no dtype makes smaller.
+#
+#   python dataset_loader.py covid shopping     # memory report per column
+
+import argparse
+import json
+import os
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_DIR = os.path.join(ROOT, "schemas")
+
+
+def dataset_names():
+    return sorted(name[:-len(".json")] for name in os.listdir(SCHEMA_DIR) if name.endswith(".json"))
+
+
+def load_schema(name):
+    path = os.path.join(SCHEMA_DIR, name + ".json")
+    if not os.path.exists(path):
+        raise ValueError(f"Unknown dataset '{name}' (schemas: {', '.join(dataset_names())})")
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def load_dataset(name, path=None):
+    """
+    Reads dataset name with its schema applied. path overrides the schema's
+    file, for a copy of the same CSV stored elsewhere.
+    """
+    schema = load_schema(name)
+    path = path or os.path.join(ROOT, schema["file"])
+    df = pd.read_csv(path, index_col=schema.get("index_col"),
+                     dtype={col: "category" for col in schema.get("category", [])})
+    for col, date_format in schema.get("dates", {}).items():
+        values = df[col].str.strip() if pd.api.types.is_string_dtype(df[col]) else df[col]
+        df[col] = pd.to_datetime(values, format=date_format, errors="coerce")
+    for col, kind in schema.get("downcast", {}).items():
+        df[col] = pd.to_numeric(df[col], downcast=kind)
+    return df
+
+
+def memory_report(name, path=None):
+    """Prints memory per column for a plain read_csv and for load_dataset; returns (plain_bytes, typed_bytes)."""
+    schema = load_schema(name)
+    path = path or os.path.join(ROOT, schema["file"])
+    plain = pd.read_csv(path)
+    typed = load_dataset(name, path)
+    plain_usage = plain.memory_usage(deep=True)
+    typed_usage = typed.memory_usage(deep=True)
+    if schema.get("index_col") is not None:
+        # The column read_csv loads as data is the index of the typed frame
+        typed_usage = typed_usage.rename({"Index": plain.columns[schema["index_col"]]})
+
+    print(f"\n📊 {name}: {schema['file']} ({len(typed):,} rows)")
+    print(f"{'Column':<28}{'Plain dtype':>12}{'Typed dtype':>16}{'Plain KB':>11}{'Typed KB':>11}")
+    for col in plain.columns:
+        typed_dtype = typed[col].dtype if col in typed.columns else typed.index.dtype
+        print(f"{col[:27]:<28}{str(plain[col].dtype):>12}{str(typed_dtype):>16}"
+              f"{plain_usage[col] / 1024:>11.1f}{typed_usage.get(col, 0) / 1024:>11.1f}")
+    before, after = plain_usage.sum(), typed_usage.sum()
+    print(f"{'Total':<56}{before / 1024:>11.1f}{after / 1024:>11.1f}")
+    print(f"✅ {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB ({before / after:.1f}x smaller)")
+    return before, after
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memory saved by loading the repo datasets with their schemas.")
+    parser.add_argument("names", nargs="*", help=f"Datasets (default: all of {', '.join(dataset_names())})")
+    args = parser.parse_args(argv)
+    for name in args.names or dataset_names():
+        memory_report(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+# preprocessing.py
+#
+# Declarative cleaning/encoding pipeline shared by the preprocessing scripts
+# (ass_02.py, NDV_CODE_BY_MAYANKM_Cleaning-Preprocessing, the loan data script).
+#
+# A Pipeline is a list of steps. fit() learns each step's statistics (modes,
+# medians, label codes) once; save() writes them to a JSON file; later runs
+# load that file and only transform() the new rows, so a daily load never
+# refits on the full history. state_path() keeps that file next to the data.
+#
+# The same Step classes run chunk by chunk in Suryesh_NetflixCleaner's
+# CleaningPipeline, which cleans CSV files larger than memory in two passes.
+
+import json
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+
+def _plain(value):
+    """numpy scalars -> plain Python values, so fitted state can be written as JSON."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def state_path(data_path, name):
+    """
+    Where a script keeps its fitted state: next to the data file, named after
+    it, e.g. data/netflix_titles.csv -> data/netflix_titles.<name>.json.
+    Each dataset gets its own state, whatever folder the script is run from.
+    """
+    folder, filename = os.path.split(data_path)
+    return os.path.join(folder, f"{os.path.splitext(filename)[0]}.{name}.json")
+
+
+class Step:
+    """
+    One cleaning step. Statistics (modes, medians) are collected by observe()
+    and turned into fill values by finish(); fit() does both on one frame.
+    A chunked pipeline calls observe() once per chunk instead, so the same
+    steps clean files larger than memory (see Suryesh_NetflixCleaner/netflix_pipeline.py).
+
+    transform() may change the frame it is given in place; Pipeline hands it a copy.
+    """
+
+    # Cheap, stateless steps also run in pass one of a chunked pipeline, so
+    # later steps observe values as they will look when pass two reaches them
+    in_first_pass = True
+
+    def observe(self, df):
+        pass
+
+    def finish(self):
+        pass
+
+    def fit(self, df):
+        self.observe(df)
+        self.finish()
+        return self
+
+    def transform(self, df):
+        return df
+
+    def get_state(self):
+        """Everything fit() learned, as JSON-compatible data."""
+        return {}
+
+    def set_state(self, state):
+        pass
+
+    def save_files(self, prefix):
+        """Writes state too big for the JSON file to files starting with prefix."""
+
+    def load_files(self, prefix):
+        pass
+
+    def __repr__(self):
+        return type(self).__name__
+
+
+class Impute(Step):
+    """
+    Fills missing values per column.
+    strategy: "mode", "median", "mean" (learned by fit) or "constant" (uses value).
+    Values are tallied in a Counter, so the statistics can be collected chunk by
+    chunk and memory grows with the number of distinct values, not of rows.
+    """
+
+    def __init__(self, columns, strategy="mode", value=None):
+        if strategy not in ("mode", "median", "mean", "constant"):
+            raise ValueError(f"Unknown impute strategy: {strategy}")
+        self.columns = columns
+        self.strategy = strategy
+        self.fill_values = {col: value for col in columns} if strategy == "constant" else {}
+        self.in_first_pass = strategy == "constant"
+        self.counts = {col: Counter() for col in columns}
+
+    def observe(self, df):
+        if self.strategy == "constant":
+            return
+        for col in self.columns:
+            values = df[col] if self.strategy == "mode" else pd.to_numeric(df[col], errors="coerce")
+            self.counts[col].update(values.value_counts().to_dict())
+
+    def finish(self):
+        for col, counts in self.counts.items():
+            if counts:
+                self.fill_values[col] = _plain(self._statistic(counts))
+        self.counts = {col: Counter() for col in self.columns}
+
+    def _statistic(self, counts):
+        if self.strategy == "mode":
+            # Ties go to the smallest value, as DataFrame.mode()[0] does
+            top = max(counts.values())
+            return min(v for v, n in counts.items() if n == top)
+        total = sum(counts.values())
+        if self.strategy == "mean":
+            return sum(v * n for v, n in counts.items()) / total
+        # The middle one or two values of the sorted column, found by walking the tallies
+        lower_rank, upper_rank = (total - 1) // 2, total // 2
+        seen, lower = 0, None
+        for value in sorted(counts):
+            seen += counts[value]
+            if lower is None and seen > lower_rank:
+                lower = value
+            if seen > upper_rank:
+                return (lower + value) / 2
+
+    def transform(self, df):
+        return df.fillna(self.fill_values)
+
+    def get_state(self):
+        return {"fill_values": self.fill_values}
+
+    def set_state(self, state):
+        self.fill_values = state["fill_values"]
+
+    def __repr__(self):
+        return f"Impute({self.strategy})"
+
+
+class DropMissing(Step):
+    """Drops rows missing any of columns (any column when columns is None)."""
+
+    def __init__(self, columns=None):
+        self.columns = columns
+
+    def transform(self, df):
+        return df.dropna(subset=self.columns)
+
+
+class Dedupe(Step):
+    """
+    Drops duplicate rows (or rows with a repeated key column).
+
+    Only a 64-bit hash per distinct row is kept (8 bytes/row), in a few sorted
+    numpy arrays that are merged as they grow, like a log-structured index.
+    Rows are dropped if seen in this batch or chunk or an earlier one since
+    the step was last fitted.
+
+    With remember=True the hashes of the last capacity distinct rows are also
+    saved next to the pipeline's state file, so a daily load drops rows that
+    arrived on an earlier day. The file is a fixed-size ring (8 bytes per
+    slot) in which new hashes overwrite the oldest ones, so it never grows.
+    """
+    in_first_pass = False
+
+    def __init__(self, key=None, remember=False, capacity=1 << 20):
+        self.key = key
+        self.remember = remember
+        self.capacity = capacity
+        self.levels = []
+        self.recent = np.zeros(capacity if remember else 0, dtype=np.uint64)  # 0 = empty slot
+        self.next = 0  # ring slot the next hash goes to
+        self.remembered = self.recent[:0]  # sorted hashes loaded from the last run
+
+    def _hashes(self, df):
+        rows = df[self.key] if self.key is not None else df
+        return np.maximum(pd.util.hash_pandas_object(rows, index=False).to_numpy(), 1)
+
+    def _seen(self, hashes):
+        seen = np.zeros(len(hashes), dtype=bool)
+        for level in self.levels + [self.remembered]:
+            if len(level):
+                pos = np.minimum(np.searchsorted(level, hashes), len(level) - 1)
+                seen |= level[pos] == hashes
+        return seen
+
+    def _remember(self, hashes):
+        hashes = hashes[-self.capacity:]
+        self.recent[(self.next + np.arange(len(hashes))) % self.capacity] = hashes
+        self.next = (self.next + len(hashes)) % self.capacity
+
+    def finish(self):
+        self.levels = []
+
+    def transform(self, df):
+        hashes = self._hashes(df)
+        unique, first = np.unique(hashes, return_index=True)
+        fresh = ~self._seen(unique)
+        keep = np.zeros(len(df), dtype=bool)
+        keep[first[fresh]] = True
+
+        if fresh.any():
+            self.levels.append(unique[fresh])
+            if self.remember:
+                # In row order, so the ring drops the rows that arrived first
+                self._remember(hashes[np.sort(first[fresh])])
+        while len(self.levels) > 1 and len(self.levels[-2]) <= 2 * len(self.levels[-1]):
+            newer, older = self.levels.pop(), self.levels.pop()
+            self.levels.append(np.union1d(older, newer))
+        return df[keep]
+
+    def get_state(self):
+        return {"next": self.next} if self.remember else {}
+
+    def set_state(self, state):
+        self.next = state.get("next", 0)
+
+    def save_files(self, prefix):
+        if not self.remember:
+            return
+        path = prefix + ".hashes.npy"
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as file:
+            np.save(file, self.recent)
+        os.replace(temp_path, path)
+
+    def load_files(self, prefix):
+        path = prefix + ".hashes.npy"
+        if not self.remember or not os.path.exists(path):
+            return
+        saved = np.load(path)
+        if len(saved) != self.capacity:
+            # Saved with another capacity: keep the newest hashes that fit
+            oldest_first = np.roll(saved, -self.next)
+            self.recent[:] = 0
+            self.next = 0
+            self._remember(oldest_first[oldest_first != 0])
+        else:
+            self.recent = saved
+        self.remembered = np.sort(self.recent[self.recent != 0])
+
+
+class ParseDates(Step):
+    """Converts text columns to datetime; unparseable values become NaT."""
+
+    def __init__(self, columns, date_format=None, strip=True):
+        self.columns = columns
+        self.date_format = date_format
+        self.strip = strip
+
+    def transform(self, df):
+        for col in self.columns:
+            values = df[col]
+            if self.strip and pd.api.types.is_string_dtype(values):
+                values = values.str.strip()
+            df[col] = pd.to_datetime(values, format=self.date_format, errors="coerce")
+        return df
+
+
+class Encode(Step):
+    """
+    Label-encodes columns with codes learned by fit (sorted, like LabelEncoder).
+
+    Categories first seen in a later batch get the next free code and are
+    added to the state, so codes already handed out never change.
+    suffix="" replaces the column; otherwise codes go in <column><suffix>.
+    """
+
+    def __init__(self, columns, suffix="_encoded"):
+        self.columns = columns
+        self.suffix = suffix
+        self.classes = {}  # column -> list of categories; the code is the list position
+
+    def fit(self, df):
+        for col in self.columns:
+            self.classes[col] = sorted(str(v) for v in df[col].dropna().unique())
+        return self
+
+    def transform(self, df):
+        for col in self.columns:
+            classes = self.classes.setdefault(col, [])
+            values = df[col].astype(str).where(df[col].notna())
+            new = sorted(set(values.dropna().unique()) - set(classes))
+            classes.extend(new)
+            codes = pd.Series(range(len(classes)), index=classes)
+            df[col + self.suffix] = values.map(codes).fillna(-1).astype(int)
+        return df
+
+    def get_state(self):
+        return {"classes": self.classes}
+
+    def set_state(self, state):
+        self.classes = state["classes"]
+
+
+class Derive(Step):
+    """Adds column name computed by func(df); stateless, so nothing is saved for it."""
+
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+
+    def transform(self, df):
+        df[self.name] = self.func(df)
+        return df
+
+    def __repr__(self):
+        return f"Derive({self.name})"
+
+
+class Pipeline:
+    """
+    Runs steps in order. fit_transform() fits each step on the output of the
+    steps before it; transform() reuses what was learned.
+
+    process(df) is the usual entry point: with a state file it loads the
+    fitted statistics and only transforms df (then saves any new categories
+    or remembered keys); without one it fits on df and writes the file.
+    df itself is never changed; the steps work on a copy.
+    """
+
+    def __init__(self, steps, state_path=None):
+        self.steps = steps
+        self.state_path = state_path
+        self.fitted = False
+
+    def fit_transform(self, df):
+        df = df.copy()
+        for step in self.steps:
+            df = step.fit(df).transform(df)
+        self.fitted = True
+        return df
+
+    def fit(self, df):
+        self.fit_transform(df)
+        return self
+
+    def transform(self, df):
+        if not self.fitted:
+            raise RuntimeError("Pipeline is not fitted; call fit() or load() first.")
+        df = df.copy()
+        for step in self.steps:
+            df = step.transform(df)
+        return df
+
+    @staticmethod
+    def _file_prefix(path, index):
+        """Step index's own files sit next to the state file: <state>.<index>.*"""
+        return f"{os.path.splitext(path)[0]}.{index}"
+
+    def save(self, path=None):
+        path = path or self.state_path
+        for index, step in enumerate(self.steps):
+            step.save_files(self._file_prefix(path, index))
+        state = {"steps": [{"step": type(step).__name__, "state": step.get_state()}
+                           for step in self.steps]}
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(state, file, indent=2, default=_plain)
+        os.replace(temp_path, path)
+
+    def load(self, path=None):
+        path = path or self.state_path
+        with open(path, "r") as file:
+            saved = json.load(file)["steps"]
+        names = [type(step).__name__ for step in self.steps]
+        if [entry["step"] for entry in saved] != names:
+            raise ValueError(f"{path} was saved by a different pipeline ({len(saved)} steps); "
+                             "delete it to refit.")
+        for index, (step, entry) in enumerate(zip(self.steps, saved)):
+            step.set_state(entry["state"])
+            step.load_files(self._file_prefix(path, index))
+        self.fitted = True
+        return self
+
+    def process(self, df, refit=False):
+        if self.state_path and os.path.exists(self.state_path) and not refit:
+            self.load()
+            df = self.transform(df)
+        else:
+            df = self.fit_transform(df)
+        if self.state_path:
+            self.save()
+        return df
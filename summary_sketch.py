@@ -0,0 +1,358 @@
+# summary_sketch.py
+#
+# describe(include='all') for the dashboards without rescanning the data
+# (Suryesh_CleanDashboard, NDV_Code_By_KeerthipriyaT_DataVisualization).
+#
+# The rows are split once into partitions (one per team, per country, ...) and
+# every column of every partition gets a small sketch:
+#   ▶ Moments      count, mean, variance (Welford), min and max
+#   ▶ TDigest      quantiles (25%, 50%, 75%) from at most ~compression/2 centroids
+#   ▶ HyperLogLog  distinct count ("unique") from 2**p one-byte registers
+#   ▶ TopK         the most frequent values ("top", "freq")
+# All four merge, so a filter that selects several partitions is answered by
+# merging their sketches; the whole dataset has its own sketches, built in the
+# same pass. Answers are kept per filter, so a rerun with the same filter costs
+# a dict lookup. Small partitions stay exact; big ones are approximate:
+# quantiles to under 1% of rank, distinct counts to about 0.8% past 1,024
+# values, and top values are exact unless the value is rare in every partition.
+
+import math
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+import pandas as pd
+
+PERCENTILES = {"25%": 0.25, "50%": 0.5, "75%": 0.75}
+
+
+class Moments:
+    """Count, mean, sum of squared deviations (M2), min and max of the non-missing values."""
+
+    def __init__(self, count=0, mean=0.0, m2=0.0, low=np.inf, high=-np.inf):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.low = low
+        self.high = high
+
+    @classmethod
+    def from_values(cls, values):
+        if not len(values):
+            return cls()
+        mean = values.mean()
+        # .item() keeps int64 nanoseconds as exact ints; float64 would round them to ~256 ns
+        return cls(len(values), float(mean), float(((values - mean) ** 2).sum()),
+                   values.min().item(), values.max().item())
+
+    def merge(self, other):
+        """Chan et al.'s pairwise form of Welford's update."""
+        if not other.count:
+            return self
+        if not self.count:
+            return Moments(other.count, other.mean, other.m2, other.low, other.high)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return Moments(count, self.mean + delta * other.count / count,
+                       self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+                       min(self.low, other.low), max(self.high, other.high))
+
+    def std(self):
+        """Sample standard deviation (ddof=1), like DataFrame.describe()."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+
+class TDigest:
+    """
+    Merging t-digest: centroids (mean, weight) sorted by mean. Centroids near the
+    tails hold few points and the middle ones many (k1 scale function), so
+    extreme quantiles stay accurate. Up to about compression / pi points every
+    value is its own centroid and quantiles are exact.
+    """
+
+    def __init__(self, means=None, weights=None, compression=1000):
+        self.means = np.empty(0) if means is None else means
+        self.weights = np.empty(0) if weights is None else weights
+        self.compression = compression
+
+    @classmethod
+    def from_values(cls, values, compression=1000):
+        values = np.sort(values)
+        return cls(values, np.ones(len(values)), compression)._compress()
+
+    def _compress(self):
+        total = self.weights.sum()
+        if not len(self.means):
+            return self
+        order = np.argsort(self.means, kind="stable")
+        means, weights = self.means[order], self.weights[order]
+        middle = (np.cumsum(weights) - weights / 2) / total
+        # Neighbours whose k1 scale value falls in the same unit step share a centroid
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * middle - 1)
+        group = np.floor(k - k.min()).astype(np.int64)
+        _, start = np.unique(group, return_index=True)
+        merged = np.add.reduceat(weights, start)
+        self.means = np.add.reduceat(means * weights, start) / merged
+        self.weights = merged
+        return self
+
+    def merge(self, *others):
+        digests = (self,) + others
+        return TDigest(np.concatenate([digest.means for digest in digests]),
+                       np.concatenate([digest.weights for digest in digests]), self.compression)._compress()
+
+    def quantile(self, q, low, high):
+        """Linear interpolation between centroid midpoints, clamped to the exact min and max."""
+        total = self.weights.sum()
+        if not total:
+            return np.nan
+        middle = np.cumsum(self.weights) - self.weights / 2
+        positions = np.r_[0.0, middle, total]
+        means = np.r_[low, self.means, high]
+        # q * (n - 1) + 0.5 lands on the singleton centroids exactly, as Series.quantile() does
+        return float(np.interp(q * (total - 1) + 0.5, positions, means))
+
+
+class HyperLogLog:
+    """
+    Distinct count from 64-bit hashes: 2**p registers, each the longest run of
+    leading zeros seen. Up to exact_limit distinct hashes it keeps the hashes
+    themselves instead (HLL++'s sparse mode), so small partitions and merges of
+    them get exact counts.
+    """
+
+    def __init__(self, registers=None, exact=None, p=14, exact_limit=1024):
+        self.p = p
+        self.exact_limit = exact_limit
+        self.exact = np.empty(0, dtype=np.uint64) if registers is None and exact is None else exact
+        self.registers = registers
+        if self.exact is not None and len(self.exact) > exact_limit:
+            self.registers, self.exact = self._registers(), None
+
+    @classmethod
+    def from_hashes(cls, hashes, p=14, exact_limit=1024):
+        return cls(exact=np.unique(hashes), p=p, exact_limit=exact_limit)
+
+    def _registers(self):
+        if self.registers is not None:
+            return self.registers
+        registers = np.zeros(1 << self.p, dtype=np.uint8)
+        index = (self.exact >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = (self.exact & np.uint64((1 << (64 - self.p)) - 1)).astype(float)  # < 2**52, so exact
+        rank = (64 - self.p) - np.frexp(rest)[1] + 1  # leading zeros of the remaining bits, plus one
+        np.maximum.at(registers, index, rank.astype(np.uint8))
+        return registers
+
+    def merge(self, *others):
+        sketches = (self,) + others
+        if all(sketch.exact is not None for sketch in sketches):
+            return HyperLogLog(exact=np.unique(np.concatenate([sketch.exact for sketch in sketches])),
+                               p=self.p, exact_limit=self.exact_limit)
+        registers = np.maximum.reduce([sketch._registers() for sketch in sketches])
+        return HyperLogLog(registers, p=self.p, exact_limit=self.exact_limit)
+
+    def estimate(self):
+        if self.exact is not None:
+            return len(self.exact)
+        m = len(self.registers)
+        raw = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        empty = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and empty:
+            return int(round(m * math.log(m / empty)))  # linear counting for small cardinalities
+        return int(round(raw))
+
+
+class TopK:
+    """
+    The capacity most frequent values with their counts. Merging adds the counts
+    and keeps the top again; a value cut from one partition loses those counts,
+    which only matters for values that are rare in every partition.
+    """
+
+    def __init__(self, counts=None, capacity=32):
+        self.counts = counts or Counter()
+        self.capacity = capacity
+
+    @classmethod
+    def from_values(cls, values, capacity=32):
+        counts = pd.Series(values).value_counts(sort=True).head(capacity)
+        return cls(Counter(dict(zip(counts.index, counts.to_numpy().tolist()))), capacity)
+
+    def merge(self, *others):
+        counts = Counter(self.counts)
+        for other in others:
+            counts.update(other.counts)
+        return TopK(Counter(dict(counts.most_common(self.capacity))), self.capacity)
+
+    def most_common(self):
+        return self.counts.most_common(1)[0] if self.counts else (np.nan, np.nan)
+
+
+class ColumnSketch:
+    """
+    Sketches of one column in one partition. kind is "numeric" (moments and
+    quantiles), "datetime" (the same on nanoseconds) or "text" (distinct count
+    and top values; also used for bool and category columns, as describe() does).
+    """
+
+    def __init__(self, kind, count, moments=None, digest=None, distinct=None, top=None):
+        self.kind = kind
+        self.count = count
+        self.moments = moments
+        self.digest = digest
+        self.distinct = distinct
+        self.top = top
+
+    @classmethod
+    def build(cls, kind, values, hashes, compression=1000):
+        """
+        values: the column's non-missing values (float for numeric, int64
+        nanoseconds for datetime);
+        hashes: their 64-bit hashes; compression: the t-digest's.
+        """
+        if kind == "text":
+            return cls(kind, len(values), distinct=HyperLogLog.from_hashes(hashes), top=TopK.from_values(values))
+        return cls(kind, len(values), Moments.from_values(values), TDigest.from_values(values, compression))
+
+    def merge(self, *others):
+        """One sketch for the union of the partitions; each kind of sketch is merged in a single pass."""
+        count = self.count + sum(other.count for other in others)
+        if self.kind == "text":
+            return ColumnSketch(self.kind, count, distinct=self.distinct.merge(*(other.distinct for other in others)),
+                                top=self.top.merge(*(other.top for other in others)))
+        moments = self.moments
+        for other in others:
+            moments = moments.merge(other.moments)
+        return ColumnSketch(self.kind, count, moments, self.digest.merge(*(other.digest for other in others)))
+
+    def describe(self):
+        """The column's describe() entries as a dict (row name -> value)."""
+        if self.kind == "text":
+            top, freq = self.top.most_common()
+            return {"count": self.count, "unique": self.distinct.estimate(), "top": top, "freq": freq}
+        moments = self.moments
+        stats = {"count": self.count, "mean": moments.mean if moments.count else np.nan}
+        if self.kind == "numeric":
+            stats["std"] = moments.std()
+        stats["min"] = moments.low if moments.count else np.nan
+        for name, q in PERCENTILES.items():
+            stats[name] = self.digest.quantile(q, moments.low, moments.high)
+        stats["max"] = moments.high if moments.count else np.nan
+        if self.kind == "datetime":
+            # describe() gives datetime columns no std
+            return {name: value if name == "count" else pd.Timestamp(int(round(value))) if value == value else pd.NaT
+                    for name, value in stats.items()}
+        return stats
+
+
+def _kind(values):
+    if pd.api.types.is_bool_dtype(values) or not (pd.api.types.is_numeric_dtype(values)
+                                                 or pd.api.types.is_datetime64_any_dtype(values)):
+        return "text"
+    return "datetime" if pd.api.types.is_datetime64_any_dtype(values) else "numeric"
+
+
+class SketchSummary:
+    """
+    Per-partition column sketches of df, built once. by names the column(s) a
+    dashboard filters on; each distinct value (or combination) is a partition.
+
+    describe(where) returns what df[filter].describe(include='all') would, for
+    filters of the form {column in by: value or list of values}, by merging the
+    matching partitions' sketches. where=None describes the whole frame from
+    its own sketches. The last max_cached answers are kept.
+
+    compression is the partitions' t-digest size. Merging many small digests
+    keeps their accuracy, so it can be lower than the whole frame's (1000):
+    200 keeps a partition's quantile to about 0.5% of rank in ~1.6 KB.
+    """
+
+    def __init__(self, df, by=None, columns=None, compression=200, max_cached=512):
+        self.by = [by] if isinstance(by, str) else list(by or [])
+        self.columns = list(columns or df.columns)
+        self.kinds = {col: _kind(df[col]) for col in self.columns}
+        self.rows = len(df)
+        self.max_cached = max_cached
+        self.described = OrderedDict()  # filter key -> describe() frame, least recently used first
+        self.lock = threading.Lock()  # one summary serves every Streamlit session thread
+
+        if self.by:
+            groups = df.groupby(self.by, observed=True, sort=False, dropna=False).indices
+            groups = {key if isinstance(key, tuple) else (key,): rows for key, rows in groups.items()}
+        else:
+            groups = {(): np.arange(len(df))}
+        self.partitions = {key: {} for key in groups}
+        self.whole = {}
+        for col in self.columns:
+            # Each column is converted and hashed once; partitions take their rows from it
+            present = df[col].notna().to_numpy()
+            if self.kinds[col] == "text":
+                values = df[col].to_numpy(dtype=object)
+                hashes = pd.util.hash_pandas_object(df[col], index=False).to_numpy()
+            elif self.kinds[col] == "datetime":
+                values = df[col].dt.as_unit("ns").astype("int64").to_numpy()  # NaT rows are dropped below
+                hashes = None
+            else:
+                values = df[col].to_numpy(dtype=float, na_value=np.nan)
+                hashes = None
+            self.whole[col] = ColumnSketch.build(self.kinds[col], values[present],
+                                                 None if hashes is None else hashes[present])
+            if not self.by:
+                continue
+            for key, rows in groups.items():
+                rows = rows[present[rows]]
+                self.partitions[key][col] = ColumnSketch.build(
+                    self.kinds[col], values[rows], None if hashes is None else hashes[rows], compression)
+        if not self.by:
+            self.partitions = {(): self.whole}
+
+    def keys(self, where=None):
+        """Partition keys matching where (all of them for None)."""
+        if not where:
+            return list(self.partitions)
+        unknown = set(where) - set(self.by)
+        if unknown:
+            raise ValueError(f"Can only filter on {', '.join(self.by) or 'nothing'}, not {', '.join(sorted(unknown))}")
+        wanted = {}
+        for col, value in where.items():
+            wanted[self.by.index(col)] = set(value) if isinstance(value, (list, tuple, set)) else {value}
+        return [key for key in self.partitions if all(key[pos] in values for pos, values in wanted.items())]
+
+    def merged(self, where=None):
+        """column -> ColumnSketch over the rows matching where."""
+        if not where:
+            return self.whole
+        keys = self.keys(where)
+        sketches = {}
+        for col in self.columns:
+            parts = [self.partitions[key][col] for key in keys]
+            if not parts:
+                empty = np.empty(0, dtype=object if self.kinds[col] == "text" else float)
+                parts = [ColumnSketch.build(self.kinds[col], empty, np.empty(0, dtype=np.uint64))]
+            sketches[col] = parts[0].merge(*parts[1:])
+        return sketches
+
+    def _cache_key(self, where):
+        """The same key for filters that select the same partitions, e.g. ["a", "b"] and ("b", "a")."""
+        key = []
+        for col, value in sorted((where or {}).items()):
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            key.append((col, frozenset(values)))
+        return tuple(key)
+
+    def describe(self, where=None):
+        key = self._cache_key(where)
+        with self.lock:
+            if key in self.described:
+                self.described.move_to_end(key)
+                return self.described[key].copy()
+        stats = {col: sketch.describe() for col, sketch in self.merged(where).items()}
+        # Row order as describe(include='all') builds it: text rows, then datetime, then numeric
+        rows = list(dict.fromkeys(row for column in sorted(stats.values(), key=len) for row in column))
+        frame = pd.DataFrame(stats, index=rows, columns=self.columns)
+        with self.lock:
+            self.described[key] = frame
+            self.described.move_to_end(key)
+            if len(self.described) > self.max_cached:
+                self.described.popitem(last=False)
+        return frame.copy()